@@ -0,0 +1,90 @@
+"""
+Compares the precompiled KeywordMatcher against the per-keyword regex
+functions it replaced (utils.match_words / contains_whole_word).
+
+Run from the repo root: python -m benchmarks.bench_matcher
+"""
+
+import random
+import timeit
+
+from job_hunter.config import build_config
+from job_hunter.utils.utils import contains_whole_word, match_words
+
+WORDS = (
+    "we are looking for a senior software engineer to build scalable "
+    "distributed systems with python golang kafka aws and postgresql in "
+    "bangalore india you will own services end to end mentor engineers "
+    "and work closely with product 5+ years of experience required"
+).split()
+
+
+def make_description(n_words: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def old_match_title_exclusions(title, config):
+    for key in ("exclude_titles", "blocked_locations", "exclude_keywords"):
+        for word in config[key]:
+            if contains_whole_word(title, word):
+                return word
+    return None
+
+
+def new_match_title_exclusions(title, config):
+    matchers = config["matchers"]
+    for key in ("exclude_titles", "blocked_locations", "exclude_keywords"):
+        word = matchers[key].first(title)
+        if word:
+            return word
+    return None
+
+
+def bench(label, old, new, number):
+    assert old() == new(), f"{label}: results differ"
+    old_s = timeit.timeit(old, number=number) / number
+    new_s = timeit.timeit(new, number=number) / number
+    print(
+        f"{label:<36} old {old_s * 1e3:8.3f} ms   new {new_s * 1e3:8.3f} ms   "
+        f"speedup {old_s / new_s:6.1f}x"
+    )
+
+
+def main():
+    config = build_config()
+    matchers = config["matchers"]
+    all_keywords = (
+        config["exclude_keywords"] + config["include_keywords"] + config["other_keywords"]
+    )
+    description = make_description(1500)
+    title = "senior software engineer - backend (payments)"
+
+    bench(
+        "include_keywords on description",
+        lambda: match_words(description, config["include_keywords"]),
+        lambda: matchers["include_keywords"].match_words(description),
+        number=50,
+    )
+    bench(
+        "all keywords on description",
+        lambda: match_words(description, all_keywords),
+        lambda: matchers["all_keywords"].match_words(description),
+        number=50,
+    )
+    bench(
+        "blocked_locations on description",
+        lambda: match_words(description, config["blocked_locations"]),
+        lambda: matchers["blocked_locations"].match_words(description),
+        number=20,
+    )
+    bench(
+        "title exclusions (passing title)",
+        lambda: old_match_title_exclusions(title, config),
+        lambda: new_match_title_exclusions(title, config),
+        number=500,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Micro-benchmarks of the CPU-bound stages over the fixture corpus: link
+extraction, detail parsing, the title / description / location matchers and
+YOE extraction. Times are ms per call (median of rounds), compared against
+benchmarks/baseline.json.
+
+Run from the repo root: python -m benchmarks.bench_micro [--update-baseline]
+"""
+
+import argparse
+
+from benchmarks.common import DEFAULT_TOLERANCE, compare_to_baseline, load_corpus, median_ms
+from job_hunter.config import build_config
+from job_hunter.extractor import (
+    extract_job_links,
+    extract_yoe_from_description,
+    parse_job_details,
+)
+from job_hunter.matcher import match_description, match_locations, match_title
+from job_hunter.utils.log import set_file_log_level, set_log_level
+
+BASE_URL = "https://careers.example.com/jobs/"
+
+
+def calls_for(size: int) -> int:
+    """Fewer calls per round for big pages, so every benchmark takes ~similar time."""
+    return max(1, min(200, 200_000 // max(size, 1)))
+
+
+def run_benchmarks(config) -> dict:
+    results = {}
+
+    titles = []
+    for name, html in load_corpus("listing").items():
+        titles += [job["title"] for job in extract_job_links(html, BASE_URL)]
+        results[f"extract_job_links/{name}"] = median_ms(
+            lambda: extract_job_links(html, BASE_URL), number=calls_for(len(html))
+        )
+
+    results["match_title/all_corpus_titles"] = median_ms(
+        lambda: [match_title(title, config) for title in titles], number=5
+    )
+
+    for name, html in load_corpus("detail").items():
+        details = parse_job_details(html, config)
+        description = details["description"]
+        number = calls_for(len(html))
+
+        results[f"parse_job_details/{name}"] = median_ms(
+            lambda: parse_job_details(html, config), number=number
+        )
+        results[f"match_description/{name}"] = median_ms(
+            lambda: match_description(description, config), number=number * 5
+        )
+        results[f"match_locations/{name}"] = median_ms(
+            lambda: match_locations(details, config), number=number * 5
+        )
+        results[f"extract_yoe/{name}"] = median_ms(
+            lambda: extract_yoe_from_description(description), number=number * 5
+        )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    # Measure the code, not the console
+    set_log_level("ERROR")
+    set_file_log_level("ERROR")
+
+    results = run_benchmarks(build_config())
+    print("⏱️ ms per call")
+    return compare_to_baseline(
+        "micro", results, update=args.update_baseline, tolerance=args.tolerance
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(1 if main() else 0)
@@ -0,0 +1,121 @@
+"""
+Checks that every HTML parser backend / strainer combination gives the same
+extraction results as the html.parser baseline on the fixture corpus, and
+reports parse + extract time per page.
+
+With --in-page it instead loads every corpus page into Chromium and checks
+that the in-page extractors (page_extraction) give the same links and
+details as extract_job_links / parse_job_details (needs playwright install
+chromium).
+
+Run from the repo root: python -m benchmarks.bench_parsers [--in-page]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import load_corpus
+from job_hunter.config import build_config
+from job_hunter.extractor import build_job_details, extract_job_links, parse_job_details
+from job_hunter.html_parser import PARSER_BACKENDS, set_parser_backend
+from job_hunter.page_extraction import extract_detail_in_page, extract_listing_in_page
+
+BASE_URL = "https://careers.example.com/jobs/"
+REPEAT = 5
+
+
+def normalized_details(details: dict) -> dict:
+    # Location lists are built from sets, so their order isn't meaningful
+    return {
+        key: sorted(value) if isinstance(value, list) else value
+        for key, value in details.items()
+    }
+
+
+def run(kind: str, html: str, config):
+    if kind == "listing":
+        return extract_job_links(html, BASE_URL)
+    return normalized_details(parse_job_details(html, config))
+
+
+async def check_in_page(config) -> int:
+    """Compares the in-page extractors with the Python ones on every corpus page."""
+    from playwright.async_api import async_playwright
+
+    set_parser_backend(config["html_parser"])
+
+    mismatches = 0
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        # Scripts off and no network: corpus pages are saved renders
+        context = await browser.new_context(java_script_enabled=False)
+        await context.route("**/*", lambda route: route.abort())
+        page = await context.new_page()
+        try:
+            for kind in ("listing", "detail"):
+                for name, html in load_corpus(kind).items():
+                    await page.set_content(html, wait_until="domcontentloaded")
+                    if kind == "listing":
+                        expected = extract_job_links(html, BASE_URL)
+                        result = await extract_listing_in_page(page, BASE_URL)
+                    else:
+                        expected = run(kind, html, config)
+                        extracted = await extract_detail_in_page(page)
+                        result = normalized_details(
+                            build_job_details(extracted["text"], extracted["locations"], config)
+                        )
+
+                    if result != expected:
+                        mismatches += 1
+                        print(f"❌ {kind}/{name}: in-page extraction differs")
+                    else:
+                        print(f"✅ {kind}/{name}")
+        finally:
+            await browser.close()
+
+    print("✅ in-page extraction matches" if not mismatches else f"❌ {mismatches} mismatches")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--in-page", action="store_true", help="Check the in-page extractors in Chromium"
+    )
+    args = parser.parse_args()
+
+    config = build_config()
+    if args.in_page:
+        return asyncio.run(check_in_page(config))
+
+    modes = [(backend, strainer) for backend in PARSER_BACKENDS for strainer in (False, True)]
+
+    mismatches = 0
+    for kind in ("listing", "detail"):
+        for name, html in load_corpus(kind).items():
+            set_parser_backend("html.parser", use_strainer=False)
+            expected = run(kind, html, config)
+
+            timings = []
+            for backend, strainer in modes:
+                set_parser_backend(backend, use_strainer=strainer)
+                result = run(kind, html, config)
+                if result != expected:
+                    mismatches += 1
+                    print(f"❌ {kind}/{name}: {backend} strainer={strainer} differs")
+
+                started = time.perf_counter()
+                for _ in range(REPEAT):
+                    run(kind, html, config)
+                elapsed_ms = (time.perf_counter() - started) * 1000 / REPEAT
+                timings.append(f"{backend}{'+strainer' if strainer else ''} {elapsed_ms:7.2f} ms")
+
+            print(f"{kind}/{name} ({len(html) // 1024} KB): " + " | ".join(timings))
+
+    print("✅ all backends match html.parser" if not mismatches else f"❌ {mismatches} mismatches")
+    return mismatches
+
+
+if __name__ == "__main__":
+    raise SystemExit(1 if main() else 0)
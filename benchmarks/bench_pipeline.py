@@ -0,0 +1,209 @@
+"""
+Macro benchmark: a full run_pipeline over fixture companies built from the
+corpus. Listing pages come from the corpus with their links pointed at the
+company's own host; every other path serves a detail page from the corpus.
+
+By default the run replays a crawl archive written from those pages
+(--replay: no browser, no network), so it measures extraction, matching,
+the CPU pool and the store. With --live the pages are served by local
+fixture servers instead (one port per company, so each is its own host)
+and crawled for real with the HTML cache off. The servers speak HTTPS with
+a throwaway self-signed certificate (job URLs must be https://; the
+fetchers don't verify certificates); this needs the openssl CLI and
+Chromium for the listing renders (playwright install chromium).
+
+Run from the repo root: python -m benchmarks.bench_pipeline [--companies N] [--live] [--update-baseline]
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import re
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from benchmarks.common import DEFAULT_TOLERANCE, compare_to_baseline, load_corpus
+from job_hunter.crawl_archive import CrawlArchive, page_key
+from job_hunter.extractor import extract_job_links
+from job_hunter.metrics import build_metrics_report
+from job_hunter.pipeline import run_pipeline
+
+LISTING_PATH = "/careers"
+
+# Absolute links in the corpus point at real sites; serve them locally
+_ABSOLUTE_HREF_RE = re.compile(r'href="https?://[^/"]+')
+
+
+def local_listing(listing_html: str) -> str:
+    """The corpus listing with its links pointed at the company's own host."""
+    return _ABSOLUTE_HREF_RE.sub('href="', listing_html)
+
+
+def detail_page_for(path: str, detail_pages: list):
+    """The corpus detail page served at `path` (stable per path)."""
+    return detail_pages[zlib.crc32(path.encode()) % len(detail_pages)]
+
+
+class FixtureServer:
+    """Serves one company: its listing at /careers, detail pages elsewhere."""
+
+    def __init__(self, listing_html: str, detail_pages: list[str], tls: ssl.SSLContext):
+        listing = local_listing(listing_html).encode("utf-8")
+        details = [page.encode("utf-8") for page in detail_pages]
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") == LISTING_PATH:
+                    body = listing
+                else:
+                    body = detail_page_for(self.path, details)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.socket = tls.wrap_socket(self.server.socket, server_side=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def career_url(self) -> str:
+        host, port = self.server.server_address
+        return f"https://{host}:{port}{LISTING_PATH}"
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def self_signed_tls(workdir: str) -> ssl.SSLContext:
+    cert = os.path.join(workdir, "cert.pem")
+    key = os.path.join(workdir, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1", "-subj", "/CN=127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    tls = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    tls.load_cert_chain(cert, key)
+    return tls
+
+
+def write_replay_archive(directory: str, n_companies: int) -> list[str]:
+    """
+    Writes the crawl a live run would make (listings + every detail page
+    they link to) as a crawl archive. Returns the career URLs.
+    """
+    listings = list(load_corpus("listing").values())
+    details = list(load_corpus("detail").values())
+
+    archive = CrawlArchive(directory, "record")
+    career_urls = []
+    for i in range(n_companies):
+        career_url = f"https://fixture-{i + 1}.example{LISTING_PATH}"
+        listing = local_listing(listings[i % len(listings)])
+        archive.put(page_key("listing", career_url), career_url, "listing", listing, 200)
+
+        for job in extract_job_links(listing, career_url):
+            path = urlsplit(job["link"]).path
+            detail = detail_page_for(path, details)
+            archive.put(page_key("detail", job["link"]), job["link"], "detail", detail, 200)
+        career_urls.append(career_url)
+    archive.close()
+    return career_urls
+
+
+def run_pipeline_in(workdir: str, career_urls: list[str], **kwargs) -> tuple[float, int]:
+    """Runs the pipeline over `career_urls` in `workdir`: (wall seconds, jobs written)."""
+    cwd = os.getcwd()
+    try:
+        # run_pipeline writes its side files, logs and store to the cwd
+        os.chdir(workdir)
+        with open("companies.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["company", "career_url"])
+            for i, career_url in enumerate(career_urls, start=1):
+                writer.writerow([f"Fixture {i}", career_url])
+
+        started = time.perf_counter()
+        asyncio.run(run_pipeline("companies.csv", "jobs.csv", **kwargs))
+        wall_seconds = time.perf_counter() - started
+
+        with open("jobs.csv", newline="", encoding="utf-8") as f:
+            jobs_written = sum(1 for _ in csv.DictReader(f))
+    finally:
+        os.chdir(cwd)
+    return wall_seconds, jobs_written
+
+
+def run_benchmark(n_companies: int, live: bool = False) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        if live:
+            listings = list(load_corpus("listing").values())
+            details = list(load_corpus("detail").values())
+            tls = self_signed_tls(workdir)
+            servers = [
+                FixtureServer(listings[i % len(listings)], details, tls)
+                for i in range(n_companies)
+            ]
+            for server in servers:
+                server.start()
+            try:
+                wall_seconds, jobs_written = run_pipeline_in(
+                    workdir, [server.career_url for server in servers], cache_mode="off"
+                )
+            finally:
+                for server in servers:
+                    server.stop()
+        else:
+            archive_dir = os.path.join(workdir, "archive")
+            career_urls = write_replay_archive(archive_dir, n_companies)
+            wall_seconds, jobs_written = run_pipeline_in(
+                workdir, career_urls, replay_dir=archive_dir
+            )
+
+    print(f"📄 {jobs_written} jobs written for {n_companies} companies")
+    results = {"wall_seconds": wall_seconds}
+    for stage, summary in build_metrics_report()["stages"].items():
+        results[f"{stage}_p50_ms"] = summary["p50_seconds"] * 1000
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--companies", type=int, default=8)
+    parser.add_argument(
+        "--live", action="store_true", help="Crawl local fixture servers (needs Chromium)"
+    )
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.companies, live=args.live)
+    return compare_to_baseline(
+        f"pipeline_{args.companies}_companies{'_live' if args.live else ''}",
+        results,
+        update=args.update_baseline,
+        tolerance=args.tolerance,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(1 if main() else 0)
@@ -0,0 +1,76 @@
+"""Corpus loading, timing and baseline comparison shared by the benchmarks."""
+
+import json
+import os
+import statistics
+import timeit
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# A result counts as a regression when it is this much slower than baseline
+DEFAULT_TOLERANCE = 0.25
+
+
+def load_corpus(kind: str) -> dict:
+    directory = os.path.join(CORPUS_DIR, kind)
+    pages = {}
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            pages[name] = f.read()
+    return pages
+
+
+def median_ms(fn, number: int, repeat: int = 5) -> float:
+    """Median over `repeat` rounds of the average time of one call, in ms."""
+    rounds = timeit.repeat(fn, number=number, repeat=repeat)
+    return statistics.median(rounds) / number * 1000
+
+
+def load_baseline() -> dict:
+    try:
+        with open(BASELINE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def compare_to_baseline(
+    section: str, results: dict, update: bool = False, tolerance: float = DEFAULT_TOLERANCE
+) -> int:
+    """
+    Prints `results` ({name: value}, lower is better) next to the baseline's
+    `section`, and returns how many regressed by more than `tolerance`.
+    With `update`, the section is replaced by `results` instead.
+
+    Baselines are machine specific: refresh them on the machine that runs
+    the comparison.
+    """
+    baseline = load_baseline()
+    expected = baseline.get(section, {})
+
+    regressions = 0
+    for name, value in results.items():
+        before = expected.get(name)
+        if before is None:
+            print(f"   {name:<52} {value:10.3f}   (no baseline)")
+            continue
+        change = (value - before) / before if before else 0.0
+        regressed = change > tolerance
+        regressions += regressed
+        print(
+            f"{'❌' if regressed else '  '} {name:<52} {value:10.3f}   "
+            f"baseline {before:10.3f}   {change:+7.1%}"
+        )
+
+    if update:
+        baseline[section] = {name: round(value, 4) for name, value in results.items()}
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"📝 Baseline '{section}' updated in {BASELINE_PATH}")
+        return 0
+
+    if regressions:
+        print(f"❌ {regressions} regressions over {tolerance:.0%} against the baseline")
+    return regressions
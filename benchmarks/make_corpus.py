@@ -0,0 +1,181 @@
+"""
+Generates the large single-page-app fixtures of the benchmark corpus: a
+client-rendered listing with hundreds of deeply nested job cards and a big
+hydration payload, and a job detail page with the same kind of framework
+noise around a long description.
+
+The output is checked in; rerun only to change the fixtures (it is
+deterministic). Run from the repo root: python -m benchmarks.make_corpus
+"""
+
+import json
+import os
+import random
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+SEED = 2024
+
+LEVELS = ["Senior", "Senior", "Staff", "Principal", "Junior", "", "Lead"]
+ROLES = [
+    "Software Engineer",
+    "Backend Engineer",
+    "Full Stack Developer",
+    "Frontend Engineer",
+    "Data Engineer",
+    "Software Development Engineer III",
+    "QA Engineer",
+    "DevOps Engineer",
+    "Product Manager",
+    "Engineering Manager",
+]
+TEAMS = ["Payments", "Platform", "Growth", "Search", "Identity", "Core Banking", "Ads", "Risk"]
+CITIES = [
+    "Bangalore, India",
+    "Bengaluru, Karnataka",
+    "Hyderabad, India",
+    "Remote - India",
+    "Pune",
+    "London, United Kingdom",
+    "Singapore",
+    "New York, USA",
+]
+SENTENCES = [
+    "You will design, build and operate services that handle millions of requests a day.",
+    "We use Python, Go and TypeScript on AWS, with PostgreSQL, Redis and Kafka.",
+    "Experience with React or Next.js on the frontend is a plus.",
+    "You care about code quality, testing with Jest or pytest, and pragmatic design.",
+    "You will mentor engineers and work closely with product and design.",
+    "We run everything in Docker on Kubernetes, provisioned with Terraform.",
+    "Strong fundamentals in object-oriented programming and distributed systems.",
+    "Familiarity with GraphQL and gRPC APIs is a bonus.",
+    "Our teams work from offices in Bangalore and Hyderabad and remotely across India.",
+    "Benefits include health insurance, learning budget and flexible hours.",
+]
+UTILITY_CLASSES = [
+    "flex", "items-center", "justify-between", "gap-2", "px-4", "py-3", "rounded-lg",
+    "text-sm", "text-gray-600", "hover:bg-gray-50", "md:flex-row", "lg:px-8", "w-full",
+]
+
+
+def _classes(rng: random.Random) -> str:
+    return " ".join(rng.sample(UTILITY_CLASSES, 4)) + f" css-{rng.randrange(16**6):06x}"
+
+
+def _wrap(rng: random.Random, inner: str, depth: int) -> str:
+    for _ in range(depth):
+        inner = f'<div class="{_classes(rng)}">{inner}</div>'
+    return inner
+
+
+def _icon(rng: random.Random) -> str:
+    points = " ".join(f"{rng.randrange(24)},{rng.randrange(24)}" for _ in range(12))
+    return f'<svg viewBox="0 0 24 24" aria-hidden="true"><polyline points="{points}"></polyline></svg>'
+
+
+def _job(rng: random.Random, job_id: int) -> dict:
+    title = " ".join(
+        part for part in (rng.choice(LEVELS), rng.choice(ROLES), "-", rng.choice(TEAMS)) if part
+    )
+    return {
+        "id": job_id,
+        "title": title,
+        "slug": f"{job_id}-{title.lower().replace(' ', '-')}",
+        "location": rng.choice(CITIES),
+        "department": "Engineering",
+        "employmentType": "FULL_TIME",
+        "description": " ".join(rng.choice(SENTENCES) for _ in range(12)),
+    }
+
+
+def _head(rng: random.Random, title: str) -> str:
+    chunks = "".join(
+        f'<link rel="preload" as="script" href="/_next/static/chunks/{rng.randrange(16**8):08x}.js">'
+        for _ in range(40)
+    )
+    styles = "".join(
+        f".css-{rng.randrange(16**6):06x}{{display:flex;padding:{rng.randrange(32)}px}}"
+        for _ in range(600)
+    )
+    return (
+        f'<head><meta charset="utf-8"><title>{title}</title>{chunks}'
+        f'<style data-emotion="css">{styles}</style></head>'
+    )
+
+
+def _nav(rng: random.Random) -> str:
+    links = "".join(
+        f'<li><a class="{_classes(rng)}" href="/{word.lower()}">{word}</a></li>'
+        for word in ["Product", "Customers", "Pricing", "Blog", "About", "Careers", "Contact"] * 6
+    )
+    return f'<header class="{_classes(rng)}"><nav><ul>{links}</ul></nav></header>'
+
+
+def _footer(rng: random.Random) -> str:
+    links = "".join(
+        f'<a class="{_classes(rng)}" href="/legal/{i}">Legal notice {i}</a>' for i in range(120)
+    )
+    return f'<footer class="site-footer">{_wrap(rng, links, 3)}</footer>'
+
+
+def make_spa_listing(rng: random.Random) -> str:
+    jobs = [_job(rng, 40000 + i) for i in range(300)]
+
+    cards = []
+    for job in jobs:
+        title = f'<h3 class="{_classes(rng)}"><span>{job["title"]}</span></h3>'
+        meta = f'<p class="location {_classes(rng)}">{_icon(rng)}{job["location"]}</p>'
+        link = f'<a class="{_classes(rng)}" href="/careers/jobs/{job["slug"]}">Apply</a>'
+        cards.append(_wrap(rng, _wrap(rng, title, 3) + meta + link, 4))
+
+    next_data = json.dumps({"props": {"pageProps": {"jobs": jobs}}, "page": "/careers"})
+    body = (
+        f"<body>{_nav(rng)}"
+        f'<div id="__next">{_wrap(rng, "".join(cards), 6)}</div>'
+        f"{_footer(rng)}"
+        f'<script id="__NEXT_DATA__" type="application/json">{next_data}</script>'
+        "</body>"
+    )
+    return f"<!DOCTYPE html><html>{_head(rng, 'Careers')}{body}</html>"
+
+
+def make_spa_detail(rng: random.Random) -> str:
+    job = _job(rng, 51234)
+    paragraphs = "".join(
+        _wrap(rng, f"<p>{' '.join(rng.choice(SENTENCES) for _ in range(8))}</p>", 2)
+        for _ in range(120)
+    )
+    locations = "".join(
+        f'<li class="job-location {_classes(rng)}">{_icon(rng)}{city}</li>'
+        for city in ("Bangalore, India", "Remote - India", "Hyderabad, India")
+    )
+    similar = "".join(
+        f'<div class="similar-job-location">{_icon(rng)}{rng.choice(CITIES)}</div>'
+        for _ in range(30)
+    )
+    state = json.dumps({"job": job, "similar": [_job(rng, 52000 + i) for i in range(60)]})
+    body = (
+        f"<body>{_nav(rng)}"
+        f'<div id="root"><h1>Senior Software Engineer - Payments</h1>'
+        f"<ul>{locations}</ul>{paragraphs}"
+        f'<aside class="similar-jobs FooterRail">{similar}</aside></div>'
+        f"{_footer(rng)}"
+        f"<script>window.__APOLLO_STATE__ = {state};</script>"
+        "</body>"
+    )
+    return f"<!DOCTYPE html><html>{_head(rng, job['title'])}{body}</html>"
+
+
+def main():
+    rng = random.Random(SEED)
+    pages = {
+        os.path.join("listing", "spa_next_data.html"): make_spa_listing(rng),
+        os.path.join("detail", "spa_large.html"): make_spa_detail(rng),
+    }
+    for path, html in pages.items():
+        with open(os.path.join(CORPUS_DIR, path), "w", encoding="utf-8") as f:
+            f.write(html)
+        print(f"📝 {path}: {len(html) // 1024} KB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+from job_hunter.adapters.registry import get_adapter, register_adapter
+
+# Importing the adapter modules registers them
+from job_hunter.adapters import lever, greenhouse, ashby, workday  # noqa: F401
@@ -0,0 +1,61 @@
+from urllib.parse import urlparse, parse_qs
+
+from job_hunter.adapters.common import build_job, html_to_text
+from job_hunter.adapters.registry import register_adapter
+from job_hunter.http_fetcher import fetch_json
+from job_hunter.utils.log import log
+
+API_BASE = "https://api.ashbyhq.com/posting-api/job-board"
+
+
+@register_adapter("ashby", lambda host: host == "jobs.ashbyhq.com")
+async def fetch_ashby_jobs(career_url: str, title_filter=None, api_base: str = API_BASE):
+    """`api_base` overrides the job board API (e.g. a local server with recorded responses)."""
+    parsed = urlparse(career_url)
+    board = parsed.path.strip("/").split("/")[0]
+    if not board:
+        return [], "Could not find Ashby board name in career URL"
+
+    data, error = await fetch_json(
+        f"{api_base}/{board}", params={"includeCompensation": "false"}
+    )
+    if error:
+        return [], error
+    if not isinstance(data, dict):
+        return [], "Unexpected Ashby API response"
+
+    # NOTE: departmentId/locationId filters are internal ids the public API
+    # doesn't expose, so only employmentType is applied here. Title and
+    # location matchers still run on every job.
+    query = parse_qs(parsed.query)
+    wanted_types = set(query.get("employmentType", []))
+
+    jobs = []
+    for posting in data.get("jobs") or []:
+        if posting.get("isListed") is False:
+            continue
+        if wanted_types and posting.get("employmentType") not in wanted_types:
+            continue
+
+        locations = [posting.get("location")] + [
+            loc.get("location") for loc in posting.get("secondaryLocations") or []
+        ]
+        if posting.get("isRemote"):
+            locations.append("Remote")
+
+        jobs.append(
+            build_job(
+                posting.get("title"),
+                posting.get("jobUrl"),
+                [
+                    posting.get("title"),
+                    ", ".join(loc for loc in locations if loc),
+                    posting.get("descriptionPlain")
+                    or html_to_text(posting.get("descriptionHtml")),
+                ],
+                locations,
+            )
+        )
+
+    log(f"📦 Ashby postings found: {len(jobs)}")
+    return jobs, None
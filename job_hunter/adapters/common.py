@@ -0,0 +1,29 @@
+import html as html_lib
+
+from bs4 import BeautifulSoup
+
+
+def html_to_text(fragment: str | None) -> str:
+    """Flattens an HTML description from an ATS API into plain text."""
+    if not fragment:
+        return ""
+
+    # Some APIs (Greenhouse) return the markup HTML-escaped
+    if "&lt;" in fragment:
+        fragment = html_lib.unescape(fragment)
+
+    soup = BeautifulSoup(fragment, "html.parser")
+    return soup.get_text(separator=" ", strip=True)
+
+
+def build_job(title, link, description_parts, locations) -> dict:
+    """
+    Job dict returned by every adapter. Same shape as `extract_job_links`
+    output, plus the description text and raw location strings.
+    """
+    return {
+        "title": (title or "").strip(),
+        "link": link,
+        "description": " ".join(part for part in description_parts if part),
+        "locations": [loc for loc in locations if loc],
+    }
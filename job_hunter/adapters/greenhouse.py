@@ -0,0 +1,85 @@
+from urllib.parse import urlparse, parse_qs
+
+from job_hunter.adapters.common import build_job, html_to_text
+from job_hunter.adapters.registry import register_adapter
+from job_hunter.http_fetcher import fetch_json
+from job_hunter.utils.log import log
+
+API_BASE = "https://boards-api.greenhouse.io/v1/boards"
+EU_API_BASE = "https://boards-api.eu.greenhouse.io/v1/boards"
+
+BOARD_HOSTS = {
+    "boards.greenhouse.io",
+    "job-boards.greenhouse.io",
+    "boards.eu.greenhouse.io",
+    "job-boards.eu.greenhouse.io",
+}
+
+
+def _board_token(parsed) -> str | None:
+    # Embedded boards: boards.greenhouse.io/embed/job_board?for=<token>
+    query = parse_qs(parsed.query)
+    if query.get("for"):
+        return query["for"][0]
+
+    segments = [s for s in parsed.path.split("/") if s]
+    if not segments or segments[0] == "embed":
+        return None
+    return segments[0]
+
+
+def _ids(values) -> set[str]:
+    return {str(v) for v in values if v}
+
+
+@register_adapter("greenhouse", lambda host: host in BOARD_HOSTS)
+async def fetch_greenhouse_jobs(
+    career_url: str, title_filter=None, api_base: str | None = None
+):
+    """`api_base` overrides the boards API (e.g. a local server with recorded responses)."""
+    parsed = urlparse(career_url)
+    token = _board_token(parsed)
+    if not token:
+        return [], "Could not find Greenhouse board token in career URL"
+
+    if api_base is None:
+        api_base = EU_API_BASE if ".eu." in parsed.netloc else API_BASE
+    data, error = await fetch_json(
+        f"{api_base}/{token}/jobs", params={"content": "true"}
+    )
+    if error:
+        return [], error
+    if not isinstance(data, dict):
+        return [], "Unexpected Greenhouse API response"
+
+    # Board filters from the career URL (departments[]=..&offices[]=..)
+    query = parse_qs(parsed.query)
+    wanted_departments = _ids(query.get("departments[]", []))
+    wanted_offices = _ids(query.get("offices[]", []))
+
+    jobs = []
+    for posting in data.get("jobs") or []:
+        departments = posting.get("departments") or []
+        offices = posting.get("offices") or []
+
+        if wanted_departments and not wanted_departments & _ids(
+            [d.get("id") for d in departments] + [d.get("parent_id") for d in departments]
+        ):
+            continue
+        if wanted_offices and not wanted_offices & _ids(
+            [o.get("id") for o in offices] + [o.get("parent_id") for o in offices]
+        ):
+            continue
+
+        location = (posting.get("location") or {}).get("name")
+        jobs.append(
+            build_job(
+                posting.get("title"),
+                posting.get("absolute_url"),
+                [posting.get("title"), location, html_to_text(posting.get("content"))],
+                [location],
+            )
+        )
+
+    log(f"📦 Greenhouse postings found: {len(jobs)}")
+    return jobs, None
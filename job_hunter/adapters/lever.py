@@ -0,0 +1,66 @@
+from urllib.parse import urlparse, parse_qsl
+
+from job_hunter.adapters.common import build_job, html_to_text
+from job_hunter.adapters.registry import register_adapter
+from job_hunter.http_fetcher import fetch_json
+from job_hunter.utils.log import log
+
+API_BASE = "https://api.lever.co/v0/postings"
+EU_API_BASE = "https://api.eu.lever.co/v0/postings"
+
+# Career page filters the postings API understands as-is
+SUPPORTED_FILTERS = {"location", "department", "team", "commitment", "level"}
+
+
+@register_adapter("lever", lambda host: host in {"jobs.lever.co", "jobs.eu.lever.co"})
+async def fetch_lever_jobs(
+    career_url: str, title_filter=None, api_base: str | None = None
+):
+    """`api_base` overrides the postings API (e.g. a local server with recorded responses)."""
+    parsed = urlparse(career_url)
+    site = parsed.path.strip("/").split("/")[0]
+    if not site:
+        return [], "Could not find Lever site name in career URL"
+
+    if api_base is None:
+        api_base = EU_API_BASE if parsed.netloc.startswith("jobs.eu.") else API_BASE
+    params = [("mode", "json")] + [
+        (key, value)
+        for key, value in parse_qsl(parsed.query)
+        if key in SUPPORTED_FILTERS
+    ]
+
+    postings, error = await fetch_json(f"{api_base}/{site}", params=params)
+    if error:
+        return [], error
+    if not isinstance(postings, list):
+        return [], "Unexpected Lever API response"
+
+    jobs = []
+    for posting in postings:
+        categories = posting.get("categories") or {}
+        locations = categories.get("allLocations") or [categories.get("location")]
+
+        description_parts = [
+            posting.get("text"),
+            ", ".join(loc for loc in locations if loc),
+            posting.get("descriptionPlain") or html_to_text(posting.get("description")),
+        ]
+        for section in posting.get("lists") or []:
+            description_parts.append(section.get("text"))
+            description_parts.append(html_to_text(section.get("content")))
+        description_parts.append(
+            posting.get("additionalPlain") or html_to_text(posting.get("additional"))
+        )
+
+        jobs.append(
+            build_job(
+                posting.get("text"),
+                posting.get("hostedUrl"),
+                description_parts,
+                locations,
+            )
+        )
+
+    log(f"📦 Lever postings found: {len(jobs)}")
+    return jobs, None
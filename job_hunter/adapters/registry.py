@@ -0,0 +1,33 @@
+from typing import Awaitable, Callable
+from urllib.parse import urlparse
+
+# adapter(career_url, title_filter) -> (jobs, error); adapters also take
+# `api_base` to point their API elsewhere (tests, recorded responses)
+Adapter = Callable[..., Awaitable[tuple[list[dict], str | None]]]
+
+_ADAPTERS: list[tuple[str, Callable[[str], bool], Adapter]] = []
+
+
+def register_adapter(name: str, matches_host: Callable[[str], bool]):
+    """
+    Registers an ATS adapter for career URLs whose host satisfies
+    `matches_host`. Adapters are tried in registration order.
+    """
+
+    def decorator(adapter: Adapter) -> Adapter:
+        _ADAPTERS.append((name, matches_host, adapter))
+        return adapter
+
+    return decorator
+
+
+def get_adapter(career_url: str) -> tuple[str, Adapter] | tuple[None, None]:
+    host = urlparse(career_url).netloc.lower().split(":")[0]
+    if not host:
+        return None, None
+
+    for name, matches_host, adapter in _ADAPTERS:
+        if matches_host(host):
+            return name, adapter
+
+    return None, None
@@ -0,0 +1,130 @@
+import asyncio
+import re
+from urllib.parse import urlparse, parse_qs
+
+from job_hunter.adapters.common import build_job, html_to_text
+from job_hunter.adapters.registry import register_adapter
+from job_hunter.http_fetcher import fetch_json
+from job_hunter.utils.log import log
+
+PAGE_SIZE = 20
+MAX_POSTINGS = 2000
+DETAIL_CONCURRENCY = 5
+
+_LOCALE_RE = re.compile(r"^[a-z]{2}-[A-Z]{2}$")
+
+
+def _parse_workday_url(parsed) -> tuple[str, str, str | None]:
+    """Returns (tenant, site, locale) for e.g. 3m.wd1.myworkdayjobs.com/en-US/Search."""
+    tenant = parsed.netloc.split(".")[0]
+    segments = [s for s in parsed.path.split("/") if s]
+
+    locale = None
+    if segments and _LOCALE_RE.match(segments[0]):
+        locale = segments.pop(0)
+
+    site = segments[0] if segments else None
+    return tenant, site, locale
+
+
+@register_adapter("workday", lambda host: host.endswith(".myworkdayjobs.com"))
+async def fetch_workday_jobs(
+    career_url: str, title_filter=None, api_base: str | None = None
+):
+    """
+    `api_base` overrides the tenant's CXS API root, normally
+    https://<tenant host>/wday/cxs (e.g. a local server with recorded responses).
+    """
+    parsed = urlparse(career_url)
+    tenant, site, locale = _parse_workday_url(parsed)
+    if not site:
+        return [], "Could not find Workday site name in career URL"
+
+    if api_base is None:
+        api_base = f"{parsed.scheme}://{parsed.netloc}/wday/cxs"
+    api_base = f"{api_base}/{tenant}/{site}"
+
+    # Career page query params are Workday search facets as-is
+    applied_facets = parse_qs(parsed.query)
+
+    postings = []
+    total = None
+    offset = 0
+    while offset < MAX_POSTINGS:
+        data, error = await fetch_json(
+            f"{api_base}/jobs",
+            method="POST",
+            json={
+                "appliedFacets": applied_facets,
+                "limit": PAGE_SIZE,
+                "offset": offset,
+                "searchText": "",
+            },
+        )
+        if not error and not isinstance(data, dict):
+            error = "Unexpected Workday API response"
+        if error:
+            if postings:
+                log(f"⚠️ Workday pagination stopped at offset {offset} — {error}")
+                break
+            return [], error
+
+        page = data.get("jobPostings") or []
+        # Workday only reports the total on the first page
+        if total is None:
+            total = data.get("total") or 0
+
+        postings.extend(page)
+        offset += PAGE_SIZE
+        if not page or offset >= total:
+            break
+
+    # 🔑 Detail calls are the expensive part; skip titles that can't match
+    if title_filter:
+        postings = [p for p in postings if title_filter(p.get("title") or "")]
+
+    semaphore = asyncio.Semaphore(DETAIL_CONCURRENCY)
+
+    failed = 0
+
+    async def fetch_detail(posting):
+        nonlocal failed
+        external_path = posting.get("externalPath")
+        if not external_path:
+            failed += 1
+            log(f"⚠️ Workday posting without a detail path skipped: {posting.get('title')}")
+            return None
+
+        async with semaphore:
+            data, error = await fetch_json(f"{api_base}{external_path}")
+        if not error and not isinstance(data, dict):
+            error = "Unexpected Workday API response"
+        if error:
+            failed += 1
+            log(f"⚠️ Workday job detail failed for {external_path} — {error}")
+            return None
+
+        info = data.get("jobPostingInfo") or {}
+        locations = [info.get("location")] + list(info.get("additionalLocations") or [])
+        link = info.get("externalUrl") or (
+            f"{parsed.scheme}://{parsed.netloc}/{locale or 'en-US'}/{site}{external_path}"
+        )
+
+        return build_job(
+            info.get("title") or posting.get("title"),
+            link,
+            [
+                info.get("title"),
+                ", ".join(loc for loc in locations if loc),
+                html_to_text(info.get("jobDescription")),
+            ],
+            locations,
+        )
+
+    details = await asyncio.gather(*(fetch_detail(p) for p in postings))
+    jobs = [job for job in details if job]
+
+    if failed:
+        log(f"⚠️ Workday job details failed for {failed} of {len(postings)} postings")
+    log(f"📦 Workday postings found: {len(jobs)} (of {total})")
+    return jobs, None
@@ -0,0 +1,204 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from playwright.async_api import async_playwright
+from job_hunter.utils.log import log
+
+
+class _PageSlot:
+    """One reusable context + page pair owned by the pool."""
+
+    def __init__(self):
+        self.context = None
+        self.page = None
+        self.navigations = 0
+        self.broken = False
+
+
+class BrowserPool:
+    """
+    Long-lived Chromium shared by all fetchers.
+
+    Keeps `size` contexts (one page each) warm and hands them out through
+    `acquire()`. A page is recycled (context closed and recreated) after
+    `max_navigations` uses, or right away if the page broke during use: an
+    exception escaped `acquire()`, or the fetcher caught a page error and
+    reported it with `mark_broken()`.
+    """
+
+    def __init__(self, size: int = 5, max_navigations: int = 50):
+        self.size = max(1, size)
+        self.max_navigations = max(1, max_navigations)
+        self._playwright = None
+        self._browser = None
+        self._slots = None
+        self._in_use: dict[int, _PageSlot] = {}  # id(page) -> slot
+        self._launch_lock = asyncio.Lock()
+
+    async def start(self):
+        self._playwright = await async_playwright().start()
+        await self._launch_browser()
+
+        self._slots = asyncio.Queue()
+        for _ in range(self.size):
+            self._slots.put_nowait(_PageSlot())
+
+        log(
+            f"🌐 Browser pool started (size={self.size}, "
+            f"max_navigations={self.max_navigations})"
+        )
+
+    async def stop(self):
+        if self._slots is not None:
+            while not self._slots.empty():
+                slot = self._slots.get_nowait()
+                await self._close_slot(slot)
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+        log("🌐 Browser pool stopped")
+
+    @asynccontextmanager
+    async def acquire(self):
+        """
+        Yields a ready-to-use page. The page goes back to the pool on exit,
+        or gets recycled if it failed or reached `max_navigations`.
+        """
+        slot = await self._slots.get()
+        healthy = False
+        try:
+            if slot.page is None or slot.page.is_closed():
+                await self._open_slot(slot)
+
+            slot.navigations += 1
+            self._in_use[id(slot.page)] = slot
+            yield slot.page
+            healthy = True
+        finally:
+            if slot.page is not None:
+                self._in_use.pop(id(slot.page), None)
+            if not healthy or slot.broken or slot.navigations >= self.max_navigations:
+                await self._close_slot(slot)
+            else:
+                await self._reset_page(slot.page)
+            self._slots.put_nowait(slot)
+
+    def mark_broken(self, page):
+        """Recycles `page` when it goes back to the pool (failed navigation, crash...)."""
+        slot = self._in_use.get(id(page))
+        if slot is not None:
+            slot.broken = True
+
+    async def _launch_browser(self):
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            self._browser = await self._playwright.chromium.launch(headless=True)
+
+    async def _open_slot(self, slot: _PageSlot):
+        await self._close_slot(slot)
+
+        # 🔑 Relaunch if Chromium crashed underneath us
+        if not self._browser.is_connected():
+            log("⚠️ Browser disconnected, relaunching")
+            await self._launch_browser()
+
+        slot.context = await self._browser.new_context(
+            bypass_csp=True,
+            ignore_https_errors=True,
+        )
+        slot.page = await slot.context.new_page()
+
+    async def _close_slot(self, slot: _PageSlot):
+        if slot.context is not None:
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+        slot.context = None
+        slot.page = None
+        slot.navigations = 0
+        slot.broken = False
+
+    async def _reset_page(self, page):
+        # Drop per-fetch state so the next user gets a clean page
+        try:
+            await page.unroute_all(behavior="ignoreErrors")
+            await page.set_extra_http_headers({})
+        except Exception:
+            pass
+
+
+# 🔑 Run-wide pool, started/stopped by the pipeline
+_pool: BrowserPool | None = None
+
+
+async def start_browser_pool(size: int = 5, max_navigations: int = 50):
+    global _pool
+    if _pool is not None:
+        return _pool
+
+    pool = BrowserPool(size=size, max_navigations=max_navigations)
+    try:
+        await pool.start()
+    except BaseException:
+        await pool.stop()
+        raise
+    _pool = pool
+    return _pool
+
+
+async def stop_browser_pool():
+    global _pool
+    if _pool is None:
+        return
+
+    pool = _pool
+    _pool = None
+    await pool.stop()
+
+
+def get_browser_pool() -> BrowserPool | None:
+    return _pool
+
+
+def mark_page_broken(page):
+    """
+    Tells the pool a page failed (navigation error, timeout, crash) and must
+    not be handed out again. No-op for one-off pages.
+    """
+    if _pool is not None:
+        _pool.mark_broken(page)
+
+
+@asynccontextmanager
+async def acquire_page():
+    """
+    Yields a page from the run-wide pool. Falls back to a one-off browser
+    when no pool is running (e.g. when a fetcher is called on its own).
+    """
+    if _pool is not None:
+        async with _pool.acquire() as page:
+            yield page
+        return
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(
+            bypass_csp=True,
+            ignore_https_errors=True,
+        )
+        try:
+            yield await context.new_page()
+        finally:
+            await context.close()
+            await browser.close()
@@ -1,6 +1,6 @@
 import argparse
 import asyncio
-from job_hunter.pipeline import run_pipeline
+from job_hunter.html_cache import CACHE_MODES
 
 
 def main():
@@ -14,9 +14,47 @@ def main():
 
     parser.add_argument("--output", default="jobs.csv", help="Output CSV file")
 
+    parser.add_argument(
+        "--cache-mode",
+        choices=CACHE_MODES,
+        default="use",
+        help="HTML cache: use cached pages, refresh them, or turn the cache off",
+    )
+
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record",
+        metavar="DIR",
+        help="Store every fetched page and API response in a crawl archive",
+    )
+    archive.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="Run offline from a crawl archive recorded with --record (no browser)",
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run: skip finished companies and checked jobs, "
+        "append to the error files",
+    )
+
     args = parser.parse_args()
 
-    asyncio.run(run_pipeline(input_file=args.input, output_file=args.output))
+    # Imported here so --help doesn't load Playwright, lxml and the adapters
+    from job_hunter.pipeline import run_pipeline
+
+    asyncio.run(
+        run_pipeline(
+            input_file=args.input,
+            output_file=args.output,
+            cache_mode=args.cache_mode,
+            record_dir=args.record,
+            replay_dir=args.replay,
+            resume=args.resume,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -1,13 +1,22 @@
-import pycountry
+import hashlib
+import json
+from collections.abc import Mapping
+from functools import cached_property
 
-OTHER_COUNTRIES = list(
-    {c.name.lower() for c in pycountry.countries if c.name.lower() != "india"}
-)
-OTHER_COUNTRIES_ALIASES = list({"usa", "u.s.", "eu", "uk", "uae"})
+from job_hunter.gazetteer import country_names
+from job_hunter.resource_policy import DEFAULT_BLOCKED_DOMAINS
+from job_hunter.matcher import compile_matchers
 
+OTHER_COUNTRIES_ALIASES = ["usa", "u.s.", "eu", "uk", "uae"]
 
-def build_config():
-    return {
+# Only looked up with `in`: frozen into (lowercased) sets instead of tuples
+SET_KEYS = ("blocked_locations", "blocked_companies")
+
+
+def build_config() -> "CompiledConfig":
+    other_countries = [name for name in country_names() if name != "india"]
+
+    config = {
         # -------------------------
         # Include keywords: Crawls job description for these keywords
         # -------------------------
@@ -141,7 +150,7 @@ def build_config():
         # -------------------------
         # Blocked locations: If any of these locations are found in job description, skip the job
         # -------------------------
-        "blocked_locations": OTHER_COUNTRIES + OTHER_COUNTRIES_ALIASES + [],
+        "blocked_locations": other_countries + OTHER_COUNTRIES_ALIASES + [],
         #
         #
         # -------------------------
@@ -172,4 +181,169 @@ def build_config():
         # Blocked companies: Skip these companies
         # -------------------------
         "blocked_companies": [],
+        #
+        #
+        # -------------------------
+        # Company concurrency: How many companies are crawled at the same time
+        # -------------------------
+        "company_concurrency": 4,
+        "job_concurrency": 64,  # job links processed at once (politeness is per host, below)
+        "job_workers_per_company": 16,  # job tasks a company keeps in flight; other links wait in its queue
+        #
+        #
+        # -------------------------
+        # Host scheduler: Per-host politeness, adapts to latency and 429/503/timeouts
+        # -------------------------
+        "host_concurrency": {"initial": 4, "min": 1, "max": 16},
+        "host_max_requests_per_second": 5,
+        "host_target_latency_seconds": {"http": 2.0, "browser": 15.0},
+        #
+        #
+        # -------------------------
+        # Retries: Transient errors (timeout, DNS, 5xx, aborted navigation) with backoff
+        # -------------------------
+        "retry_max_attempts": 3,
+        "retry_backoff_seconds": {"base": 1.0, "max": 20.0},
+        "circuit_breaker": {"failure_threshold": 5, "cooldown_seconds": 60},
+        #
+        #
+        # -------------------------
+        # Browser pool: Chromium pages shared by all fetchers during a run
+        # -------------------------
+        "browser_pool_size": 20,
+        "browser_pool_max_navigations": 50,  # recycle a page after N navigations
+        "page_ready_quiet_ms": 500,  # page counts as rendered after this long without DOM/network activity
+        "page_ready_max_ms": 10000,  # never wait longer than this for a page to settle
+        "browser_extraction": False,  # extract rendered pages in the browser, return JSON instead of HTML
+        #
+        #
+        # -------------------------
+        # ATS adapters: Read Lever/Greenhouse/Ashby/Workday boards from their JSON APIs
+        # -------------------------
+        "ats_adapters": True,
+        #
+        #
+        # -------------------------
+        # Resource policy: Requests aborted while rendering pages
+        # (listing renders keep stylesheets for the "Show more" button finder)
+        # -------------------------
+        "blocked_resource_types": ["image", "font", "media", "stylesheet"],
+        "blocked_domains": DEFAULT_BLOCKED_DOMAINS,
+        #
+        #
+        # -------------------------
+        # HTTP fast path: Try plain HTTP for job detail pages before rendering them
+        # -------------------------
+        "http_fast_path": True,
+        "http_max_connections": 50,
+        "http_timeout_seconds": 20,
+        #
+        #
+        # -------------------------
+        # Detail single-flight: Checks of a job page already in flight are shared, and
+        # finished ones are reused for a while (keyed by normalized URL)
+        # -------------------------
+        "detail_single_flight": {"max_entries": 512, "ttl_seconds": 600},
+        #
+        #
+        # -------------------------
+        # HTML parser: "lxml" (fast, C-based) or "html.parser" (pure Python)
+        # -------------------------
+        "html_parser": "lxml",
+        "html_parser_strainer": False,  # only build <title>/<body>, skip <head>
+        #
+        #
+        # -------------------------
+        # CPU pool: Worker processes for HTML parsing, matching and scoring (0 = on the event loop)
+        # -------------------------
+        "cpu_workers": 4,
+        #
+        #
+        # -------------------------
+        # Logging: Log file level and format ("text" or "json" lines); debug runs log everything
+        # -------------------------
+        "log_file_level": "INFO",
+        "log_format": "text",
+        #
+        #
+        # -------------------------
+        # Metrics: Per-stage timings (p50/p95/p99, bytes) per company and host, written at the end of a run
+        # -------------------------
+        "metrics_report": "metrics.json",
+        "metrics_prometheus": "metrics.prom",
+        #
+        #
+        # -------------------------
+        # HTML cache: Fetched pages kept on disk between runs (see --cache-mode)
+        # -------------------------
+        "cache_dir": ".cache/html",
+        "cache_ttl_hours": {
+            "listing": 6,
+            "listing_jobs": 6,
+            "detail": 7 * 24,
+            "detail_text": 7 * 24,
+        },
+        "cache_max_mb": 500,
     }
+
+    return CompiledConfig(config)
+
+
+class FrozenMapping(Mapping):
+    """Read-only dict: nested lists become tuples and nested dicts FrozenMappings."""
+
+    def __init__(self, data: Mapping):
+        self._data = {key: _freeze(value) for key, value in data.items()}
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class CompiledConfig(FrozenMapping):
+    """
+    The run's settings, frozen: SET_KEYS become frozensets, other lists
+    tuples, and the keyword lists are precompiled into config["matchers"].
+
+    `content_hash` is stable across runs and processes for the same
+    settings, so it can be part of cache keys.
+    """
+
+    def __init__(self, settings: Mapping):
+        super().__init__(settings)
+        for key in SET_KEYS:
+            self._data[key] = frozenset(value.lower() for value in self._data[key])
+
+        # 🔑 Keyword lists compiled once into single-pass matchers
+        self._data["matchers"] = compile_matchers(self)
+
+    @cached_property
+    def content_hash(self) -> str:
+        settings = {key: value for key, value in self.items() if key != "matchers"}
+        encoded = json.dumps(settings, sort_keys=True, default=_plain)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return FrozenMapping(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _plain(value):
+    """JSON encoder fallback for content_hash."""
+    if isinstance(value, (frozenset, set)):
+        return sorted(value)
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Can't hash config value: {value!r}")
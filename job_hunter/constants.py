@@ -21,3 +21,29 @@ class CompanyWithZeroLinksCSVField(str, Enum):
     S_NO = "s_no"
     COMPANY = "Company"
     CAREER_URL = "Career URL"
+
+
+# Canonical location -> spellings looked for in job descriptions
+LOCATION_ALIASES = {
+    # allowed locations
+    "bangalore": ["bangalore", "bengaluru", "blr"],
+    "remote": ["remote", "work from home", "wfh", "anywhere"],
+    "india": ["india"],
+    # other locations
+    "hyderabad": ["hyderabad", "hyd"],
+    "pune": ["pune", "poona"],
+    "chennai": ["chennai", "madras"],
+    "gurgaon": ["gurgaon", "gurugram", "ggn"],
+    "noida": ["noida"],
+    "delhi": ["delhi", "new delhi", "ncr", "delhi ncr"],
+    "mumbai": ["mumbai", "bombay"],
+    "ahmedabad": ["ahmedabad", "amdavad"],
+    "indore": ["indore"],
+    "jaipur": ["jaipur"],
+    "kochi": ["kochi", "cochin"],
+    "trivandrum": ["trivandrum", "thiruvananthapuram"],
+    "coimbatore": ["coimbatore", "kovai"],
+    "trichy": ["trichy", "tiruchirappalli"],
+    "bhubaneswar": ["bhubaneswar", "bbsr"],
+    "kolkata": ["kolkata", "calcutta"],
+}
@@ -0,0 +1,98 @@
+import asyncio
+import multiprocessing
+import multiprocessing.util
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from job_hunter.html_parser import set_parser_backend
+from job_hunter.metrics import record_stage
+from job_hunter.utils.log import configure_log, flush_log, get_log_settings, log
+
+# 🔑 Run-wide worker pool for parsing and matching, started by the pipeline
+_executor: ProcessPoolExecutor | None = None
+
+# The run's config: sent to each worker once by the initializer (and kept
+# in the main process too, for inline runs)
+_config = None
+
+
+def _init_worker(config, log_settings: dict):
+    global _config
+    _config = config
+    set_parser_backend(config["html_parser"], config["html_parser_strainer"])
+    configure_log(**log_settings)
+    # Pool workers skip atexit handlers; flush buffered log lines on exit
+    multiprocessing.util.Finalize(None, flush_log, exitpriority=10)
+
+
+def _call(fn, args, with_config: bool):
+    """(result, seconds spent in fn), timed where it runs"""
+    started = time.perf_counter()
+    result = fn(*args, _config) if with_config else fn(*args)
+    return result, time.perf_counter() - started
+
+
+def start_cpu_pool(config, workers: int):
+    """
+    Starts `workers` processes for CPU-bound stages. With 0 workers, stages
+    run inline on the event loop (the old behaviour).
+    """
+    global _executor, _config
+    _config = config
+    if workers <= 0 or _executor is not None:
+        return
+
+    # spawn, not fork: the parent runs an event loop and Playwright threads
+    _executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(config, get_log_settings()),
+    )
+    log(f"🧮 CPU pool started ({workers} workers)")
+
+
+def stop_cpu_pool():
+    global _executor
+    if _executor is None:
+        return
+
+    executor = _executor
+    _executor = None
+    executor.shutdown(wait=True, cancel_futures=True)
+    log("🧮 CPU pool stopped")
+
+
+async def run_cpu(
+    fn,
+    *args,
+    with_config: bool = False,
+    stage: str | None = None,
+    url: str | None = None,
+):
+    """
+    Runs `fn(*args)` (plus the run's config as last argument with
+    `with_config`) in the worker pool and awaits the result. `fn`, its
+    arguments and its result must be picklable. Runs inline when no pool is
+    running, or after the pool broke (e.g. a worker was OOM-killed).
+
+    With `stage`, the time spent in `fn` (not waiting for a worker) is
+    recorded as a metrics sample.
+    """
+    global _executor
+    if _executor is None:
+        result, seconds = _call(fn, args, with_config)
+    else:
+        try:
+            result, seconds = await asyncio.get_running_loop().run_in_executor(
+                _executor, _call, fn, args, with_config
+            )
+        except BrokenProcessPool:
+            log("⚠️ CPU pool broke, running CPU stages inline from now on")
+            _executor = None
+            result, seconds = _call(fn, args, with_config)
+
+    if stage:
+        record_stage(stage, seconds, url=url)
+    return result
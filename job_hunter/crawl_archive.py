@@ -0,0 +1,249 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+from job_hunter.utils.log import log
+from job_hunter.utils.utils import normalize_url
+
+ARCHIVE_MODES = ("record", "replay")
+
+# Error returned in replay mode for anything the recorded crawl didn't fetch
+NOT_ARCHIVED_ERROR = "Not in crawl archive"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    request_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    status INTEGER,
+    error TEXT,
+    content_hash TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_kind ON entries (kind);
+CREATE TABLE IF NOT EXISTS blobs (
+    content_hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class ArchivedEntry:
+    kind: str
+    body: str | None
+    status: int | None
+    error: str | None
+
+
+class CrawlArchive:
+    """
+    Everything one crawl fetched, for replaying it offline.
+
+    Entries are indexed by request (listing / detail page by normalized URL,
+    API calls by method + URL + params + body) and hold the outcome as the
+    fetcher returned it: body, status, error and fetch time. Kinds: "listing"
+    (rendered HTML after show-more expansion), "listing_jobs" (jobs read
+    from the listing's API or extracted in the page, as JSON), "detail",
+    "detail_text" and "api". Bodies are zlib-compressed and stored once per
+    content hash, like the HTML cache.
+
+    Modes: "record" (re)writes entries as the crawl runs, "replay" only
+    reads them.
+    """
+
+    def __init__(self, directory: str, mode: str):
+        if mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unknown archive mode: {mode}")
+
+        if mode == "replay" and not os.path.exists(os.path.join(directory, "index.db")):
+            raise FileNotFoundError(f"No crawl archive in {directory}")
+
+        self.directory = directory
+        self.mode = mode
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(directory, "index.db"))
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def get(self, request_key: str) -> ArchivedEntry | None:
+        row = self._db.execute(
+            "SELECT kind, status, error, content_hash FROM entries WHERE request_key = ?",
+            (request_key,),
+        ).fetchone()
+        if not row:
+            self.missing += 1
+            return None
+
+        kind, status, error, content_hash = row
+        body = self._read_blob(content_hash) if content_hash else None
+        if content_hash and body is None:
+            self.missing += 1
+            return None
+
+        self.replayed += 1
+        return ArchivedEntry(kind, body, status, error)
+
+    def put(
+        self,
+        request_key: str,
+        url: str,
+        kind: str,
+        body: str | None,
+        status: int | None = None,
+        error: str | None = None,
+    ):
+        if self.mode != "record":
+            return
+
+        content_hash = self._write_blob(body) if body else None
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(request_key, url, kind, status, error, content_hash, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (request_key, url, kind, status, error, content_hash, time.time()),
+        )
+        self._db.commit()
+        self.recorded += 1
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _blob_path(self, content_hash: str) -> str:
+        return os.path.join(
+            self.directory, "blobs", content_hash[:2], content_hash + ".z"
+        )
+
+    def _write_blob(self, body: str) -> str:
+        data = body.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        if self._db.execute(
+            "SELECT 1 FROM blobs WHERE content_hash = ?", (content_hash,)
+        ).fetchone():
+            return content_hash
+
+        compressed = zlib.compress(data, 6)
+        path = self._blob_path(content_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(compressed)
+        self._db.execute(
+            "INSERT INTO blobs (content_hash, size) VALUES (?, ?)",
+            (content_hash, len(compressed)),
+        )
+        return content_hash
+
+    def _read_blob(self, content_hash: str) -> str | None:
+        try:
+            with open(self._blob_path(content_hash), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error):
+            return None
+
+
+def page_key(group: str, url: str) -> str:
+    return f"{group}:{normalize_url(url)}"
+
+
+def api_key(method: str, url: str, params=None, json_body=None) -> str:
+    query = urlencode(sorted(params.items() if isinstance(params, dict) else params or []))
+    body = json.dumps(json_body, sort_keys=True) if json_body is not None else ""
+    return f"api:{method.upper()} {normalize_url(url)}?{query} {body}"
+
+
+# -------------------------
+# Fetcher hooks: (de)serialize what the crawler's fetchers return
+# -------------------------
+def replay_listing(url: str):
+    """fetch_listing's (jobs, html, error) from the archive."""
+    entry = _archive.get(page_key("listing", url))
+    if entry is None:
+        return None, None, NOT_ARCHIVED_ERROR
+    if entry.kind == "listing_jobs":
+        return json.loads(entry.body), None, entry.error
+    return None, entry.body, entry.error
+
+
+def record_listing(url: str, jobs, html, error, status=None):
+    key = page_key("listing", url)
+    if jobs is not None:
+        _archive.put(key, url, "listing_jobs", json.dumps(jobs), status, error)
+    else:
+        _archive.put(key, url, "listing", html, status, error)
+
+
+def replay_detail(url: str):
+    """fetch_job_detail's (html, extracted, error) from the archive."""
+    entry = _archive.get(page_key("detail", url))
+    if entry is None:
+        return None, None, NOT_ARCHIVED_ERROR
+    if entry.kind == "detail_text":
+        return None, json.loads(entry.body), entry.error
+    return entry.body, None, entry.error
+
+
+def record_detail(url: str, html, extracted, error, status=None):
+    key = page_key("detail", url)
+    if extracted is not None:
+        _archive.put(key, url, "detail_text", json.dumps(extracted), status, error)
+    else:
+        _archive.put(key, url, "detail", html, status, error)
+
+
+def replay_json(request_key: str):
+    """fetch_json's (data, error) from the archive."""
+    entry = _archive.get(request_key)
+    if entry is None:
+        return None, NOT_ARCHIVED_ERROR
+    return (json.loads(entry.body) if entry.body else None), entry.error
+
+
+def record_json(request_key: str, url: str, data, error, status=None):
+    body = json.dumps(data) if data is not None else None
+    _archive.put(request_key, url, "api", body, status, error)
+
+
+# 🔑 Run-wide archive, opened/closed by the pipeline
+_archive: CrawlArchive | None = None
+
+
+def open_crawl_archive(directory: str, mode: str) -> CrawlArchive:
+    global _archive
+    close_crawl_archive()
+    _archive = CrawlArchive(directory, mode)
+    log(f"📼 Crawl archive: {directory} (mode={mode})")
+    return _archive
+
+
+def close_crawl_archive():
+    global _archive
+    if _archive is None:
+        return
+
+    if _archive.mode == "record":
+        log(f"📼 Crawl archive: {_archive.recorded} responses recorded")
+    else:
+        log(
+            f"📼 Crawl archive: {_archive.replayed} responses replayed, "
+            f"{_archive.missing} not in the archive"
+        )
+    _archive.close()
+    _archive = None
+
+
+def get_crawl_archive() -> CrawlArchive | None:
+    return _archive
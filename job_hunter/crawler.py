@@ -1,74 +1,171 @@
-from playwright.async_api import (
-    async_playwright,
-    TimeoutError as PlaywrightTimeoutError,
-)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from playwright._impl._errors import Error as PlaywrightError
+import json
+from urllib.parse import urlparse
+
+from job_hunter.browser_pool import acquire_page, mark_page_broken
+from job_hunter.crawl_archive import (
+    get_crawl_archive,
+    record_detail,
+    record_listing,
+    replay_detail,
+    replay_listing,
+)
+from job_hunter.host_scheduler import (
+    clear_response_status,
+    host_slot,
+    last_response_status,
+)
+from job_hunter.html_cache import get_html_cache
+from job_hunter.metrics import timed
+from job_hunter.page_readiness import wait_until_ready
+from job_hunter.http_fetcher import fetch_html_http_conditional, looks_like_js_shell
+from job_hunter.listing_capture import ListingCapture
+from job_hunter.page_extraction import extract_detail_in_page, extract_listing_in_page
+from job_hunter.resource_policy import LISTING_KEPT_TYPES, apply_resource_policy
+from job_hunter.retry_policy import fetch_with_retries, is_circuit_open_error
 from job_hunter.utils.log import log
 
+# 🔑 Per-domain memory of which detail fetch path worked ("http" | "browser")
+DETAIL_FETCH_STRATEGY: dict[str, str] = {}
+
+HTTP_FAST_PATH_ENABLED = True
+
+# 🔑 Extract rendered pages inside the browser, returning JSON instead of HTML
+BROWSER_EXTRACTION_ENABLED = False
+
+NO_CACHE_HEADERS = {"Cache-Control": "no-cache", "Pragma": "no-cache"}
+
+# 🔑 Known job-card selectors, raced at once while a listing renders
+JOB_SELECTORS = [
+    "a.apply-card",  # Zeta
+    "[data-testid='job']",  # some ATS
+    "a[href*='job']",  # generic fallback
+    "a[href*='careers']",
+]
+
 
-async def fetch_html(url: str):
+def set_http_fast_path(enabled: bool):
+    global HTTP_FAST_PATH_ENABLED
+    HTTP_FAST_PATH_ENABLED = enabled
+
+
+def set_browser_extraction(enabled: bool):
+    global BROWSER_EXTRACTION_ENABLED
+    BROWSER_EXTRACTION_ENABLED = enabled
+
+
+async def fetch_listing(url: str):
     """
-    Robust HTML fetcher.
+    Listing fetcher. When the page loads its jobs from a JSON API while
+    rendering, jobs are read from those responses (pagination API included)
+    and the page is neither expanded nor parsed. Otherwise the rendered HTML
+    is returned for `extract_job_links`, or, with browser extraction on, the
+    links are extracted inside the page. Served from the HTML cache when
+    possible.
 
     Returns:
+      jobs: list[dict] | None   (None when only HTML is available)
       html: str | None
       error: str | None
     NEVER throws.
     """
+    archive = get_crawl_archive()
+    if archive and archive.replaying:
+        return replay_listing(url)
+
+    clear_response_status()
+    jobs, html, error = await _fetch_listing(url)
+    if archive:
+        record_listing(url, jobs, html, error, last_response_status())
+    return jobs, html, error
+
+
+async def _fetch_listing(url: str):
+    cache = get_html_cache()
+    if cache:
+        cached = cache.get(url, "listing_jobs")
+        if cached:
+            log(f"🗄️ Listing jobs served from cache: {url}", "DEBUG")
+            return json.loads(cached.html), None, None
+
+        cached = cache.get(url, "listing")
+        if cached:
+            log(f"🗄️ Listing served from cache: {url}", "DEBUG")
+            return None, cached.html, None
+
+    listing, error = await fetch_with_retries(_render_listing, url, True)
+    jobs, html = listing or (None, None)
+
+    if cache and not error:
+        if jobs is not None:
+            cache.put(url, "listing_jobs", json.dumps(jobs))
+        elif html:
+            cache.put(url, "listing", html)
+    return jobs, html, error
+
+
+async def _render_listing(url: str, read_jobs: bool = False):
+    """
+    Robust listing renderer.
+
+    Returns:
+      listing: (jobs, html) | None   (jobs only with `read_jobs`, from the
+               listing API or, with browser extraction on, from the page)
+      error: str | None
+    NEVER throws.
+    """
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                bypass_csp=True,
-                ignore_https_errors=True,
-            )
-            page = await context.new_page()
-
-            await page.route(
-                "**/*",
-                lambda route: route.continue_(
-                    headers={
-                        **route.request.headers,
-                        "Cache-Control": "no-cache",
-                        "Pragma": "no-cache",
-                    }
-                ),
-            )
+        async with host_slot(url, "browser") as slot, acquire_page() as page:
+            # 🔑 Headers are set natively, no per-request Python callback
+            await page.set_extra_http_headers(NO_CACHE_HEADERS)
+            # Stylesheets stay: _find_element_by_text reads the computed cursor
+            resource_stats = await apply_resource_policy(page, keep_types=LISTING_KEPT_TYPES)
 
             page.set_default_navigation_timeout(60000)
             page.set_default_timeout(60000)
 
+            # 🔑 Watch the page's own API calls for a job list
+            capture = ListingCapture(page, url) if read_jobs else None
+            if capture:
+                capture.start()
+
             try:
-                await page.goto(
+                response = await page.goto(
                     url,
                     wait_until="domcontentloaded",
                     timeout=60000,
                 )
+                if response:
+                    slot.status = response.status
+                    if response.status >= 500:
+                        return None, f"HTTP {response.status}"
+
+                # 🔑 Wait for job cards / a stable page (best effort, bounded)
+                await wait_until_ready(page, url, selectors=JOB_SELECTORS)
+
+                jobs = await capture.collect() if capture else None
+                if jobs:
+                    log(f"🛰️ Read {len(jobs)} jobs from the listing API of {url}")
+                    return (jobs, None), None
+
+                # expand "Show more", then let the last batch settle
+                with timed("show_more", url):
+                    if await _expand_dynamic_listings(page):
+                        await wait_until_ready(page, url)
+
+                # 🔑 Only the links cross the Playwright boundary, not the DOM
+                if read_jobs and BROWSER_EXTRACTION_ENABLED:
+                    return (await extract_listing_in_page(page, url), None), None
 
-                # 🔑 Try waiting for known job-card selectors (best effort)
-                JOB_SELECTORS = [
-                    "a.apply-card",  # Zeta
-                    "[data-testid='job']",  # some ATS
-                    "a[href*='job']",  # generic fallback
-                    "a[href*='careers']",
-                ]
-
-                for selector in JOB_SELECTORS:
-                    try:
-                        await page.wait_for_selector(selector, timeout=8000)
-                        break
-                    except Exception:
-                        pass
-
-                # expand "Show more"
-                await _expand_dynamic_listings(page)
-
-                await page.wait_for_timeout(1000)
                 html = await page.content()
 
-                return html, None
+                return (None, html), None
 
             except (PlaywrightTimeoutError, PlaywrightError) as e:
+                slot.timed_out = isinstance(e, PlaywrightTimeoutError)
+                # Don't hand a page stuck mid-navigation to the next fetch
+                mark_page_broken(page)
                 error_msg = str(e).split("\n")[0]
 
                 log(f"⚠️ Playwright failed for URL: {url}")
@@ -77,8 +174,9 @@ async def fetch_html(url: str):
                 return None, error_msg
 
             finally:
-                await context.close()
-                await browser.close()
+                if capture:
+                    capture.stop()
+                resource_stats.log(url)
 
     except Exception as e:
         # 🔑 Catches browser launch failures, Playwright startup issues, OS errors, etc.
@@ -88,10 +186,12 @@ async def fetch_html(url: str):
         return None, error_msg
 
 
-async def _expand_dynamic_listings(page):
+async def _expand_dynamic_listings(page) -> int:
+    """Clicks "show more"-like buttons until no new anchors appear. Returns the number of clicks."""
     KEYWORDS = ["show more", "load more", "more jobs"]
     prev_anchor_count = 0
     max_clicks = 25
+    clicks = 0
 
     for _ in range(max_clicks):
         button = await _find_element_by_text(page, KEYWORDS)
@@ -105,6 +205,7 @@ async def _expand_dynamic_listings(page):
         try:
             await button.scroll_into_view_if_needed()
             await button.click()
+            clicks += 1
         except Exception:
             break
 
@@ -118,6 +219,8 @@ async def _expand_dynamic_listings(page):
 
         prev_anchor_count = await page.evaluate("document.querySelectorAll('a').length")
 
+    return clicks
+
 
 async def _find_element_by_text(page, keywords):
     """
@@ -167,52 +270,184 @@ async def _find_element_by_text(page, keywords):
     return await page.evaluate_handle(script, keywords)
 
 
+async def _fetch_detail_http(
+    url: str, etag: str | None = None, last_modified: str | None = None
+):
+    """
+    `fetch_html_http_conditional` shaped for `fetch_with_retries`, so the
+    HTTP attempt is retried and counted by the host's circuit breaker.
+
+    Returns:
+      response: (html, validators) | None
+      error: str | None
+    NEVER throws.
+    """
+    html, error, validators = await fetch_html_http_conditional(
+        url, etag=etag, last_modified=last_modified
+    )
+    if error:
+        return None, error
+    return (html, validators), None
+
+
 async def fetch_html_single_page(url: str):
     """
-    Robust HTML fetcher.
+    Renders a single page, retrying transient failures.
 
     Returns:
       html: str | None
       error: str | None
     NEVER throws.
     """
+    return await fetch_with_retries(_render_single_page, url)
+
+
+async def _render_single_page(url: str, extract_in_page: bool = False):
+    """
+    Robust HTML fetcher.
+
+    Returns:
+      html: str | None   (with `extract_in_page`, the dict from
+                         `extract_detail_in_page` instead)
+      error: str | None
+    NEVER throws.
+    """
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                bypass_csp=True,
-                ignore_https_errors=True,
-            )
-            page = await context.new_page()
+        async with host_slot(url, "browser") as slot, acquire_page() as page:
+            resource_stats = await apply_resource_policy(page)
 
             page.set_default_navigation_timeout(60000)
             page.set_default_timeout(60000)
 
             try:
-                await page.goto(
+                response = await page.goto(
                     url,
                     wait_until="domcontentloaded",
                     timeout=60000,
                 )
+                if response:
+                    slot.status = response.status
+                    if response.status >= 500:
+                        return None, f"HTTP {response.status}"
 
-                # ⏳ Small buffer to allow late JS rendering
-                await page.wait_for_timeout(1500)
+                # ⏳ Let late JS rendering settle (returns early on static pages)
+                await wait_until_ready(page, url)
+
+                if extract_in_page:
+                    return await extract_detail_in_page(page), None
 
                 html = await page.content()
                 return html, None
 
             except (PlaywrightTimeoutError, PlaywrightError) as e:
+                slot.timed_out = isinstance(e, PlaywrightTimeoutError)
+                mark_page_broken(page)
                 error_msg = str(e).split("\n")[0]
                 log(f"⚠️ Playwright failed for URL: {url}")
                 log(f"⚠️ Reason: {error_msg}")
                 return None, error_msg
 
             finally:
-                await context.close()
-                await browser.close()
+                resource_stats.log(url)
 
     except Exception as e:
         error_msg = str(e).split("\n")[0]
         log(f"⚠️ Playwright failed for URL: {url}")
         log(f"⚠️ Reason: {error_msg}")
         return None, error_msg
+
+
+async def fetch_job_detail(url: str):
+    """
+    Job detail fetcher: plain HTTP first, Playwright only when needed.
+
+    Escalates to a browser render when the HTTP response fails or looks like
+    an empty JS shell, and remembers per domain which path worked so later
+    fetches skip the attempt that is known to fail. With browser extraction
+    on, rendered pages are extracted inside the browser.
+
+    Fresh pages come from the HTML cache. Expired pages that carry an ETag
+    or Last-Modified are revalidated with a conditional GET first.
+
+    Returns:
+      html: str | None
+      extracted: {"text", "locations"} | None   (instead of html when the
+                 page was extracted in the browser)
+      error: str | None
+    NEVER throws.
+    """
+    return await _fetch_job_detail(url, extract_in_page=BROWSER_EXTRACTION_ENABLED)
+
+
+async def _fetch_job_detail(url: str, extract_in_page: bool):
+    archive = get_crawl_archive()
+    if archive and archive.replaying:
+        return replay_detail(url)
+
+    clear_response_status()
+    html, extracted, error = await _fetch_job_detail_live(url, extract_in_page)
+    if archive:
+        record_detail(url, html, extracted, error, last_response_status())
+    return html, extracted, error
+
+
+async def _fetch_job_detail_live(url: str, extract_in_page: bool):
+    cache = get_html_cache()
+    cached = cache.get(url, "detail", allow_stale=True) if cache else None
+    if cached and cached.fresh:
+        log(f"🗄️ Job detail served from cache: {url}", "DEBUG")
+        return cached.html, None, None
+
+    if cache and extract_in_page:
+        cached_text = cache.get(url, "detail_text")
+        if cached_text:
+            log(f"🗄️ Job detail text served from cache: {url}", "DEBUG")
+            return None, json.loads(cached_text.html), None
+
+    domain = urlparse(url).netloc.lower()
+    strategy = DETAIL_FETCH_STRATEGY.get(domain)
+
+    if HTTP_FAST_PATH_ENABLED and strategy != "browser":
+        response, error = await fetch_with_retries(
+            _fetch_detail_http,
+            url,
+            etag=cached.etag if cached else None,
+            last_modified=cached.last_modified if cached else None,
+        )
+        html, validators = response or (None, {})
+
+        # 304 Not Modified: the cached copy is still good
+        if cached and not error and html is None:
+            log(f"🗄️ Job detail revalidated: {url}", "DEBUG")
+            cache.mark_revalidated(url)
+            return cached.html, None, None
+
+        if not error and not looks_like_js_shell(html):
+            if strategy != "http":
+                log(f"⚡ Using HTTP fast path for {domain}", "DEBUG")
+            DETAIL_FETCH_STRATEGY[domain] = "http"
+            if cache:
+                cache.put(url, "detail", html, **validators)
+            return html, None, None
+
+        # Host still failing after its cool-down: a render would fail too
+        if is_circuit_open_error(error):
+            return None, None, error
+
+        reason = error or "page looks like a JS shell"
+        log(f"↪️ HTTP fast path failed ({reason}), rendering {url}", "DEBUG")
+
+        # A domain that served real HTML before may just have a broken page
+        if strategy != "http":
+            DETAIL_FETCH_STRATEGY[domain] = "browser"
+
+    if extract_in_page:
+        extracted, error = await fetch_with_retries(_render_single_page, url, True)
+        if cache and extracted and not error:
+            cache.put(url, "detail_text", json.dumps(extracted))
+        return None, extracted, error
+
+    html, error = await fetch_html_single_page(url)
+    if cache and html and not error:
+        cache.put(url, "detail", html)
+    return html, None, error
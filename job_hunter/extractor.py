@@ -1,17 +1,97 @@
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
-from job_hunter.crawler import fetch_html_single_page
+from job_hunter.html_parser import make_soup
 from job_hunter.utils.log import log
-from job_hunter.utils.utils import normalize_str_into_words, match_words
+from job_hunter.utils.utils import normalize_str_into_words
+
+
+TITLE_CANDIDATE_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6", "p", "span"}
+
+
+def _score_title_candidate(el):
+    """(score, text) for a title candidate element, or None if it can't be a title."""
+    text = el.get_text(separator=" ", strip=True)
+    if not text or len(text) < 6:
+        return None
+
+    lower = text.lower()
+
+    # Skip CTA / noise
+    if "apply" in lower:
+        return None
+
+    score = 0
+
+    # Prefer semantic headings
+    if el.name.startswith("h"):
+        score += 100
+
+    # Prefer longer, descriptive titles
+    score += min(len(text), 60)
+
+    # Penalize badge-like / category text
+    if len(text.split()) <= 2:
+        score -= 20
+
+    # Penalize uppercase labels
+    if text.isupper():
+        score -= 10
+
+    return score, text
+
+
+def _best_title_in(container, memo: dict):
+    """
+    Best-scoring title candidate among `container`'s descendants, with the
+    first one in document order winning ties (same as scanning
+    `container.select("h1, ..., span")`). Returns (score, text) or None.
+
+    Computed bottom-up and memoized per element, so every element is scored
+    once per page no matter how many anchors share the container.
+    """
+    key = id(container)
+    if key in memo:
+        return memo[key]
+
+    # Iterative post-order walk (deep SPA DOMs would overflow recursion)
+    stack = [(container, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if id(node) in memo:
+            continue
+
+        children = [c for c in node.children if getattr(c, "name", None)]
+        if not children_done:
+            stack.append((node, True))
+            stack.extend((c, False) for c in reversed(children) if id(c) not in memo)
+            continue
+
+        best = None
+        for child in children:
+            # The child itself comes before its descendants in document order
+            if child.name in TITLE_CANDIDATE_TAGS:
+                candidate = memo.setdefault(("own", id(child)), _score_title_candidate(child))
+                if candidate and candidate[0] > (best[0] if best else -1):
+                    best = candidate
+
+            candidate = memo[id(child)]
+            if candidate and candidate[0] > (best[0] if best else -1):
+                best = candidate
+
+        memo[id(node)] = best
+
+    return memo[key]
 
 
 def extract_job_links(listing_html: str, base_url: str) -> list[dict]:
     log("🔗 Extracting job links", "DEBUG")
 
-    soup = BeautifulSoup(listing_html, "html.parser")
+    soup = make_soup(listing_html, "listing")
     jobs = []
 
+    # Shared by all anchors: container -> best title candidate beneath it
+    title_memo = {}
+
     for a in soup.select("a[href]"):
         href = a.get("href")
         if not href:
@@ -34,45 +114,9 @@ def extract_job_links(listing_html: str, base_url: str) -> list[dict]:
                 if not parent:
                     break
 
-                candidates = parent.select("h1, h2, h3, h4, h5, h6, p, span")
-
-                best_title = None
-                best_score = -1
-
-                for el in candidates:
-                    text = el.get_text(separator=" ", strip=True)
-                    if not text or len(text) < 6:
-                        continue
-
-                    lower = text.lower()
-
-                    # Skip CTA / noise
-                    if "apply" in lower:
-                        continue
-
-                    score = 0
-
-                    # Prefer semantic headings
-                    if el.name.startswith("h"):
-                        score += 100
-
-                    # Prefer longer, descriptive titles
-                    score += min(len(text), 60)
-
-                    # Penalize badge-like / category text
-                    if len(text.split()) <= 2:
-                        score -= 20
-
-                    # Penalize uppercase labels
-                    if text.isupper():
-                        score -= 10
-
-                    if score > best_score:
-                        best_score = score
-                        best_title = text
-
-                if best_title:
-                    title = best_title
+                best = _best_title_in(parent, title_memo)
+                if best:
+                    title = best[1]
                     break
 
                 parent = parent.parent
@@ -93,26 +137,8 @@ def extract_job_links(listing_html: str, base_url: str) -> list[dict]:
     return jobs
 
 
-async def extract_job_details_and_locations(job_url: str, config) -> dict:
-    log("🌐 Fetching job detail page...", "DEBUG")
-    """
-    Step 2: Visit job detail page and extract:
-    - full description
-    - job locations
-
-    Excludes footer-like sections generically.
-    """
-    html, error = await fetch_html_single_page(job_url)
-    if not html or error:
-        return {
-            "description": "",
-            "extracted_locations": [],
-            "locations_from_description": [],
-            "all_extracted_locations": [],
-            "error": error,
-        }
-
-    soup = BeautifulSoup(html, "html.parser")
+def parse_job_details(html: str, config) -> dict:
+    soup = make_soup(html, "detail")
 
     # Remove footer-like sections generically
     for el in soup.select('[class*="footer"], [class*="Footer"], [class*="FOOTER"]'):
@@ -126,30 +152,43 @@ async def extract_job_details_and_locations(job_url: str, config) -> dict:
     # Extract description
     # -------------------------
     text = soup.get_text(separator=" ", strip=True)
-    log(f"📝 Description length: {len(text)} chars", "DEBUG")
-
-    description = text.lower()
-
-    # -------------------------
-    # Extract locations
-    # -------------------------
-    log("📍 Extracting job locations...", "DEBUG")
-
-    extracted_locations = set()
 
     # 🔑 Match any element with class containing "location"
     location_elements = soup.select(
         '[class*="location"], [class*="Location"], [class*="LOCATION"]'
     )
 
+    location_texts = []
     for el in location_elements:
         # Remove svg/icons inside location blocks
         for svg in el.find_all("svg"):
             svg.decompose()
 
+        location_texts.append(el.get_text(separator=" ", strip=True))
+
+    return build_job_details(text, location_texts, config)
+
+
+def build_job_details(text: str, location_texts: list[str], config) -> dict:
+    """
+    Turns a job's description text and raw location strings into the
+    details dict used by the matchers. Shared by HTML parsing and the ATS
+    adapters, which get both straight from JSON.
+    """
+    log("📝 Description length: %d chars", "DEBUG", len(text))
+
+    description = text.lower()
+
+    # -------------------------
+    # Extract locations
+    # -------------------------
+    log("📍 Extracting job locations...", "DEBUG")
+
+    extracted_locations = set()
+
+    for loc_text in location_texts:
         # Normalize spaces
-        loc_text = el.get_text(separator=" ", strip=True)
-        loc_text = re.sub(r"\s+", " ", loc_text)
+        loc_text = re.sub(r"\s+", " ", loc_text or "").strip()
 
         # Skip empty / junk
         if not loc_text or len(loc_text) < 2:
@@ -160,8 +199,9 @@ async def extract_job_details_and_locations(job_url: str, config) -> dict:
 
     normalized_extracted_locations = normalize_str_into_words(list(extracted_locations))
     log(
-        f"📍 Extracted locations from location_elements: {normalized_extracted_locations}",
+        "📍 Extracted locations from location_elements: %s",
         "DEBUG",
+        normalized_extracted_locations,
     )
 
     # -------------------------
@@ -170,52 +210,20 @@ async def extract_job_details_and_locations(job_url: str, config) -> dict:
     normalized_locations_from_description = []
     if len(normalized_extracted_locations) == 0:
         locations_from_description = set()
-        LOCATION_ALIASES = {
-            # allowed locations
-            "bangalore": ["bangalore", "bengaluru", "blr"],
-            "remote": ["remote", "work from home", "wfh", "anywhere"],
-            "india": ["india"],
-            # other locations
-            "hyderabad": ["hyderabad", "hyd"],
-            "pune": ["pune", "poona"],
-            "chennai": ["chennai", "madras"],
-            "gurgaon": ["gurgaon", "gurugram", "ggn"],
-            "noida": ["noida"],
-            "delhi": ["delhi", "new delhi", "ncr", "delhi ncr"],
-            "mumbai": ["mumbai", "bombay"],
-            "ahmedabad": ["ahmedabad", "amdavad"],
-            "indore": ["indore"],
-            "jaipur": ["jaipur"],
-            "kochi": ["kochi", "cochin"],
-            "trivandrum": ["trivandrum", "thiruvananthapuram"],
-            "coimbatore": ["coimbatore", "kovai"],
-            "trichy": ["trichy", "tiruchirappalli"],
-            "bhubaneswar": ["bhubaneswar", "bbsr"],
-            "kolkata": ["kolkata", "calcutta"],
-        }
-
-        for loc in config["blocked_locations"]:
-            LOCATION_ALIASES[loc] = [loc]
-
-        all_locations = (
-            list(config["allowed_locations"])
-            + list(config["blocked_locations"])
-            + list(config["other_locations"])
-            + list(LOCATION_ALIASES.keys())
-        )
+        # 🔑 One pass over the description for every alias of every location
+        alias_hits = config["matchers"]["location_aliases"].find_all(description)
 
-        for canonical, aliases in LOCATION_ALIASES.items():
-            if canonical not in all_locations:
-                continue
-            if match_words(description, aliases):
+        for canonical, aliases in config["matchers"]["canonical_locations"]:
+            if any(alias in alias_hits for alias in aliases):
                 locations_from_description.add(canonical)
 
         normalized_locations_from_description = normalize_str_into_words(
             list(locations_from_description)
         )
         log(
-            f"📍 Extracted locations using (canonical, aliases) logic: {normalized_locations_from_description}",
+            "📍 Extracted locations using (canonical, aliases) logic: %s",
             "DEBUG",
+            normalized_locations_from_description,
         )
 
     return {
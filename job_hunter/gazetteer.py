@@ -0,0 +1,30 @@
+import json
+from functools import cache
+from importlib import resources
+
+# Precomputed from pycountry (see build_country_names), shipped as package data
+COUNTRIES_FILE = "countries.json"
+
+
+@cache
+def country_names() -> tuple[str, ...]:
+    """Lowercased country names, read once on first use."""
+    data = resources.files("job_hunter") / "data" / COUNTRIES_FILE
+    with data.open(encoding="utf-8") as f:
+        return tuple(json.load(f))
+
+
+def build_country_names() -> list[str]:
+    import pycountry
+
+    return sorted({c.name.lower() for c in pycountry.countries})
+
+
+if __name__ == "__main__":
+    # Regenerate the data file: python -m job_hunter.gazetteer
+    path = resources.files("job_hunter") / "data" / COUNTRIES_FILE
+    names = build_country_names()
+    with open(str(path), "w", encoding="utf-8") as f:
+        json.dump(names, f, indent=0, ensure_ascii=False)
+        f.write("\n")
+    print(f"📝 {len(names)} countries written to {path}")
@@ -0,0 +1,261 @@
+import asyncio
+import contextvars
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+from job_hunter.utils.log import log
+
+# Responses that mean "slow down"
+THROTTLE_STATUSES = {429, 503}
+
+# Longest Retry-After we are willing to honour
+MAX_RETRY_AFTER_SECONDS = 60
+
+# Latency under which a host is considered healthy enough to widen its limit
+DEFAULT_TARGET_LATENCY = {"http": 2.0, "browser": 15.0}
+
+
+class HostSlot:
+    """Outcome of one request, filled in by the fetcher holding the slot."""
+
+    def __init__(self):
+        self.status: int | None = None
+        self.timed_out = False
+        self.retry_after: float | None = None
+
+
+class HostLimiter:
+    """
+    Politeness limits for one host.
+
+    Concurrency follows AIMD: every fast, successful request adds 1/limit
+    (about +1 per round of requests), a timeout or 429/503 halves it, at most
+    once per round. Request starts are spaced by `min_interval`, and a
+    throttled host gets a cool-down (Retry-After when the server sends one).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        min_interval: float = 0.2,
+        cooldown: float = 2.0,
+    ):
+        self.host = host
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial, self.min_limit), self.max_limit))
+        self.min_interval = min_interval
+        self.cooldown = cooldown
+
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self.peak_limit = self.limit
+
+        self._next_start = 0.0
+        self._last_decrease = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> float:
+        """Takes a concurrency slot. Returns how long to wait before starting."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.min_interval
+            return start - now
+
+    async def release(self, slot: HostSlot, started: float, target_latency: float):
+        async with self._cond:
+            self.in_flight -= 1
+            self.requests += 1
+
+            now = time.monotonic()
+            if slot.timed_out or slot.status in THROTTLE_STATUSES:
+                self.throttled += 1
+                # Requests started before the last decrease saw the same congestion
+                if started >= self._last_decrease:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                    self._last_decrease = now
+                    log(
+                        f"🐢 Throttling {self.host} "
+                        f"({'timeout' if slot.timed_out else f'HTTP {slot.status}'}), "
+                        f"limit now {int(self.limit)}",
+                        "DEBUG",
+                    )
+                cooldown = min(slot.retry_after or self.cooldown, MAX_RETRY_AFTER_SECONDS)
+                self._next_start = max(self._next_start, now + cooldown)
+
+            elif (slot.status is None or slot.status < 400) and (
+                now - started <= target_latency
+            ):
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+                self.peak_limit = max(self.peak_limit, self.limit)
+
+            self._cond.notify_all()
+
+
+class HostScheduler:
+    """
+    Per-host limiters plus global limits per request kind ("http" / "browser").
+
+    Fetchers wrap each request in `slot(url, kind)`. The host slot is taken
+    first, so a slow host waits on its own limit without holding global slots
+    that other hosts could use.
+    """
+
+    def __init__(
+        self,
+        global_limits: dict,
+        host_initial: int = 4,
+        host_min: int = 1,
+        host_max: int = 16,
+        host_max_rps: float = 5.0,
+        target_latency: dict | None = None,
+    ):
+        self.host_initial = host_initial
+        self.host_min = host_min
+        self.host_max = host_max
+        self.min_interval = 1 / host_max_rps if host_max_rps else 0.0
+        self.target_latency = {**DEFAULT_TARGET_LATENCY, **(target_latency or {})}
+        self._global = {
+            kind: asyncio.Semaphore(max(1, limit)) for kind, limit in global_limits.items()
+        }
+        self.hosts: dict[str, HostLimiter] = {}
+
+    def limiter(self, url: str) -> HostLimiter:
+        host = urlparse(url).netloc.lower()
+        limiter = self.hosts.get(host)
+        if limiter is None:
+            limiter = self.hosts[host] = HostLimiter(
+                host,
+                initial=self.host_initial,
+                min_limit=self.host_min,
+                max_limit=self.host_max,
+                min_interval=self.min_interval,
+            )
+        return limiter
+
+    @asynccontextmanager
+    async def slot(self, url: str, kind: str = "http"):
+        limiter = self.limiter(url)
+        delay = await limiter.acquire()
+
+        slot = HostSlot()
+        started = time.monotonic()
+        try:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            started = time.monotonic()
+
+            semaphore = self._global.get(kind)
+            if semaphore is None:
+                yield slot
+            else:
+                async with semaphore:
+                    started = time.monotonic()
+                    yield slot
+        except BaseException as e:
+            # httpx.ReadTimeout, playwright TimeoutError, asyncio.TimeoutError...
+            if "Timeout" in type(e).__name__:
+                slot.timed_out = True
+            raise
+        finally:
+            await limiter.release(
+                slot, started, self.target_latency.get(kind, DEFAULT_TARGET_LATENCY["http"])
+            )
+
+    def log_summary(self):
+        if not self.hosts:
+            return
+
+        log("🚦 Per-host request limits:")
+        busiest = sorted(self.hosts.values(), key=lambda h: h.requests, reverse=True)
+        for limiter in busiest[:20]:
+            log(
+                f"   {limiter.host}: {limiter.requests} requests, "
+                f"{limiter.throttled} throttled, limit {int(limiter.limit)} "
+                f"(peak {int(limiter.peak_limit)})"
+            )
+        if len(busiest) > 20:
+            log(f"   ... and {len(busiest) - 20} more hosts")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After in seconds (the HTTP-date form is ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+# 🔑 Run-wide scheduler, started/stopped by the pipeline
+_scheduler: HostScheduler | None = None
+
+# Status of the last response the current task got through a host slot
+_last_status: contextvars.ContextVar[int | None] = contextvars.ContextVar(
+    "last_status", default=None
+)
+
+
+def start_host_scheduler(global_limits: dict, **kwargs) -> HostScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = HostScheduler(global_limits, **kwargs)
+        log(
+            f"🚦 Host scheduler started (per host {_scheduler.host_initial} "
+            f"→ max {_scheduler.host_max}, global {global_limits})"
+        )
+    return _scheduler
+
+
+def stop_host_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        return
+
+    _scheduler.log_summary()
+    _scheduler = None
+
+
+def get_host_scheduler() -> HostScheduler | None:
+    return _scheduler
+
+
+@asynccontextmanager
+async def host_slot(url: str, kind: str = "http"):
+    """
+    Yields a `HostSlot` once `url`'s host (and the global `kind` limit) has
+    room. Set `.status` / `.timed_out` / `.retry_after` on it so the host's
+    limit can adapt. Unthrottled when no scheduler is running.
+    """
+    if _scheduler is None:
+        slot = HostSlot()
+        try:
+            yield slot
+        finally:
+            _last_status.set(slot.status)
+        return
+
+    async with _scheduler.slot(url, kind) as slot:
+        try:
+            yield slot
+        finally:
+            _last_status.set(slot.status)
+
+
+def last_response_status() -> int | None:
+    """HTTP status of the current task's last request (None if it failed)."""
+    return _last_status.get()
+
+
+def clear_response_status():
+    _last_status.set(None)
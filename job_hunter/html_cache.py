@@ -0,0 +1,261 @@
+import hashlib
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+
+from job_hunter.utils.log import log
+from job_hunter.utils.utils import normalize_url
+
+CACHE_MODES = ("use", "refresh", "off")
+
+DEFAULT_TTL_SECONDS = {
+    "listing": 6 * 60 * 60,
+    "listing_jobs": 6 * 60 * 60,  # jobs read from a listing's API or extracted in the browser
+    "detail": 7 * 24 * 60 * 60,
+    "detail_text": 7 * 24 * 60 * 60,  # detail text + locations extracted in the browser
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    etag TEXT,
+    last_modified TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_pages_last_access ON pages (last_access);
+CREATE INDEX IF NOT EXISTS idx_pages_content_hash ON pages (content_hash);
+CREATE TABLE IF NOT EXISTS blobs (
+    content_hash TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class CachedPage:
+    html: str
+    fresh: bool
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class HtmlCache:
+    """
+    On-disk cache of fetched HTML.
+
+    Pages are keyed by kind and normalized URL. Bodies are zlib-compressed and stored
+    once per content hash, so identical pages share a blob. Each page kind
+    has its own TTL. When the blobs grow past `max_bytes`, the least
+    recently used pages are evicted.
+
+    Modes: "use" reads and writes, "refresh" only writes (forces re-fetch),
+    "off" does nothing.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        mode: str = "use",
+        ttl_seconds: dict | None = None,
+        max_bytes: int = 500 * 1024 * 1024,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode: {mode}")
+
+        self.directory = directory
+        self.mode = mode
+        self.ttl_seconds = {**DEFAULT_TTL_SECONDS, **(ttl_seconds or {})}
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._db = None
+
+        if mode == "off":
+            return
+
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(directory, "index.db"))
+        self._db.executescript(_SCHEMA)
+        self._total_bytes = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM blobs"
+        ).fetchone()[0]
+
+    def get(self, url: str, kind: str, allow_stale: bool = False) -> CachedPage | None:
+        if self.mode != "use":
+            return None
+
+        row = self._db.execute(
+            "SELECT content_hash, fetched_at, etag, last_modified FROM pages "
+            "WHERE url_key = ? AND kind = ?",
+            (self._key(url, kind), kind),
+        ).fetchone()
+        if not row:
+            self.misses += 1
+            return None
+
+        content_hash, fetched_at, etag, last_modified = row
+        fresh = time.time() - fetched_at < self.ttl_seconds.get(kind, 0)
+        if not fresh and not allow_stale:
+            self.misses += 1
+            return None
+
+        html = self._read_blob(content_hash)
+        if html is None:
+            self.misses += 1
+            return None
+
+        self._db.execute(
+            "UPDATE pages SET last_access = ? WHERE url_key = ?",
+            (time.time(), self._key(url, kind)),
+        )
+        self._db.commit()
+
+        if fresh:
+            self.hits += 1
+        return CachedPage(html, fresh, etag, last_modified)
+
+    def put(self, url: str, kind: str, html: str, etag=None, last_modified=None):
+        if self.mode == "off" or not html:
+            return
+
+        body = html.encode("utf-8")
+        content_hash = hashlib.sha256(body).hexdigest()
+        now = time.time()
+
+        if not self._db.execute(
+            "SELECT 1 FROM blobs WHERE content_hash = ?", (content_hash,)
+        ).fetchone():
+            compressed = zlib.compress(body, 6)
+            path = self._blob_path(content_hash)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(compressed)
+            self._db.execute(
+                "INSERT INTO blobs (content_hash, size) VALUES (?, ?)",
+                (content_hash, len(compressed)),
+            )
+            self._total_bytes += len(compressed)
+
+        previous = self._db.execute(
+            "SELECT content_hash FROM pages WHERE url_key = ?", (self._key(url, kind),)
+        ).fetchone()
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO pages "
+            "(url_key, url, kind, content_hash, fetched_at, last_access, etag, last_modified) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._key(url, kind), url, kind, content_hash, now, now, etag, last_modified),
+        )
+        if previous and previous[0] != content_hash:
+            self._drop_blob_if_unused(previous[0])
+        self._db.commit()
+
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def mark_revalidated(self, url: str, kind: str = "detail"):
+        """The origin answered 304: restart the TTL without rewriting the body."""
+        if self.mode == "off":
+            return
+        now = time.time()
+        self._db.execute(
+            "UPDATE pages SET fetched_at = ?, last_access = ? WHERE url_key = ?",
+            (now, now, self._key(url, kind)),
+        )
+        self._db.commit()
+        self.revalidated += 1
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _key(self, url: str, kind: str) -> str:
+        return f"{kind}:{normalize_url(url)}"
+
+    def _blob_path(self, content_hash: str) -> str:
+        return os.path.join(
+            self.directory, "blobs", content_hash[:2], content_hash + ".z"
+        )
+
+    def _read_blob(self, content_hash: str) -> str | None:
+        try:
+            with open(self._blob_path(content_hash), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error):
+            return None
+
+    def _drop_blob_if_unused(self, content_hash: str):
+        if self._db.execute(
+            "SELECT 1 FROM pages WHERE content_hash = ? LIMIT 1", (content_hash,)
+        ).fetchone():
+            return
+
+        row = self._db.execute(
+            "SELECT size FROM blobs WHERE content_hash = ?", (content_hash,)
+        ).fetchone()
+        self._db.execute("DELETE FROM blobs WHERE content_hash = ?", (content_hash,))
+        if row:
+            self._total_bytes -= row[0]
+        try:
+            os.remove(self._blob_path(content_hash))
+        except OSError:
+            pass
+
+    def _evict(self):
+        # Evict down to 90% so we don't evict again on the very next put
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for url_key, content_hash in self._db.execute(
+            "SELECT url_key, content_hash FROM pages ORDER BY last_access"
+        ).fetchall():
+            if self._total_bytes <= target:
+                break
+            self._db.execute("DELETE FROM pages WHERE url_key = ?", (url_key,))
+            self._drop_blob_if_unused(content_hash)
+            evicted += 1
+        self._db.commit()
+        log(f"🧹 HTML cache evicted {evicted} pages", "DEBUG")
+
+
+# 🔑 Run-wide cache, opened/closed by the pipeline
+_cache: HtmlCache | None = None
+
+
+def open_html_cache(directory: str, mode: str = "use", ttl_seconds=None, max_bytes=None):
+    global _cache
+    close_html_cache()
+    _cache = HtmlCache(
+        directory,
+        mode=mode,
+        ttl_seconds=ttl_seconds,
+        max_bytes=max_bytes or 500 * 1024 * 1024,
+    )
+    if mode != "off":
+        log(f"🗄️ HTML cache: {directory} (mode={mode})")
+    return _cache
+
+
+def close_html_cache():
+    global _cache
+    if _cache is None:
+        return
+
+    if _cache.mode != "off":
+        log(
+            f"🗄️ HTML cache: {_cache.hits} hits, {_cache.misses} misses, "
+            f"{_cache.revalidated} revalidated"
+        )
+    _cache.close()
+    _cache = None
+
+
+def get_html_cache() -> HtmlCache | None:
+    return _cache
@@ -0,0 +1,71 @@
+import time
+
+from bs4 import BeautifulSoup, SoupStrainer
+from job_hunter.utils.log import log
+
+# BeautifulSoup tree builders we can hand out. "lxml" is C-based and several
+# times faster than the pure-Python "html.parser" on large SPA dumps.
+PARSER_BACKENDS = ("html.parser", "lxml")
+
+# Only the parts of a page each extractor reads. Everything outside these
+# top-level tags (<head> scripts, styles, meta, JSON blobs) is never built.
+STRAINERS = {
+    "listing": SoupStrainer("body"),
+    "detail": SoupStrainer(["title", "body"]),
+}
+
+_backend = "html.parser"
+_use_strainer = False
+
+
+def _backend_available(backend: str) -> bool:
+    if backend == "html.parser":
+        return True
+    try:
+        __import__(backend)
+        return True
+    except ImportError:
+        return False
+
+
+def set_parser_backend(backend: str, use_strainer: bool = False):
+    global _backend, _use_strainer
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {backend}")
+
+    if not _backend_available(backend):
+        log(f"⚠️ HTML parser '{backend}' is not installed, using html.parser")
+        backend = "html.parser"
+
+    _backend = backend
+    _use_strainer = use_strainer
+
+
+def get_parser_backend() -> str:
+    return _backend
+
+
+def make_soup(html: str, purpose: str | None = None) -> BeautifulSoup:
+    """
+    Parses `html` with the configured backend. With strainer mode on and a
+    known `purpose` ("listing" / "detail"), only the parts that extractor
+    needs are built. Falls back to a full parse for fragments without <body>.
+    """
+    started = time.perf_counter()
+
+    strainer = STRAINERS.get(purpose) if _use_strainer else None
+    soup = BeautifulSoup(html, _backend, parse_only=strainer)
+    if strainer is not None and soup.find("body") is None:
+        soup = BeautifulSoup(html, _backend)
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    log(
+        "⏱️ Parsed %s (%d KB) with %s%s in %.1f ms",
+        "DEBUG",
+        purpose or "page",
+        len(html) // 1024,
+        _backend,
+        " + strainer" if strainer is not None else "",
+        elapsed_ms,
+    )
+    return soup
@@ -0,0 +1,217 @@
+import re
+from contextlib import asynccontextmanager
+
+import httpx
+from job_hunter.crawl_archive import api_key, get_crawl_archive, record_json, replay_json
+from job_hunter.host_scheduler import (
+    clear_response_status,
+    host_slot,
+    last_response_status,
+    parse_retry_after,
+)
+from job_hunter.retry_policy import fetch_with_retries
+from job_hunter.utils.log import log
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Below this much visible text a page is treated as an unrendered JS shell
+MIN_VISIBLE_TEXT_CHARS = 300
+
+_NON_VISIBLE_BLOCKS_RE = re.compile(
+    r"<(script|style|noscript|template|svg)\b[^>]*>.*?</\1\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_JS_REQUIRED_RE = re.compile(
+    r"(enable|requires?)\s+javascript|javascript\s+(is\s+)?(required|disabled)",
+    re.IGNORECASE,
+)
+
+# 🔑 Run-wide client (connection pool + keep-alive), started by the pipeline
+_client: httpx.AsyncClient | None = None
+
+
+async def start_http_client(max_connections: int = 50, timeout: float = 20.0):
+    global _client
+    if _client is not None:
+        return _client
+
+    _client = httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+        verify=False,
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=30.0,
+        ),
+    )
+    log(f"🌐 HTTP client started (max_connections={max_connections})")
+    return _client
+
+
+async def stop_http_client():
+    global _client
+    if _client is None:
+        return
+
+    client = _client
+    _client = None
+    await client.aclose()
+    log("🌐 HTTP client stopped")
+
+
+def get_http_client() -> httpx.AsyncClient | None:
+    return _client
+
+
+@asynccontextmanager
+async def _client_session():
+    """
+    Yields the run-wide client, or a one-off client when none is running
+    (e.g. when a fetcher is called on its own).
+    """
+    if _client is not None:
+        yield _client
+        return
+
+    async with httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+        verify=False,
+        timeout=httpx.Timeout(20.0),
+    ) as client:
+        yield client
+
+
+def _record_response(slot, response: httpx.Response):
+    slot.status = response.status_code
+    slot.retry_after = parse_retry_after(response.headers.get("retry-after"))
+
+
+async def fetch_html_http_conditional(
+    url: str, etag: str | None = None, last_modified: str | None = None
+):
+    """
+    GET with optional cache validators (If-None-Match / If-Modified-Since).
+
+    Returns:
+      html: str | None   (None with no error means 304 Not Modified)
+      error: str | None
+      validators: dict with the response's "etag" / "last_modified"
+    NEVER throws.
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    try:
+        async with host_slot(url, "http") as slot, _client_session() as client:
+            response = await client.get(url, headers=headers)
+            _record_response(slot, response)
+    except httpx.HTTPError as e:
+        error_msg = str(e).split("\n")[0] or e.__class__.__name__
+        log(f"⚠️ HTTP fetch failed for URL: {url} — {error_msg}", "DEBUG")
+        return None, error_msg, {}
+
+    validators = {
+        "etag": response.headers.get("etag"),
+        "last_modified": response.headers.get("last-modified"),
+    }
+
+    if response.status_code == 304 and headers:
+        return None, None, validators
+
+    if response.status_code >= 400:
+        return None, f"HTTP {response.status_code}", {}
+
+    content_type = response.headers.get("content-type", "")
+    if "html" not in content_type and "xml" not in content_type:
+        return None, f"Unexpected content type: {content_type or 'unknown'}", {}
+
+    return response.text, None, validators
+
+
+async def fetch_json(url: str, method: str = "GET", params=None, json=None):
+    """
+    JSON API call through the shared client (used by the ATS adapters),
+    retrying transient failures.
+
+    Returns:
+      data: dict | list | None
+      error: str | None
+    NEVER throws.
+    """
+    archive = get_crawl_archive()
+    request_key = api_key(method, url, params, json) if archive else None
+    if archive and archive.replaying:
+        return replay_json(request_key)
+
+    clear_response_status()
+    data, error = await fetch_with_retries(
+        _request_json, url, method=method, params=params, json=json
+    )
+    if archive:
+        record_json(request_key, url, data, error, last_response_status())
+    return data, error
+
+
+async def _request_json(url: str, method: str = "GET", params=None, json=None):
+    try:
+        async with host_slot(url, "http") as slot, _client_session() as client:
+            response = await client.request(
+                method,
+                url,
+                params=params,
+                json=json,
+                headers={"Accept": "application/json"},
+            )
+            _record_response(slot, response)
+    except httpx.HTTPError as e:
+        error_msg = str(e).split("\n")[0] or e.__class__.__name__
+        log(f"⚠️ JSON fetch failed for URL: {url} — {error_msg}", "DEBUG")
+        return None, error_msg
+
+    if response.status_code >= 400:
+        return None, f"HTTP {response.status_code}"
+
+    try:
+        return response.json(), None
+    except ValueError:
+        return None, "Invalid JSON response"
+
+
+def visible_text_length(html: str) -> int:
+    text = _NON_VISIBLE_BLOCKS_RE.sub(" ", html)
+    text = _TAG_RE.sub(" ", text)
+    return len(_WHITESPACE_RE.sub(" ", text).strip())
+
+
+def looks_like_js_shell(html: str) -> bool:
+    """
+    True when a server response is just a mount point for client-side JS
+    (e.g. an empty <div id="root"></div> plus bundles) and has to be rendered.
+    """
+    if not html:
+        return True
+
+    text_length = visible_text_length(html)
+    if text_length < MIN_VISIBLE_TEXT_CHARS:
+        return True
+
+    # "Please enable JavaScript" banners on otherwise tiny pages
+    if text_length < MIN_VISIBLE_TEXT_CHARS * 3 and _JS_REQUIRED_RE.search(html):
+        return True
+
+    return False
@@ -0,0 +1,84 @@
+import time
+
+from job_hunter.extractor import (
+    build_job_details,
+    extract_yoe_from_description,
+    parse_job_details,
+)
+from job_hunter.matcher import calculate_score, match_description, match_locations
+
+
+def analyze_job(
+    job_title: str,
+    html: str | None,
+    text: str,
+    locations: list[str],
+    config,
+) -> dict:
+    """
+    The CPU-bound part of processing one job: parse the detail page (or use
+    already extracted text + locations), match the description and the
+    locations, extract YOE and score it.
+
+    Takes and returns plain data so it can run in a worker process. The
+    description itself is not sent back.
+
+    Returns:
+      {"skipped": "description" | "location", "timings"} when the job is
+      out, otherwise {"skipped": None, "yoe", "score", "extracted_keywords",
+      "extracted_locations", "all_extracted_locations", "timings"}
+      timings: [(stage, seconds, bytes), ...] for metrics.record_stage
+    """
+    timings = []
+    started = time.perf_counter()
+
+    def lap(stage: str, nbytes: int = 0):
+        nonlocal started
+        now = time.perf_counter()
+        timings.append((stage, now - started, nbytes))
+        started = now
+
+    if html:
+        details = parse_job_details(html, config)
+        lap("parse", len(html))
+    else:
+        details = build_job_details(text or "", locations or [], config)
+        lap("parse", len(text or ""))
+    description = details.get("description", "")
+
+    is_desc_match, matched_keywords, extracted_keywords = match_description(
+        description, config
+    )
+    lap("match_description")
+    if not is_desc_match:
+        return {"skipped": "description", "timings": timings}
+
+    is_loc_match, _ = match_locations(details, config)
+    lap("match_locations")
+    if not is_loc_match:
+        return {"skipped": "location", "timings": timings}
+
+    yoe = extract_yoe_from_description(description)
+    lap("extract_yoe")
+
+    score = calculate_score(
+        {
+            "title": job_title,
+            "description": description,
+            "yoe": yoe,
+            "matched_keywords": matched_keywords,
+            "extracted_keywords": extracted_keywords,
+        },
+        config,
+    )
+    lap("score")
+
+    return {
+        "skipped": None,
+        "yoe": yoe,
+        "score": score,
+        "extracted_keywords": extracted_keywords,
+        "extracted_locations": details.get("extracted_locations", []),
+        "all_extracted_locations": details.get("all_extracted_locations", []),
+        "timings": timings,
+    }
@@ -0,0 +1,262 @@
+import csv
+import json
+import os
+import sqlite3
+import time
+
+from job_hunter.constants import JobCSVField
+from job_hunter.utils.log import log
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_link TEXT PRIMARY KEY,
+    s_no INTEGER NOT NULL UNIQUE,
+    company TEXT NOT NULL,
+    job_title TEXT,
+    yoe INTEGER,
+    match_percentage REAL,
+    extracted_keywords TEXT,
+    extracted_locations TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs (company);
+CREATE TABLE IF NOT EXISTS companies (
+    company TEXT PRIMARY KEY,
+    career_url TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS company_listings (
+    company TEXT PRIMARY KEY,
+    job_links TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_checkpoints (
+    job_link TEXT PRIMARY KEY,
+    company TEXT NOT NULL,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Company statuses a resumed run doesn't crawl again ("failed" ones are retried)
+FINISHED_COMPANY_STATUSES = ("done",)
+
+
+def store_path_for(output_file: str) -> str:
+    """jobs.csv -> jobs.db, next to the CSV it exports to."""
+    return os.path.splitext(output_file)[0] + ".db"
+
+
+class JobStore:
+    """
+    SQLite (WAL mode) store of matched jobs and per-company crawl status.
+
+    Dedupe checks, per-company counts and s_no assignment are indexed
+    lookups. The output CSV is generated from here with `export_csv`.
+
+    Also the run's checkpoint journal: company statuses, each company's job
+    links once its listing was read, and job links that are being checked
+    ("inflight"), were checked ("done") or couldn't be fetched ("failed"),
+    so a crashed run can be resumed. Only "done" jobs are skipped then.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    # -------------------------
+    # Jobs
+    # -------------------------
+    def has_job(self, job_link: str) -> bool:
+        return (
+            self._db.execute(
+                "SELECT 1 FROM jobs WHERE job_link = ?", (job_link,)
+            ).fetchone()
+            is not None
+        )
+
+    def add_job(self, row: dict) -> int | None:
+        """Inserts a job row (JobCSVField keys). Returns its s_no, or None if the link exists."""
+        yoe = row.get(JobCSVField.YOE.value)
+        match_percentage = row.get(JobCSVField.MATCH_PERCENTAGE.value)
+
+        with self._db:
+            s_no = self._db.execute(
+                "SELECT COALESCE(MAX(s_no), 0) + 1 FROM jobs"
+            ).fetchone()[0]
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO jobs (job_link, s_no, company, job_title, yoe, "
+                "match_percentage, extracted_keywords, extracted_locations, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    row[JobCSVField.JOB_LINK.value],
+                    s_no,
+                    row[JobCSVField.COMPANY.value],
+                    row.get(JobCSVField.JOB_TITLE.value),
+                    int(yoe) if yoe not in (None, "") else None,
+                    float(match_percentage) if match_percentage not in (None, "") else None,
+                    row.get(JobCSVField.EXTRACTED_KEYWORDS.value),
+                    row.get(JobCSVField.EXTRACTED_LOCATIONS.value),
+                    time.time(),
+                ),
+            )
+        return s_no if cursor.rowcount else None
+
+    def count_jobs(self, company: str | None = None) -> int:
+        if company is None:
+            return self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        return self._db.execute(
+            "SELECT COUNT(*) FROM jobs WHERE company = ?", (company,)
+        ).fetchone()[0]
+
+    # -------------------------
+    # Companies
+    # -------------------------
+    def set_company_status(
+        self, company: str, career_url: str, status: str, error: str | None = None
+    ):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO companies (company, career_url, status, error, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (company, career_url, status, error, time.time()),
+            )
+
+    def finished_companies(self) -> set[str]:
+        """Companies a resumed run skips: finished, with no job check left to redo."""
+        placeholders = ", ".join("?" for _ in FINISHED_COMPANY_STATUSES)
+        return {
+            company
+            for (company,) in self._db.execute(
+                f"SELECT company FROM companies WHERE status IN ({placeholders}) "
+                "AND company NOT IN "
+                "(SELECT company FROM job_checkpoints WHERE state != 'done')",
+                FINISHED_COMPANY_STATUSES,
+            )
+        }
+
+    # -------------------------
+    # Checkpoints
+    # -------------------------
+    def start_run(self, resume: bool = False):
+        """A fresh run forgets the previous run's checkpoints; a resumed one keeps them."""
+        if resume:
+            unfinished = self._db.execute(
+                "SELECT COUNT(*) FROM job_checkpoints WHERE state != 'done'"
+            ).fetchone()[0]
+            log(
+                f"♻️ Resuming: {len(self.finished_companies())} companies finished, "
+                f"{unfinished} interrupted or failed job checks will be redone"
+            )
+            return
+
+        with self._db:
+            self._db.execute("DELETE FROM companies")
+            self._db.execute("DELETE FROM company_listings")
+            self._db.execute("DELETE FROM job_checkpoints")
+
+    def save_job_links(self, company: str, job_links: list[dict]):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO company_listings (company, job_links, updated_at) "
+                "VALUES (?, ?, ?)",
+                (company, json.dumps(job_links), time.time()),
+            )
+
+    def saved_job_links(self, company: str) -> list[dict] | None:
+        row = self._db.execute(
+            "SELECT job_links FROM company_listings WHERE company = ?", (company,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def mark_job(self, job_link: str, company: str, state: str):
+        """
+        state: "inflight" while a job is being checked, "done" once it was,
+        "failed" when its page couldn't be fetched.
+        """
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO job_checkpoints (job_link, company, state, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (job_link, company, state, time.time()),
+            )
+
+    def is_job_done(self, job_link: str) -> bool:
+        return (
+            self._db.execute(
+                "SELECT 1 FROM job_checkpoints WHERE job_link = ? AND state = 'done'",
+                (job_link,),
+            ).fetchone()
+            is not None
+        )
+
+    # -------------------------
+    # CSV import / export
+    # -------------------------
+    def import_csv(self, csv_path: str) -> int:
+        """Seeds an empty store from an existing output CSV (pre-store runs)."""
+        if self.count_jobs() > 0 or not os.path.exists(csv_path):
+            return 0
+
+        imported = 0
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                if not row.get(JobCSVField.JOB_LINK.value) or not row.get(
+                    JobCSVField.COMPANY.value
+                ):
+                    continue
+                row[JobCSVField.JOB_LINK.value] = row[JobCSVField.JOB_LINK.value].strip()
+                row[JobCSVField.COMPANY.value] = row[JobCSVField.COMPANY.value].strip()
+                try:
+                    if self.add_job(row):
+                        imported += 1
+                except ValueError:
+                    log("⚠️ Skipping unreadable row in %s: %s", "DEBUG", csv_path, row)
+
+        log(f"📥 Imported {imported} existing jobs from {csv_path}")
+        return imported
+
+    def export_csv(self, csv_path: str):
+        """
+        Writes every job to `csv_path`, sorted by Company (ASC), Match % (DESC),
+        with serial numbers following that order.
+        """
+        log(f"📤 Exporting jobs to {csv_path}...")
+
+        rows = self._db.execute(
+            "SELECT company, job_title, job_link, yoe, match_percentage, "
+            "extracted_keywords, extracted_locations FROM jobs ORDER BY s_no"
+        ).fetchall()
+        # Sorted in Python (stable) so casing/unicode order matches str.lower()
+        rows.sort(key=lambda r: (r[0].lower(), -(r[4] or 0)))
+
+        tmp_path = csv_path + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(JobCSVField))
+            writer.writeheader()
+
+            for idx, row in enumerate(rows, start=1):
+                company, title, link, yoe, match, keywords, locations = row
+                writer.writerow(
+                    {
+                        JobCSVField.S_NO.value: idx,
+                        JobCSVField.COMPANY.value: company,
+                        JobCSVField.JOB_TITLE.value: title,
+                        JobCSVField.JOB_LINK.value: link,
+                        JobCSVField.YOE.value: yoe if yoe is not None else "",
+                        JobCSVField.MATCH_PERCENTAGE.value: match,
+                        JobCSVField.EXTRACTED_KEYWORDS.value: keywords,
+                        JobCSVField.EXTRACTED_LOCATIONS.value: locations,
+                    }
+                )
+
+        os.replace(tmp_path, csv_path)
+        log("✅ CSV exported")
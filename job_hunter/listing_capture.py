@@ -0,0 +1,343 @@
+import asyncio
+import json
+import re
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+from job_hunter.utils.log import log
+
+TITLE_KEYS = (
+    "title",
+    "jobTitle",
+    "job_title",
+    "postingTitle",
+    "positionName",
+    "position",
+    "text",
+    "name",
+)
+URL_KEYS = (
+    "absolute_url",
+    "hostedUrl",
+    "jobUrl",
+    "job_url",
+    "jobPostingUrl",
+    "canonicalUrl",
+    "externalUrl",
+    "applyUrl",
+    "url",
+    "link",
+    "href",
+)
+LOCATION_KEYS = (
+    "location",
+    "locations",
+    "locationName",
+    "locationsText",
+    "jobLocation",
+    "city",
+    "office",
+    "offices",
+)
+# Item keys that only job postings tend to have (locations count too)
+JOB_FIELD_HINTS = set(LOCATION_KEYS) | {
+    "department",
+    "departments",
+    "employmentType",
+    "employment_type",
+    "jobId",
+    "job_id",
+    "requisitionId",
+    "requisition_id",
+    "postedOn",
+    "datePosted",
+    "workplaceType",
+    "team",
+    "posted",
+    "postedAt",
+    "publishedAt",
+    "requisition",
+}
+_JOBISH_RE = re.compile(
+    r"job|posting|position|opening|vacanc|requisition|career|role", re.IGNORECASE
+)
+
+# Links on the rendered page that point at job postings
+JOB_ANCHOR_SELECTOR = "a[href*='job'], a[href*='position'], a[href*='opening']"
+
+PAGE_KEYS = ("page", "pageNumber", "page_number", "pageNo", "p")
+OFFSET_KEYS = ("offset", "start", "from", "skip")
+LIMIT_KEYS = ("limit", "size", "per_page", "perPage", "pageSize", "page_size", "rows", "hitsPerPage")
+TOTAL_KEYS = ("total", "totalCount", "total_count", "totalResults", "totalHits", "nbHits")
+
+MAX_SEARCH_DEPTH = 5
+MAX_API_PAGES = 50
+
+
+def _location_text(value) -> list[str]:
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    if isinstance(value, dict):
+        for key in ("name", "city", "label", "text", "location"):
+            if isinstance(value.get(key), str):
+                return _location_text(value[key])
+        return []
+    if isinstance(value, list):
+        return [text for item in value for text in _location_text(item)]
+    return []
+
+
+def _first_str(item: dict, keys) -> str | None:
+    for key in keys:
+        value = item.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def _looks_like_job_list(path: list[str], items: list) -> bool:
+    dicts = [item for item in items if isinstance(item, dict)]
+    if not dicts or len(dicts) < len(items) * 0.8:
+        return False
+
+    complete = [
+        item for item in dicts if _first_str(item, TITLE_KEYS) and _first_str(item, URL_KEYS)
+    ]
+    if len(complete) < len(dicts) * 0.8:
+        return False
+
+    # Title + URL alone also fits menus and link lists (even with /careers/
+    # URLs): ask for job fields or a job-ish key path
+    if any(_JOBISH_RE.search(key) for key in path):
+        return True
+    return any(JOB_FIELD_HINTS & item.keys() for item in complete)
+
+
+def find_job_list(data) -> list[dict] | None:
+    """The largest list of job-like objects anywhere in a JSON payload."""
+    best = None
+    stack = [(data, [], 0)]
+    while stack:
+        node, path, depth = stack.pop()
+        if isinstance(node, list):
+            if _looks_like_job_list(path, node) and (best is None or len(node) > len(best)):
+                best = node
+            elif depth < MAX_SEARCH_DEPTH:
+                stack.extend((item, path, depth + 1) for item in node[:50])
+        elif isinstance(node, dict) and depth < MAX_SEARCH_DEPTH:
+            stack.extend((value, path + [key], depth + 1) for key, value in node.items())
+    return best
+
+
+def jobs_from_items(items: list[dict], base_url: str) -> list[dict]:
+    jobs = []
+    for item in items:
+        title = _first_str(item, TITLE_KEYS)
+        link = _first_str(item, URL_KEYS)
+        if not title or not link:
+            continue
+
+        locations = []
+        for key in LOCATION_KEYS:
+            locations.extend(_location_text(item.get(key)))
+
+        jobs.append(
+            {
+                "title": title,
+                "link": urljoin(base_url, link),
+                "locations": locations,
+            }
+        )
+    return jobs
+
+
+def _find_total(payload) -> int | None:
+    nodes = [payload]
+    if isinstance(payload, dict):
+        nodes += [value for value in payload.values() if isinstance(value, dict)]
+    for node in nodes:
+        if not isinstance(node, dict):
+            continue
+        for key in TOTAL_KEYS:
+            value = node.get(key)
+            if isinstance(value, dict):
+                value = value.get("value")  # {"total": {"value": 120}} (Elasticsearch)
+            if isinstance(value, int) and not isinstance(value, bool) and value > 0:
+                return value
+    return None
+
+
+def _int_param(params: dict, keys):
+    for key in keys:
+        try:
+            return key, int(params[key])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return None, None
+
+
+class PaginationPlan:
+    """
+    Rebuilds a captured API request for later pages by bumping its page or
+    offset parameter, found in the query string or the JSON body.
+    """
+
+    def __init__(self, url: str, body: dict | None, in_query: bool, key: str, start: int, step: int):
+        self.url = url
+        self.body = body
+        self.in_query = in_query
+        self.key = key
+        self.start = start
+        self.step = step
+
+    @classmethod
+    def from_request(cls, url: str, post_data: str | None, first_page_size: int):
+        query = dict(parse_qsl(urlparse(url).query))
+        try:
+            body = json.loads(post_data) if post_data else None
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            body = None
+
+        for params, in_query in ((query, True), (body or {}, False)):
+            key, value = _int_param(params, PAGE_KEYS)
+            if key:
+                return cls(url, body, in_query, key, value, 1)
+
+            key, value = _int_param(params, OFFSET_KEYS)
+            if key:
+                _, limit = _int_param(params, LIMIT_KEYS)
+                return cls(url, body, in_query, key, value, limit or first_page_size)
+        return None
+
+    def request_for(self, page_index: int):
+        """(url, body) for the page `page_index` pages after the captured one."""
+        value = self.start + page_index * self.step
+        if not self.in_query:
+            return self.url, json.dumps({**self.body, self.key: value})
+
+        parts = urlparse(self.url)
+        query = dict(parse_qsl(parts.query))
+        query[self.key] = str(value)
+        url = urlunparse(parts._replace(query=urlencode(query)))
+        return url, json.dumps(self.body) if self.body is not None else None
+
+
+async def _count_job_anchors(page) -> int:
+    """Distinct job-looking links on the rendered page."""
+    try:
+        return await page.eval_on_selector_all(
+            JOB_ANCHOR_SELECTOR, "anchors => new Set(anchors.map(a => a.href)).size"
+        )
+    except Exception:
+        return 0
+
+
+class ListingCapture:
+    """
+    Listens to a page's XHR/fetch responses while it renders and keeps the
+    JSON payloads that look like job lists.
+    """
+
+    def __init__(self, page, base_url: str):
+        self.page = page
+        self.base_url = base_url
+        self._pending = set()
+        self._captured = []  # (response, payload, job items)
+
+    def start(self):
+        self.page.on("response", self._on_response)
+
+    def stop(self):
+        try:
+            self.page.remove_listener("response", self._on_response)
+        except Exception:
+            pass
+        for task in list(self._pending):
+            task.cancel()
+
+    def _on_response(self, response):
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        task = asyncio.create_task(self._read(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response):
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        items = find_job_list(data)
+        if items:
+            self._captured.append((response, data, items))
+
+    async def collect(self) -> list[dict] | None:
+        """
+        Jobs from the largest captured job list, with its pagination API
+        followed to the end. None when nothing job-like was captured, or
+        fewer jobs than the page links to (then the HTML is read instead).
+        """
+        if self._pending:
+            await asyncio.wait(list(self._pending), timeout=5)
+        if not self._captured:
+            return None
+
+        response, data, items = max(self._captured, key=lambda c: len(c[2]))
+        request = response.request
+        jobs = jobs_from_items(items, self.base_url)
+        log(f"🛰️ Captured {len(jobs)} jobs from {request.url}", "DEBUG")
+
+        plan = PaginationPlan.from_request(request.url, request.post_data, len(items))
+        if plan:
+            jobs.extend(await self._follow_pagination(request, plan, data, jobs))
+
+        anchors = await _count_job_anchors(self.page)
+        if len(jobs) < anchors:
+            log(
+                f"🛰️ Captured {len(jobs)} jobs but the page links to {anchors}, "
+                "reading its HTML instead",
+                "DEBUG",
+            )
+            return None
+        return jobs
+
+    async def _follow_pagination(self, request, plan: PaginationPlan, first_payload, jobs):
+        total = _find_total(first_payload)
+        seen = {job["link"] for job in jobs}
+        headers = {
+            key: value
+            for key, value in request.headers.items()
+            if key.lower() not in ("content-length", "host")
+        }
+        more = []
+
+        for page_index in range(1, MAX_API_PAGES):
+            if total and len(seen) >= total:
+                break
+
+            url, body = plan.request_for(page_index)
+            try:
+                response = await self.page.request.fetch(
+                    url, method=request.method, headers=headers, data=body
+                )
+                if not response.ok:
+                    break
+                items = find_job_list(await response.json()) or []
+            except Exception as e:
+                log(f"⚠️ Stopped following listing API at {url}: {e}", "DEBUG")
+                break
+
+            new_jobs = [
+                job for job in jobs_from_items(items, self.base_url) if job["link"] not in seen
+            ]
+            if not new_jobs:
+                break
+            seen.update(job["link"] for job in new_jobs)
+            more.extend(new_jobs)
+
+        if more:
+            log(f"🛰️ Followed listing API for {len(more)} more jobs", "DEBUG")
+        return more
@@ -1,7 +1,48 @@
 import re
 from typing import Tuple, List
+from job_hunter.constants import LOCATION_ALIASES
+from job_hunter.keyword_matcher import KeywordMatcher
 from job_hunter.utils.log import log
-from job_hunter.utils.utils import contains_whole_word, match_words
+
+
+def compile_matchers(config) -> dict:
+    """
+    Precompiles every keyword list in `config` into a KeywordMatcher.
+    Called once by build_config(); the matchers below read config["matchers"].
+    """
+    exclude_keywords = list(config["exclude_keywords"])
+    include_keywords = list(config["include_keywords"])
+
+    # Description fallback for locations: each blocked location is its own alias
+    location_aliases = dict(LOCATION_ALIASES)
+    for loc in sorted(config["blocked_locations"]):
+        location_aliases[loc] = [loc]
+
+    all_locations = set(
+        list(config["allowed_locations"])
+        + list(config["blocked_locations"])
+        + list(config["other_locations"])
+        + list(location_aliases.keys())
+    )
+    canonical_locations = [
+        (canonical, aliases)
+        for canonical, aliases in location_aliases.items()
+        if canonical in all_locations
+    ]
+
+    return {
+        "exclude_titles": KeywordMatcher(config["exclude_titles"]),
+        "blocked_locations": KeywordMatcher(config["blocked_locations"]),
+        "exclude_keywords": KeywordMatcher(exclude_keywords),
+        "include_keywords": KeywordMatcher(include_keywords),
+        "all_keywords": KeywordMatcher(
+            exclude_keywords + include_keywords + list(config["other_keywords"])
+        ),
+        "location_aliases": KeywordMatcher(
+            alias for _, aliases in canonical_locations for alias in aliases
+        ),
+        "canonical_locations": canonical_locations,
+    }
 
 
 def title_matches_include_groups(title, include_title_groups):
@@ -20,26 +61,25 @@ def match_title(title, config) -> bool:
         log(f"🚨 title is empty", "DEBUG")
         return False
 
+    matchers = config["matchers"]
+
     # Exclusion: title contains exclude_titles
-    exclude_titles = config["exclude_titles"]
-    for exclude_title in exclude_titles:
-        if contains_whole_word(title, exclude_title):
-            log(f"🚨 excluded title found in title: '{exclude_title}'", "DEBUG")
-            return False
+    exclude_title = matchers["exclude_titles"].first(title)
+    if exclude_title:
+        log(f"🚨 excluded title found in title: '{exclude_title}'", "DEBUG")
+        return False
 
     # Exclusion: title contains blocked_locations
-    blocked_locations = config["blocked_locations"]
-    for loc in blocked_locations:
-        if contains_whole_word(title, loc):
-            log(f"🚨 blocked location found in title: '{loc}'", "DEBUG")
-            return False
+    loc = matchers["blocked_locations"].first(title)
+    if loc:
+        log(f"🚨 blocked location found in title: '{loc}'", "DEBUG")
+        return False
 
     # Exclusion: title contains exclude_keywords
-    exclude_keywords = config["exclude_keywords"]
-    for keyword in exclude_keywords:
-        if contains_whole_word(title, keyword):
-            log(f"🚨 excluded keyword found in title: '{keyword}'", "DEBUG")
-            return False
+    keyword = matchers["exclude_keywords"].first(title)
+    if keyword:
+        log(f"🚨 excluded keyword found in title: '{keyword}'", "DEBUG")
+        return False
 
     # Inclusion: title contains include_titles
     include_title_groups = config["include_titles"]
@@ -109,26 +149,27 @@ def match_description(description, config) -> Tuple[bool, List[str], List[str]]:
         log(f"🚨 description is empty", "DEBUG")
         return False, [], []
 
+    matchers = config["matchers"]
+
     # Exclusion: description contains exclude_keywords
-    exclude_keywords = config["exclude_keywords"]
-    # for keyword in exclude_keywords:
-    #     if contains_whole_word(description, keyword):
-    #         log(f"🚨 excluded keyword found in description: '{keyword}'", "DEBUG")
-    #         return False, [], []
+    # keyword = matchers["exclude_keywords"].first(description)
+    # if keyword:
+    #     log(f"🚨 excluded keyword found in description: '{keyword}'", "DEBUG")
+    #     return False, [], []
 
     # Inclusion: description contains include_keywords
-    include_keywords = config["include_keywords"]
-    matched_keywords = match_words(description, include_keywords)
+    matched_keywords = matchers["include_keywords"].match_words(description)
     log(
-        f"🔑 Keywords matched ({len(matched_keywords)}): {matched_keywords}",
+        "🔑 Keywords matched (%d): %s",
         "DEBUG",
+        len(matched_keywords),
+        matched_keywords,
     )
     if len(matched_keywords) == 0:
         log("🚨 description has no include_keywords", "DEBUG")
         return False, [], []
 
-    all_keywords = exclude_keywords + include_keywords + config["other_keywords"]
-    extracted_keywords = match_words(description, all_keywords)
+    extracted_keywords = matchers["all_keywords"].match_words(description)
 
     log("✅ description passed all checks", "DEBUG")
     return True, matched_keywords, extracted_keywords
@@ -146,7 +187,7 @@ def match_locations(job_details, config) -> Tuple[bool, List[str]]:
         log("🚨 no extracted locations", "DEBUG")
         return False, []
 
-    # Exclusion: extracted_locations contains blocked_locations
+    # Exclusion: extracted_locations contains blocked_locations (a frozenset)
     blocked_locations = config["blocked_locations"]
     for extracted_location in extracted_locations:
         if extracted_location in blocked_locations:
@@ -158,11 +199,14 @@ def match_locations(job_details, config) -> Tuple[bool, List[str]]:
 
     # Inclusion: extracted_locations contains allowed_locations
     allowed_locations = config["allowed_locations"]
-    matched_locations = [loc for loc in allowed_locations if loc in all_extracted_locations]
+    extracted_set = set(all_extracted_locations)
+    matched_locations = [loc for loc in allowed_locations if loc in extracted_set]
     if len(matched_locations) == 0:
         log(
-            f"🚨 no allowed locations found in extracted locations: '{all_extracted_locations}' (expected one of {allowed_locations})",
+            "🚨 no allowed locations found in extracted locations: '%s' (expected one of %s)",
             "DEBUG",
+            all_extracted_locations,
+            allowed_locations,
         )
         return False, []
 
@@ -0,0 +1,198 @@
+import contextvars
+import json
+import time
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from job_hunter.utils.log import log
+
+# Pipeline stages, in run order (others are reported after these)
+STAGES = (
+    "listing_fetch",
+    "show_more",
+    "extract_links",
+    "match_job_url",
+    "match_title",
+    "detail_fetch",
+    "parse",
+    "match_description",
+    "match_locations",
+    "extract_yoe",
+    "score",
+    "csv_write",
+    "csv_export",
+)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# Company being crawled; set once per company task and inherited by the
+# tasks it spawns, so deep call sites don't have to pass it around
+_current_company: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_company", default=None
+)
+
+
+class StageStats:
+    """Latency samples and byte count of one stage (for one breakdown key)."""
+
+    def __init__(self):
+        self.seconds: list[float] = []
+        self.bytes = 0
+
+    def add(self, seconds: float, nbytes: int):
+        self.seconds.append(seconds)
+        self.bytes += nbytes
+
+    def summary(self) -> dict:
+        samples = sorted(self.seconds)
+        return {
+            "count": len(samples),
+            "total_seconds": round(sum(samples), 3),
+            **{
+                f"p{int(q * 100)}_seconds": round(_quantile(samples, q), 4)
+                for q in QUANTILES
+            },
+            "bytes": self.bytes,
+        }
+
+
+def _quantile(samples: list[float], q: float) -> float:
+    """Nearest-rank quantile of sorted samples."""
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+# stage -> StageStats, and the same per company / per host
+_stages: dict[str, StageStats] = {}
+_by_company: dict[str, dict[str, StageStats]] = {}
+_by_host: dict[str, dict[str, StageStats]] = {}
+
+
+def reset_metrics():
+    _stages.clear()
+    _by_company.clear()
+    _by_host.clear()
+
+
+def set_current_company(company: str | None):
+    """Attributes stages recorded from the current task (and its children)."""
+    _current_company.set(company)
+
+
+def record_stage(stage: str, seconds: float, nbytes: int = 0, url: str | None = None):
+    _stages.setdefault(stage, StageStats()).add(seconds, nbytes)
+
+    company = _current_company.get()
+    if company:
+        _by_company.setdefault(company, {}).setdefault(stage, StageStats()).add(
+            seconds, nbytes
+        )
+
+    host = urlparse(url).netloc.lower() if url else None
+    if host:
+        _by_host.setdefault(host, {}).setdefault(stage, StageStats()).add(
+            seconds, nbytes
+        )
+
+
+@contextmanager
+def timed(stage: str, url: str | None = None):
+    """
+    Times the block as one `stage` sample. Set `sample["bytes"]` inside the
+    block to count bytes:
+
+      with timed("detail_fetch", url) as sample:
+          html = ...
+          sample["bytes"] = len(html)
+    """
+    sample = {"bytes": 0}
+    started = time.perf_counter()
+    try:
+        yield sample
+    finally:
+        record_stage(stage, time.perf_counter() - started, sample["bytes"], url)
+
+
+def _ordered(stages: dict) -> list[str]:
+    known = [stage for stage in STAGES if stage in stages]
+    return known + sorted(stage for stage in stages if stage not in STAGES)
+
+
+def _summaries(stages: dict[str, StageStats]) -> dict:
+    return {stage: stages[stage].summary() for stage in _ordered(stages)}
+
+
+def _total_seconds(stages: dict[str, StageStats]) -> float:
+    return sum(sum(stats.seconds) for stats in stages.values())
+
+
+def build_metrics_report() -> dict:
+    by_company = sorted(_by_company.items(), key=lambda kv: -_total_seconds(kv[1]))
+    by_host = sorted(_by_host.items(), key=lambda kv: -_total_seconds(kv[1]))
+    return {
+        "stages": _summaries(_stages),
+        # slowest first (summed stage time, not wall time: stages overlap)
+        "companies": {company: _summaries(stages) for company, stages in by_company},
+        "hosts": {host: _summaries(stages) for host, stages in by_host},
+    }
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_series(lines: list[str], labels: str, stats: StageStats):
+    samples = sorted(stats.seconds)
+    for q in QUANTILES:
+        lines.append(
+            f'job_hunter_stage_seconds{{{labels},quantile="{q}"}} '
+            f"{_quantile(samples, q):.6f}"
+        )
+    lines.append(f"job_hunter_stage_seconds_sum{{{labels}}} {sum(samples):.6f}")
+    lines.append(f"job_hunter_stage_seconds_count{{{labels}}} {len(samples)}")
+    lines.append(f"job_hunter_stage_bytes_total{{{labels}}} {stats.bytes}")
+
+
+def build_prometheus_text() -> str:
+    lines = [
+        "# HELP job_hunter_stage_seconds Time spent per pipeline stage.",
+        "# TYPE job_hunter_stage_seconds summary",
+    ]
+    for stage in _ordered(_stages):
+        _prometheus_series(lines, f'stage="{_label(stage)}"', _stages[stage])
+    for key, breakdown in (("company", _by_company), ("host", _by_host)):
+        for name, stages in breakdown.items():
+            for stage in _ordered(stages):
+                labels = f'stage="{_label(stage)}",{key}="{_label(name)}"'
+                _prometheus_series(lines, labels, stages[stage])
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics_report(json_path: str, prometheus_path: str):
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(build_metrics_report(), f, indent=2, ensure_ascii=False)
+    with open(prometheus_path, "w", encoding="utf-8") as f:
+        f.write(build_prometheus_text())
+    log(f"📊 Metrics written to {json_path} and {prometheus_path}")
+
+
+def log_metrics_summary(slowest: int = 5):
+    if not _stages:
+        return
+
+    log("⏱️ Stage timings (count, p50 / p95 / p99):")
+    for stage in _ordered(_stages):
+        s = _stages[stage].summary()
+        log(
+            f"   {stage}: {s['count']}x, {s['p50_seconds'] * 1000:.0f} / "
+            f"{s['p95_seconds'] * 1000:.0f} / {s['p99_seconds'] * 1000:.0f} ms, "
+            f"{s['total_seconds']:.1f}s total"
+            + (f", {s['bytes'] // 1024} KB" if s["bytes"] else "")
+        )
+
+    companies = sorted(_by_company.items(), key=lambda kv: -_total_seconds(kv[1]))
+    if companies:
+        log("🐢 Slowest companies (summed stage time):")
+        for company, stages in companies[:slowest]:
+            log(f"   {company}: {_total_seconds(stages):.1f}s")
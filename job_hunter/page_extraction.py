@@ -0,0 +1,183 @@
+from urllib.parse import urljoin
+
+from job_hunter.utils.log import log
+
+# Shared helpers, mirroring BeautifulSoup so in-page results match the
+# Python extractors:
+#   textOf(el) == el.get_text(separator=" ", strip=True). BeautifulSoup types
+#   each string by its nearest <script>/<style>/<template>/<rt>/<rp> ancestor
+#   and get_text keeps only strings of the element's own type, so page text
+#   skips scripts while a <script> element still returns its own source.
+#   codePoints(s) == len(s) (Python counts code points, JS UTF-16 units)
+_HELPERS_JS = """
+    const TEXT_CONTAINERS = new Set(["SCRIPT", "STYLE", "TEMPLATE", "RT", "RP"]);
+    const TEXT_CONTAINER_SELECTOR = "script, style, template, rt, rp";
+
+    const textOf = (root) => {
+        const ownType = TEXT_CONTAINERS.has(root.tagName) ? root.tagName : null;
+        if (!ownType && root.nodeType === 1 && root.closest(TEXT_CONTAINER_SELECTOR)) return "";
+
+        const parts = [];
+        const stack = [[root, ownType]];
+        while (stack.length) {
+            const [node, type] = stack.pop();
+            if (node.nodeType === 3) {
+                const text = type === ownType ? node.data.trim() : "";
+                if (text) parts.push(text);
+                continue;
+            }
+            for (let i = node.childNodes.length - 1; i >= 0; i--) {
+                const child = node.childNodes[i];
+                if (child.nodeType === 3) {
+                    stack.push([child, type]);
+                } else if (child.nodeType === 1) {
+                    stack.push([child, TEXT_CONTAINERS.has(child.tagName) ? child.tagName : type]);
+                }
+            }
+        }
+        return parts.join(" ");
+    };
+
+    const codePoints = (s) => [...s].length;
+"""
+
+# Same as extractor.extract_job_links: anchors with their own text as title,
+# or the best-scoring h*/p/span candidate up to 4 ancestors up.
+# Returns [[title, href], ...]; hrefs are resolved in Python.
+_LISTING_JS = (
+    """
+() => {
+"""
+    + _HELPERS_JS
+    + """
+    const TITLE_CANDIDATE_TAGS = new Set(["H1", "H2", "H3", "H4", "H5", "H6", "P", "SPAN"]);
+    const WEAK_ANCHOR_TEXTS = new Set(["apply", "apply now", "view job"]);
+
+    const scoreCandidate = (el) => {
+        const text = textOf(el);
+        if (!text || codePoints(text) < 6) return null;
+        if (text.toLowerCase().includes("apply")) return null;
+
+        let score = 0;
+        if (el.tagName.startsWith("H")) score += 100;
+        score += Math.min(codePoints(text), 60);
+        if (text.split(/\\s+/).filter(Boolean).length <= 2) score -= 20;
+        if (text === text.toUpperCase() && text !== text.toLowerCase()) score -= 10;
+        return [score, text];
+    };
+
+    // Best candidate among a node's descendants, first in document order
+    // winning ties. Memoized so each element is scored once per page, and
+    // walked iteratively (post-order) so deep SPA DOMs can't overflow the stack.
+    const best = new Map();
+    const own = new Map();
+    const bestTitleIn = (container) => {
+        if (best.has(container)) return best.get(container);
+
+        const stack = [[container, false]];
+        while (stack.length) {
+            const [node, childrenDone] = stack.pop();
+            if (best.has(node)) continue;
+
+            const children = node.children;
+            if (!childrenDone) {
+                stack.push([node, true]);
+                for (let i = children.length - 1; i >= 0; i--) {
+                    if (!best.has(children[i])) stack.push([children[i], false]);
+                }
+                continue;
+            }
+
+            let result = null;
+            for (const child of children) {
+                // The child itself comes before its descendants in document order
+                if (TITLE_CANDIDATE_TAGS.has(child.tagName)) {
+                    if (!own.has(child)) own.set(child, scoreCandidate(child));
+                    const candidate = own.get(child);
+                    if (candidate && candidate[0] > (result ? result[0] : -1)) result = candidate;
+                }
+                const below = best.get(child);
+                if (below && below[0] > (result ? result[0] : -1)) result = below;
+            }
+            best.set(node, result);
+        }
+        return best.get(container);
+    };
+
+    const links = [];
+    for (const a of document.querySelectorAll("a[href]")) {
+        const href = a.getAttribute("href");
+        if (!href) continue;
+
+        const anchorText = textOf(a);
+        let title = null;
+        if (!WEAK_ANCHOR_TEXTS.has(anchorText.toLowerCase()) && codePoints(anchorText) >= 6) {
+            title = anchorText;
+        }
+
+        if (!title) {
+            let parent = a.parentNode;
+            for (let i = 0; i < 4 && parent; i++) {
+                const candidate = bestTitleIn(parent);
+                if (candidate) {
+                    title = candidate[1];
+                    break;
+                }
+                parent = parent.parentNode;
+            }
+        }
+
+        if (title) links.push([title, href]);
+    }
+    return links;
+}
+"""
+)
+
+# Same as extractor.parse_job_details up to build_job_details: footers
+# removed, whole-page text, and the text of every [class*=location] element
+# with its <svg> icons removed. Works on a clone, the live page is untouched.
+_DETAIL_JS = (
+    """
+() => {
+"""
+    + _HELPERS_JS
+    + """
+    const root = document.documentElement.cloneNode(true);
+
+    for (const el of root.querySelectorAll('[class*="footer"], [class*="Footer"], [class*="FOOTER"]')) {
+        el.remove();
+    }
+    for (const el of root.querySelectorAll("footer")) {
+        el.remove();
+    }
+
+    const text = textOf(root);
+
+    const locations = [];
+    for (const el of root.querySelectorAll('[class*="location"], [class*="Location"], [class*="LOCATION"]')) {
+        // Inside an <svg> removed for an earlier match (decomposed, so empty in Python)
+        if (!root.contains(el)) {
+            locations.push("");
+            continue;
+        }
+        for (const svg of el.querySelectorAll("svg")) svg.remove();
+        locations.push(textOf(el));
+    }
+    return {text, locations};
+}
+"""
+)
+
+
+async def extract_listing_in_page(page, base_url: str) -> list[dict]:
+    """`extract_job_links` run inside the page; only the links cross over."""
+    links = await page.evaluate(_LISTING_JS)
+    jobs = [{"title": title, "link": urljoin(base_url, href)} for title, href in links]
+    log(f"📦 Raw job links found in page: {len(jobs)}")
+    return jobs
+
+
+async def extract_detail_in_page(page) -> dict:
+    """Description text and raw location texts, read inside the page."""
+    return await page.evaluate(_DETAIL_JS)
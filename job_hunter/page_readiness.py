@@ -0,0 +1,133 @@
+import time
+
+from job_hunter.utils.log import log
+
+DEFAULT_POLICY = {
+    "quiet_ms": 500,  # no DOM mutations / finished requests for this long = stable
+    "max_ms": 10000,  # upper bound on waiting for a page
+}
+
+_policy = dict(DEFAULT_POLICY)
+
+# 🔑 Run-wide totals for the end-of-run summary
+READINESS_STATS = {"pages": 0, "total_ms": 0.0, "max_ms": 0.0, "reasons": {}}
+
+# Runs inside the page, so waiting costs one round trip instead of polling
+# from Python. Resolves once the page is stable:
+#   - "selector": a job selector matched and the DOM/network have been quiet
+#     for quietMs
+#   - "quiet": no selector matched, but the document finished loading and
+#     has been quiet for 3 * quietMs
+#   - "timeout": maxMs passed first
+_WAIT_FOR_READY_JS = """
+({selectors, quietMs, maxMs}) => new Promise((resolve) => {
+    const start = performance.now();
+    let lastActivity = start;
+    const touch = () => { lastActivity = performance.now(); };
+
+    const mutations = new MutationObserver(touch);
+    mutations.observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true,
+    });
+
+    let network = null;
+    try {
+        network = new PerformanceObserver(touch);
+        network.observe({type: "resource"});
+    } catch (e) {}
+
+    const combined = selectors.join(", ");
+    const matchedSelector = () => {
+        if (!combined) return null;
+        try {
+            if (!document.querySelector(combined)) return null;
+        } catch (e) {
+            return null;
+        }
+        return selectors.find((s) => {
+            try { return document.querySelector(s); } catch (e) { return false; }
+        }) || null;
+    };
+
+    const finish = (reason, selector) => {
+        clearInterval(timer);
+        mutations.disconnect();
+        if (network) network.disconnect();
+        resolve({reason, selector, ms: performance.now() - start});
+    };
+
+    const timer = setInterval(() => {
+        const now = performance.now();
+        const quietFor = now - lastActivity;
+        const selector = matchedSelector();
+
+        if (selector && quietFor >= quietMs) return finish("selector", selector);
+        if (document.readyState === "complete" && quietFor >= quietMs * 3)
+            return finish("quiet", null);
+        if (now - start >= maxMs) return finish("timeout", selector);
+    }, 50);
+})
+"""
+
+
+def set_readiness_policy(quiet_ms=None, max_ms=None):
+    if quiet_ms is not None:
+        _policy["quiet_ms"] = quiet_ms
+    if max_ms is not None:
+        _policy["max_ms"] = max_ms
+
+
+async def wait_until_ready(page, url: str, selectors=None, max_ms=None) -> str:
+    """
+    Waits until `page` has stabilized: all `selectors` are raced at once,
+    and DOM mutations plus finished network requests are watched until the
+    page has been quiet for a while. Never waits longer than `max_ms`.
+
+    Returns the reason it stopped waiting ("selector" / "quiet" / "timeout"
+    / "navigated"). NEVER throws.
+    """
+    max_ms = max_ms or _policy["max_ms"]
+    started = time.perf_counter()
+
+    try:
+        result = await page.evaluate(
+            _WAIT_FOR_READY_JS,
+            {
+                "selectors": list(selectors or []),
+                "quietMs": _policy["quiet_ms"],
+                "maxMs": max_ms,
+            },
+        )
+        reason = result["reason"]
+        detail = f" ({result['selector']})" if result.get("selector") else ""
+    except Exception:
+        # Client-side redirect destroyed the context: wait for the new document
+        reason, detail = "navigated", ""
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=max_ms)
+        except Exception:
+            pass
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    READINESS_STATS["pages"] += 1
+    READINESS_STATS["total_ms"] += elapsed_ms
+    READINESS_STATS["max_ms"] = max(READINESS_STATS["max_ms"], elapsed_ms)
+    READINESS_STATS["reasons"][reason] = READINESS_STATS["reasons"].get(reason, 0) + 1
+
+    log(f"⏱️ Ready in {elapsed_ms:.0f} ms via {reason}{detail}: {url}", "DEBUG")
+    return reason
+
+
+def log_readiness_summary():
+    pages = READINESS_STATS["pages"]
+    if not pages:
+        return
+
+    reasons = ", ".join(
+        f"{reason}={count}" for reason, count in sorted(READINESS_STATS["reasons"].items())
+    )
+    log(
+        f"⏱️ Page readiness: {pages} waits, avg "
+        f"{READINESS_STATS['total_ms'] / pages:.0f} ms, max "
+        f"{READINESS_STATS['max_ms']:.0f} ms ({reasons})"
+    )
@@ -1,92 +1,524 @@
 import csv
+import os
 import time
 import re
 import asyncio
-import os
+from collections import Counter, deque
 
 from job_hunter.config import build_config
-from job_hunter.crawler import fetch_html
-from job_hunter.extractor import (
-    extract_job_links,
-    extract_job_details_and_locations,
-    extract_yoe_from_description,
+from job_hunter.adapters import get_adapter
+from job_hunter.browser_pool import start_browser_pool, stop_browser_pool
+from job_hunter.crawl_archive import open_crawl_archive, close_crawl_archive
+from job_hunter.cpu_pool import start_cpu_pool, stop_cpu_pool, run_cpu
+from job_hunter.crawler import (
+    fetch_job_detail,
+    fetch_listing,
+    set_browser_extraction,
+    set_http_fast_path,
+)
+from job_hunter.metrics import (
+    log_metrics_summary,
+    record_stage,
+    reset_metrics,
+    set_current_company,
+    timed,
+    write_metrics_report,
+)
+from job_hunter.host_scheduler import start_host_scheduler, stop_host_scheduler
+from job_hunter.html_cache import open_html_cache, close_html_cache
+from job_hunter.html_parser import set_parser_backend
+from job_hunter.page_readiness import set_readiness_policy, log_readiness_summary
+from job_hunter.http_fetcher import start_http_client, stop_http_client
+from job_hunter.resource_policy import set_resource_policy, log_resource_summary
+from job_hunter.single_flight import SingleFlight
+from job_hunter.retry_policy import (
+    log_retry_summary,
+    set_retry_policy,
+    wait_for_circuit,
 )
-from job_hunter.matcher import (
-    is_company_blocked,
-    match_title,
-    match_job_detail_url,
-    match_description,
-    match_locations,
-    calculate_score,
+from job_hunter.extractor import extract_job_links
+from job_hunter.job_analysis import analyze_job
+from job_hunter.matcher import is_company_blocked, match_title, match_job_detail_url
+from job_hunter.utils.log import (
+    log,
+    set_file_log_level,
+    set_log_format,
+    set_log_level,
 )
-from job_hunter.utils.log import log, set_log_level
-from job_hunter.utils.utils import clean_string_value
+from job_hunter.utils.utils import clean_string_value, normalize_url
 from job_hunter.constants import (
     JobCSVField,
     ErrorCSVField,
     CompanyWithZeroLinksCSVField,
 )
-from job_hunter.helpers import (
-    sort_csv_in_place,
-    load_existing_job_links,
-    load_companies_from_output_file,
-)
+from job_hunter.job_store import JobStore, store_path_for
 
 failed_companies = []
 error_file = "jobs_error.csv"
 companies_with_zero_links = []
 companies_with_zero_links_file = "companies_with_zero_links.csv"
 
-# 🔑 GLOBAL CONCURRENCY LIMIT
+# 🔑 GLOBAL CONCURRENCY LIMIT (sized from config["job_concurrency"] per run)
 JOB_SEMAPHORE = asyncio.Semaphore(20)
 
+# Outcome of a job check whose detail page couldn't be fetched (retried on --resume)
+JOB_FETCH_FAILED = "JOB_FETCH_FAILED"
+
+
+def open_side_csv(path: str, fields, resume: bool):
+    """
+    Opens a side CSV (errors, zero-link companies) for the run: overwritten
+    by a fresh run, appended to by a resumed one. `fields` is its CSV field
+    enum. Returns the file, its writer and the companies of the rows it
+    already had.
+    """
+    existing_companies = []
+    if resume and os.path.exists(path):
+        with open(path, newline="", encoding="utf-8") as f:
+            existing_companies = [
+                row.get(fields.COMPANY.value) for row in csv.DictReader(f)
+            ]
+
+    f = open(path, "a" if resume else "w", newline="", encoding="utf-8")
+    writer = csv.DictWriter(f, fieldnames=list(fields))
+    if f.tell() == 0:
+        writer.writeheader()
+    return f, writer, existing_companies
+
+
+async def run_pipeline(
+    input_file: str,
+    output_file: str,
+    cache_mode: str = "use",
+    record_dir: str | None = None,
+    replay_dir: str | None = None,
+    resume: bool = False,
+):
+    global JOB_SEMAPHORE
+    start_time = time.time()
+    config = build_config()
+    reset_metrics()
 
-async def run_pipeline(input_file: str, output_file: str):
+    set_file_log_level(config["log_file_level"])
+    set_log_format(config["log_format"])
     pattern = re.compile(r".*_test.*\.csv$")
     if bool(pattern.match(input_file)):
         log("Running in debug mode")
         set_log_level("DEBUG")
-
-    start_time = time.time()
-    config = build_config()
+        set_file_log_level("DEBUG")
 
     log("🚀 Job Hunter started")
+    log(f"⚙️ Config {config.content_hash[:12]}")
     log(f"📄 Streaming results to {output_file}")
 
-    # load existing jobs (append-only behavior)
-    existing_job_links = load_existing_job_links(output_file)
-    serial_no = len(existing_job_links) + 1
-    # csv_exists = bool(existing_job_links) # this is not working
+    # 🔑 Indexed job store; output_file is exported from it at the end
+    store = JobStore(store_path_for(output_file))
+    store.import_csv(output_file)
 
-    # open error file
-    error_csv = open(error_file, "w", newline="", encoding="utf-8")
-    error_writer = csv.DictWriter(
-        error_csv,
-        fieldnames=list(ErrorCSVField),
+    # 🔑 Checkpoints: a resumed run skips what the crashed run already finished
+    store.start_run(resume)
+    finished_companies = store.finished_companies() if resume else set()
+
+    # open error file (appended to when resuming)
+    error_csv, error_writer, errors_before = open_side_csv(
+        error_file, ErrorCSVField, resume
     )
-    error_writer.writeheader()
 
     # open companies_with_zero_links file
-    zero_links_csv = open(
-        companies_with_zero_links_file, "w", newline="", encoding="utf-8"
+    zero_links_csv, zero_links_csv_writer, zero_links_before = open_side_csv(
+        companies_with_zero_links_file, CompanyWithZeroLinksCSVField, resume
     )
-    zero_links_csv_writer = csv.DictWriter(
-        zero_links_csv,
-        fieldnames=list(CompanyWithZeroLinksCSVField),
+
+    # Companies a resumed run retries already have their rows from before
+    errors_written = set(errors_before)
+    zero_links_written = set(zero_links_before)
+
+    # 🔑 COMPANY-LEVEL CONCURRENCY LIMIT
+    company_semaphore = asyncio.Semaphore(config["company_concurrency"])
+
+    # Per-host limits keep this from piling onto a single ATS host
+    JOB_SEMAPHORE = asyncio.Semaphore(config["job_concurrency"])
+
+    # Run-wide: concurrent checks of one detail page share a single fetch + parse
+    detail_flight = SingleFlight(
+        "Job detail checks",
+        max_entries=config["detail_single_flight"]["max_entries"],
+        ttl_seconds=config["detail_single_flight"]["ttl_seconds"],
     )
-    zero_links_csv_writer.writeheader()
 
-    # open in append mode instead of write
-    with open(output_file, "a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(
-            csvfile,
-            fieldnames=list(JobCSVField),
+    # NOTE: writers below never await between writerow() and flush(), so rows
+    # from concurrently crawled companies can't interleave on the event loop.
+    def write_error_row(company, career_url, error):
+        failed_companies.append({"company": company, "error": error})
+        if company in errors_written:
+            return
+        errors_written.add(company)
+        error_writer.writerow(
+            {
+                ErrorCSVField.COMPANY.value: company,
+                ErrorCSVField.ERROR.value: error,
+                ErrorCSVField.CAREER_URL.value: career_url,
+            }
+        )
+        error_csv.flush()
+
+    def write_zero_links_row(company, career_url):
+        companies_with_zero_links.append(
+            {"company": company, "career_url": career_url}
+        )
+        if company in zero_links_written:
+            return
+        zero_links_written.add(company)
+        zero_links_csv_writer.writerow(
+            {
+                CompanyWithZeroLinksCSVField.S_NO.value: len(zero_links_written),
+                CompanyWithZeroLinksCSVField.COMPANY.value: company,
+                CompanyWithZeroLinksCSVField.CAREER_URL.value: career_url,
+            }
+        )
+        zero_links_csv.flush()
+
+    def write_job_row(result):
+        with timed("csv_write"):
+            added = store.add_job(result)
+        if added:
+            log("✅ Job written to store")
+
+    async def process_job(company, idx, jl):
+        if "description" not in jl:
+            # A host in its cool-down holds its jobs here, not in a job slot
+            await wait_for_circuit(jl.get("link"))
+
+        async with JOB_SEMAPHORE:
+            job_title = jl.get("title")
+            job_url = jl.get("link")
+
+            log(f"\n➡️ Job [{idx}] Title: {job_title}", "DEBUG")
+            log(f"🔗 Job URL: {job_url}", "DEBUG")
+
+            if resume and store.is_job_done(job_url):
+                log("⏭️ Skipped — job was checked before the run was resumed", "DEBUG")
+                return None
+
+            store.mark_job(job_url, company, "inflight")
+            result = await check_job(company, job_title, job_url, jl)
+            if result == JOB_FETCH_FAILED:
+                # Not checked: a resumed run tries it again
+                store.mark_job(job_url, company, "failed")
+                return None
+
+            if result:
+                write_job_row(result)
+            store.mark_job(job_url, company, "done")
+            return result
+
+    async def fetch_and_analyze(job_title, job_url):
+        # --- Step 2: Fetch the job description and job locations
+        text, locations = "", []
+        log("🌐 Fetching job detail page...", "DEBUG")
+        with timed("detail_fetch", job_url) as sample:
+            html, extracted, error = await fetch_job_detail(job_url)
+            if error:
+                return JOB_FETCH_FAILED
+            if extracted:
+                # Already extracted inside the browser
+                text, locations = extracted["text"], extracted["locations"]
+            sample["bytes"] = len(html or text)
+
+        return await analyze(job_title, job_url, html, text, locations)
+
+    async def analyze(job_title, job_url, html, text, locations):
+        # --- Step 3: Parse, match and score it in the CPU pool
+        analysis = await run_cpu(
+            analyze_job, job_title, html, text, locations, with_config=True
+        )
+        for stage, seconds, nbytes in analysis["timings"]:
+            record_stage(stage, seconds, nbytes, job_url)
+        return analysis
+
+    async def check_job(company, job_title, job_url, jl):
+        # --- Step 2: Fetch the job description and job locations
+        if "description" in jl:
+            # ATS adapters already return them from the board's API
+            analysis = await analyze(
+                job_title, job_url, None, jl.pop("description"), jl.get("locations", [])
+            )
+        else:
+            # 🔑 A page listed more than once in the run (another company, another
+            # anchor) is fetched and parsed once
+            analysis = await detail_flight.run(
+                normalize_url(job_url),
+                lambda: fetch_and_analyze(job_title, job_url),
+                keep=lambda analysis: analysis != JOB_FETCH_FAILED,
+            )
+            if analysis == JOB_FETCH_FAILED:
+                log("⏭️ Skipped — job detail page could not be fetched", "DEBUG")
+                return JOB_FETCH_FAILED
+
+        if analysis["skipped"] == "description":
+            log("⏭️ Skipped — description matching failed", "DEBUG")
+            return None
+        if analysis["skipped"] == "location":
+            log("⏭️ Skipped — location matching failed", "DEBUG")
+            return None
+
+        score = analysis["score"]
+        log(f"📈 Match score: {score}%", "DEBUG")
+
+        if score == 0:
+            log("⏭️ Skipped — score is 0", "DEBUG")
+            return None
+
+        yoe = analysis["yoe"]
+        extracted_keywords = analysis["extracted_keywords"]
+        extracted_locations = analysis["extracted_locations"]
+        all_extracted_locations = analysis["all_extracted_locations"]
+
+        return {
+            JobCSVField.COMPANY.value: clean_string_value(company),
+            JobCSVField.JOB_TITLE.value: clean_string_value(job_title),
+            JobCSVField.JOB_LINK.value: clean_string_value(job_url),
+            JobCSVField.YOE.value: yoe if yoe is not None else "",
+            JobCSVField.MATCH_PERCENTAGE.value: score,
+            JobCSVField.EXTRACTED_KEYWORDS.value: clean_string_value(
+                ", ".join(extracted_keywords)
+            ),
+            JobCSVField.EXTRACTED_LOCATIONS.value: clean_string_value(
+                ", ".join(
+                    extracted_locations
+                    if len(extracted_locations) > 0
+                    else all_extracted_locations
+                )
+            ),
+        }
+
+    def filter_job_links(company, job_links):
+        """
+        Cheap checks on a listing's links before any job task is queued:
+        normalized-URL dedupe within the listing, then the job detail URL,
+        existing-job and title filters. Logs how many links each one dropped.
+        """
+        kept = []
+        seen = set()
+        skipped = Counter()
+
+        for jl in job_links:
+            raw_url = jl.get("link")
+            job_url = normalize_url(raw_url)
+
+            if job_url in seen:
+                skipped["duplicate"] += 1
+                continue
+            seen.add(job_url)
+
+            with timed("match_job_url", job_url):
+                is_job_url = match_job_detail_url(job_url, config)
+            if not is_job_url:
+                skipped["not a job detail URL"] += 1
+                continue
+
+            # Older runs stored links as listed, before normalization
+            if store.has_job(job_url) or store.has_job(raw_url):
+                skipped["already in store"] += 1
+                continue
+
+            with timed("match_title", job_url):
+                is_title_match = match_title(jl.get("title"), config)
+            if not is_title_match:
+                skipped["title"] += 1
+                continue
+
+            jl["link"] = job_url
+            kept.append(jl)
+
+        reasons = ", ".join(f"{reason}: {count}" for reason, count in skipped.items())
+        log(
+            f"🧹 {company}: {len(kept)} of {len(job_links)} job links left to check"
+            + (f" (skipped — {reasons})" if reasons else "")
+        )
+        return kept
+
+    async def process_company(company_index, company, career_url):
+        log(f"🏢 [{company_index}] Company: {company}")
+        log(f"🔗 Career URL: {career_url}")
+        set_current_company(company)
+        store.set_company_status(company, career_url, "running")
+
+        job_links = store.saved_job_links(company) if resume else None
+        if job_links is not None:
+            log(f"♻️ Reusing the {len(job_links)} job links of {company} read before the resume")
+        else:
+            job_links = await read_job_links(company, career_url)
+            if job_links is None:
+                return
+            job_links = filter_job_links(company, job_links)
+            store.save_job_links(company, job_links)
+
+        log(
+            f"⚙️ Processing {len(job_links)} job links of {company} in parallel",
+            "DEBUG",
+        )
+
+        # 🔑 A few workers drain the company's queue instead of one task per link:
+        # pending links stay plain dicts, and each job's description is dropped
+        # as soon as it was scored. Matched jobs are written (and checkpointed)
+        # as each one finishes.
+        queue = deque(enumerate(job_links, start=1))
+        job_links.clear()
+
+        async def job_worker():
+            while queue:
+                idx, jl = queue.popleft()
+                await process_job(company, idx, jl)
+
+        workers = min(config["job_workers_per_company"], len(queue))
+        await asyncio.gather(*(job_worker() for _ in range(workers)))
+
+        if store.count_jobs(company) == 0:
+            write_zero_links_row(company, career_url)
+            log(f"⚠️ Zero job links found for company {company}")
+
+        store.set_company_status(company, career_url, "done")
+        log(f"✅ Company {company} completed")
+
+    async def read_job_links(company, career_url):
+        """Job links of a company's listing, or None once its status was recorded."""
+        adapter_name, adapter = (
+            get_adapter(career_url) if config["ats_adapters"] else (None, None)
         )
 
-        # write header only if file is new
-        if not os.path.exists(output_file):
-            writer.writeheader()
+        if adapter:
+            # --- Step 1: Read job links (with details) from the ATS API
+            log(f"🧩 Using {adapter_name} adapter for {company}")
+
+            def title_filter(title):
+                with timed("match_title", career_url):
+                    return match_title(title, config)
+
+            with timed("listing_fetch", career_url):
+                job_links, error = await adapter(career_url, title_filter=title_filter)
+            if error:
+                log(f"⚠️ Failed to crawl company {company} — {error}")
+                write_error_row(company, career_url, error)
+                write_zero_links_row(company, career_url)
+                store.set_company_status(company, career_url, "failed", error)
+                return None
+        else:
+            with timed("listing_fetch", career_url) as sample:
+                job_links, listing_html, error = await fetch_listing(career_url)
+                sample["bytes"] = len(listing_html or "")
+            if error:
+                log(f"⚠️ Failed to crawl company {company} — {error}")
+                write_error_row(company, career_url, error)
+                write_zero_links_row(company, career_url)
+                store.set_company_status(company, career_url, "failed", error)
+                return None
+
+            if job_links is None:
+                if not listing_html:
+                    log(f"⚠️ Empty career page HTML for company {company}", "DEBUG")
+                    write_zero_links_row(company, career_url)
+                    store.set_company_status(company, career_url, "done")
+                    return None
+
+                # --- Step 1: Extract job links
+                job_links = await run_cpu(
+                    extract_job_links,
+                    listing_html,
+                    career_url,
+                    stage="extract_links",
+                    url=career_url,
+                )
+
+        return job_links
+
+    async def schedule_company(company_index, company, career_url):
+        async with company_semaphore:
+            try:
+                await process_company(company_index, company, career_url)
+            except Exception as e:
+                # 🔑 One broken company must not take down the others
+                error_msg = str(e).split("\n")[0]
+                log(f"⚠️ Unexpected error for company {company} — {error_msg}")
+                write_error_row(company, career_url, error_msg)
+                write_zero_links_row(company, career_url)
+                store.set_company_status(company, career_url, "failed", error_msg)
+
+    # 🔑 Replay feeds every fetch from a recorded crawl: no cache, no network
+    if replay_dir:
+        open_crawl_archive(replay_dir, "replay")
+        cache_mode = "off"
+    elif record_dir:
+        open_crawl_archive(record_dir, "record")
+
+    open_html_cache(
+        config["cache_dir"],
+        mode=cache_mode,
+        ttl_seconds={
+            kind: hours * 60 * 60 for kind, hours in config["cache_ttl_hours"].items()
+        },
+        max_bytes=config["cache_max_mb"] * 1024 * 1024,
+    )
+
+    set_parser_backend(config["html_parser"], config["html_parser_strainer"])
+
+    set_resource_policy(
+        blocked_resource_types=config["blocked_resource_types"],
+        blocked_domains=config["blocked_domains"],
+    )
+
+    set_retry_policy(
+        max_attempts=config["retry_max_attempts"],
+        backoff_base=config["retry_backoff_seconds"]["base"],
+        backoff_max=config["retry_backoff_seconds"]["max"],
+        failure_threshold=config["circuit_breaker"]["failure_threshold"],
+        cooldown_seconds=config["circuit_breaker"]["cooldown_seconds"],
+    )
+
+    # 🔑 Per-host politeness + global limits on HTTP requests and browser pages
+    start_host_scheduler(
+        global_limits={
+            "http": config["http_max_connections"],
+            "browser": config["browser_pool_size"],
+        },
+        host_initial=config["host_concurrency"]["initial"],
+        host_min=config["host_concurrency"]["min"],
+        host_max=config["host_concurrency"]["max"],
+        host_max_rps=config["host_max_requests_per_second"],
+        target_latency=config["host_target_latency_seconds"],
+    )
+
+    set_readiness_policy(
+        quiet_ms=config["page_ready_quiet_ms"],
+        max_ms=config["page_ready_max_ms"],
+    )
 
+    set_http_fast_path(config["http_fast_path"])
+    set_browser_extraction(config["browser_extraction"])
+
+    try:
+        if not replay_dir:
+            # 🔑 One Chromium for the whole run, shared by all fetchers
+            try:
+                await start_browser_pool(
+                    size=config["browser_pool_size"],
+                    max_navigations=config["browser_pool_max_navigations"],
+                )
+            except Exception as e:
+                # Pages then launch their own browser; failures are recorded per URL
+                error_msg = str(e).split("\n")[0]
+                log(f"⚠️ Browser pool failed to start — {error_msg}")
+
+            # 🔑 Pooled HTTP client for the detail fast path and the ATS adapters
+            await start_http_client(
+                max_connections=config["http_max_connections"],
+                timeout=config["http_timeout_seconds"],
+            )
+
+        # 🔑 Parsing and matching run in worker processes, off the event loop
+        start_cpu_pool(config, workers=config["cpu_workers"])
+
+        company_tasks = []
         with open(input_file, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
 
@@ -94,190 +526,39 @@ async def run_pipeline(input_file: str, output_file: str):
                 company = row["company"].strip()
                 career_url = row["career_url"].strip()
 
-                log("\n\n\n")
-                log(f"🏢 [{company_index}] Company: {company}")
-                log(f"🔗 Career URL: {career_url}")
-
                 if is_company_blocked(company, config["blocked_companies"]):
                     log(f"⚠️ Skipping blocked company: {company}")
                     continue
 
-                listing_html, error = await fetch_html(career_url)
-                if error:
-                    failed_companies.append({"company": company, "error": error})
-                    log(f"⚠️ Failed to crawl company — {error}")
-                    error_writer.writerow(
-                        {
-                            ErrorCSVField.COMPANY.value: company,
-                            ErrorCSVField.ERROR.value: error,
-                            ErrorCSVField.CAREER_URL.value: career_url,
-                        }
-                    )
-                    error_csv.flush()
-
-                    companies_with_zero_links.append(
-                        {"company": company, "career_url": career_url}
-                    )
-                    zero_links_csv_writer.writerow(
-                        {
-                            CompanyWithZeroLinksCSVField.S_NO.value: len(
-                                companies_with_zero_links
-                            ),
-                            CompanyWithZeroLinksCSVField.COMPANY.value: company,
-                            CompanyWithZeroLinksCSVField.CAREER_URL.value: career_url,
-                        }
-                    )
-                    zero_links_csv.flush()
+                if company in finished_companies:
+                    log(f"⏭️ Skipping {company} — finished before the resume", "DEBUG")
                     continue
 
-                if not listing_html:
-                    log("⚠️ Empty career page HTML", "DEBUG")
-                    companies_with_zero_links.append(
-                        {"company": company, "career_url": career_url}
-                    )
-                    zero_links_csv_writer.writerow(
-                        {
-                            CompanyWithZeroLinksCSVField.S_NO.value: len(
-                                companies_with_zero_links
-                            ),
-                            CompanyWithZeroLinksCSVField.COMPANY.value: company,
-                            CompanyWithZeroLinksCSVField.CAREER_URL.value: career_url,
-                        }
-                    )
-                    zero_links_csv.flush()
-                    continue
+                company_tasks.append(
+                    schedule_company(company_index, company, career_url)
+                )
+
+        log(
+            f"⚙️ Crawling {len(company_tasks)} companies "
+            f"({config['company_concurrency']} at a time)"
+        )
+        await asyncio.gather(*company_tasks)
+    finally:
+        await stop_browser_pool()
+        await stop_http_client()
+        stop_host_scheduler()
+        stop_cpu_pool()
+        close_html_cache()
+        close_crawl_archive()
+
+        # 🔑 EXPORT SORTED CSV BEFORE EXIT (also after a crash)
+        log("\n\n")
+        with timed("csv_export"):
+            store.export_csv(output_file)
+        store.close()
+        error_csv.close()
+        zero_links_csv.close()
 
-                # --- Step 1: Extract job links
-                job_links = extract_job_links(listing_html, career_url)
-
-                log(f"⚙️ Processing {len(job_links)} job links in parallel", "DEBUG")
-
-                async def process_job(idx, jl):
-                    async with JOB_SEMAPHORE:
-                        job_title = jl.get("title")
-                        job_url = jl.get("link")
-
-                        log(f"\n➡️ Job [{idx}] Title: {job_title}", "DEBUG")
-                        log(f"🔗 Job URL: {job_url}", "DEBUG")
-
-                        # --- Run job detail URL matcher
-                        if not match_job_detail_url(job_url, config):
-                            log("⏭️ Skipped — not a probable job detail URL", "DEBUG")
-                            return None
-
-                        # --- dedupe by job link
-                        if job_url in existing_job_links:
-                            log("⏭️ Skipped — job already exists in CSV", "DEBUG")
-                            return "JOB_ALREADY_EXISTS"
-
-                        # --- Run title matcher
-                        if not match_title(job_title, config):
-                            log("⏭️ Skipped — title matching failed", "DEBUG")
-                            return None
-
-                        # --- Step 2: Extract job description and job locations
-                        details = await extract_job_details_and_locations(
-                            job_url, config
-                        )
-                        description = details.get("description", "")
-                        extracted_locations = details.get("extracted_locations", [])
-                        all_extracted_locations = details.get(
-                            "all_extracted_locations", []
-                        )
-
-                        # --- Run description matcher
-                        is_desc_match, matched_keywords, extracted_keywords = (
-                            match_description(description, config)
-                        )
-                        if not is_desc_match:
-                            log("⏭️ Skipped — description matching failed", "DEBUG")
-                            return None
-
-                        # --- Run location matcher
-                        is_loc_match, _ = match_locations(details, config)
-                        if not is_loc_match:
-                            log("⏭️ Skipped — location matching failed", "DEBUG")
-                            return None
-
-                        # --- Step 3: Extract YOE
-                        yoe = extract_yoe_from_description(description)
-
-                        job_data = {
-                            "title": job_title,
-                            "description": description,
-                            "yoe": yoe,
-                            "matched_keywords": matched_keywords,
-                            "extracted_keywords": extracted_keywords,
-                        }
-
-                        score = calculate_score(job_data, config)
-                        log(f"📈 Match score: {score}%", "DEBUG")
-
-                        if score == 0:
-                            log("⏭️ Skipped — score is 0", "DEBUG")
-                            return None
-
-                        return {
-                            JobCSVField.COMPANY.value: clean_string_value(company),
-                            JobCSVField.JOB_TITLE.value: clean_string_value(job_title),
-                            JobCSVField.JOB_LINK.value: clean_string_value(job_url),
-                            JobCSVField.YOE.value: yoe if yoe is not None else "",
-                            JobCSVField.MATCH_PERCENTAGE.value: score,
-                            JobCSVField.EXTRACTED_KEYWORDS.value: clean_string_value(
-                                ", ".join(extracted_keywords)
-                            ),
-                            JobCSVField.EXTRACTED_LOCATIONS.value: clean_string_value(
-                                ", ".join(
-                                    extracted_locations
-                                    if len(extracted_locations) > 0
-                                    else all_extracted_locations
-                                )
-                            ),
-                        }
-
-                tasks = [
-                    process_job(idx, jl) for idx, jl in enumerate(job_links, start=1)
-                ]
-
-                results = await asyncio.gather(*tasks)
-
-                for result in results:
-                    if result == "JOB_ALREADY_EXISTS":
-                        continue
-
-                    if not result:
-                        continue
-
-                    result[JobCSVField.S_NO.value] = serial_no
-                    writer.writerow(result)
-                    csvfile.flush()
-
-                    existing_job_links.add(result[JobCSVField.JOB_LINK.value])
-                    log("✅ Job written to CSV")
-                    serial_no += 1
-
-                companies_from_file = load_companies_from_output_file(output_file)
-                if company not in companies_from_file:
-                    companies_with_zero_links.append(
-                        {"company": company, "career_url": career_url}
-                    )
-                    zero_links_csv_writer.writerow(
-                        {
-                            CompanyWithZeroLinksCSVField.S_NO.value: len(
-                                companies_with_zero_links
-                            ),
-                            CompanyWithZeroLinksCSVField.COMPANY.value: company,
-                            CompanyWithZeroLinksCSVField.CAREER_URL.value: career_url,
-                        }
-                    )
-                    zero_links_csv.flush()
-                    log(f"⚠️ Zero job links found for company {company}")
-
-                log(f"✅ Company {company} completed")
-
-    # 🔑 FINAL SORT BEFORE EXIT
-    log("\n\n")
-    sort_csv_in_place(output_file)
 
     # Write company-level errors
     log("\n\n")
@@ -287,7 +568,6 @@ async def run_pipeline(input_file: str, output_file: str):
             log(f"{idx}. {entry['company']} — {entry['error']}")
     else:
         log("✅ No company-level crawl errors")
-    error_csv.close()
     log(f"📄 Company-level errors written to {error_file}")
 
     # Write companies with zero links
@@ -298,9 +578,18 @@ async def run_pipeline(input_file: str, output_file: str):
             log(f"{idx}. {entry['company']} — {entry['career_url']}")
     else:
         log("✅ No company with zero job links")
-    zero_links_csv.close()
     log(f"📄 Companies with zero job links written to {companies_with_zero_links_file}")
 
+    log("\n\n")
+    log_resource_summary()
+    log_readiness_summary()
+    log_retry_summary()
+    detail_flight.log_summary()
+
+    log("\n\n")
+    log_metrics_summary()
+    write_metrics_report(config["metrics_report"], config["metrics_prometheus"])
+
     log("\n\n")
     log("🎉 Job Hunter finished")
 
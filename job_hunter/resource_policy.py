@@ -0,0 +1,187 @@
+import re
+
+from job_hunter.utils.log import log
+
+# File extensions per Playwright resource type, used to route only the
+# requests we want to abort instead of sending every request to Python
+RESOURCE_EXTENSIONS = {
+    "image": ["png", "jpe?g", "gif", "webp", "avif", "svg", "ico", "bmp"],
+    "font": ["woff2?", "ttf", "otf", "eot"],
+    "media": ["mp4", "webm", "ogg", "mp3", "wav", "m4a", "mov"],
+    "stylesheet": ["css"],
+}
+
+# Rough average transfer sizes, only used to estimate bytes saved (a blocked
+# request never goes out, so its real size is unknown)
+ESTIMATED_BYTES = {
+    "image": 40_000,
+    "font": 30_000,
+    "media": 500_000,
+    "stylesheet": 25_000,
+    "tracker": 20_000,
+}
+
+DEFAULT_BLOCKED_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "segment.com",
+    "mixpanel.com",
+    "amplitude.com",
+    "fullstory.com",
+    "clarity.ms",
+    "linkedin.com/px",
+    "snap.licdn.com",
+    "ads-twitter.com",
+    "optimizely.com",
+    "newrelic.com",
+    "nr-data.net",
+    "intercom.io",
+    "onetrust.com",
+    "cookielaw.org",
+]
+
+# Listing renders keep these: the "Show more" finder relies on the computed
+# `cursor: pointer` of CSS-styled buttons
+LISTING_KEPT_TYPES = ("stylesheet",)
+
+DEFAULT_POLICY = {
+    "blocked_resource_types": ["image", "font", "media", "stylesheet"],
+    "blocked_domains": DEFAULT_BLOCKED_DOMAINS,
+}
+
+_policy = dict(DEFAULT_POLICY)
+_url_patterns = {}  # blocked resource types -> pattern (None when nothing to block)
+_domain_pattern = None
+
+# 🔑 Run-wide totals for the end-of-run summary
+TOTAL_STATS = {"pages": 0, "blocked": {}, "estimated_bytes_saved": 0}
+
+
+def set_resource_policy(blocked_resource_types=None, blocked_domains=None):
+    global _domain_pattern
+    if blocked_resource_types is not None:
+        _policy["blocked_resource_types"] = list(blocked_resource_types)
+    if blocked_domains is not None:
+        _policy["blocked_domains"] = list(blocked_domains)
+    _url_patterns.clear()
+    _domain_pattern = None
+
+
+def _patterns(blocked_types: tuple):
+    global _domain_pattern
+    if blocked_types not in _url_patterns:
+        extensions = [
+            ext
+            for resource_type in blocked_types
+            for ext in RESOURCE_EXTENSIONS.get(resource_type, [])
+        ]
+        _url_patterns[blocked_types] = (
+            re.compile(rf"^[^?#]*\.({'|'.join(extensions)})([?#].*)?$", re.IGNORECASE)
+            if extensions
+            else None
+        )
+    if _domain_pattern is None and _policy["blocked_domains"]:
+        domains = "|".join(re.escape(d) for d in _policy["blocked_domains"])
+        _domain_pattern = re.compile(
+            rf"^[a-z]+://([^/?#]*\.)?({domains})([/?#:].*)?$", re.IGNORECASE
+        )
+    return _url_patterns[blocked_types], _domain_pattern
+
+
+def _resource_type_for(url: str) -> str:
+    path = url.split("?", 1)[0].split("#", 1)[0].lower()
+    for resource_type, extensions in RESOURCE_EXTENSIONS.items():
+        if re.search(rf"\.({'|'.join(extensions)})$", path):
+            return resource_type
+    return "other"
+
+
+class PageResourceStats:
+    """What one page load had blocked, and an estimate of the bytes it saved."""
+
+    def __init__(self):
+        self.blocked = {}
+
+    def add(self, kind: str):
+        self.blocked[kind] = self.blocked.get(kind, 0) + 1
+
+    @property
+    def total_blocked(self) -> int:
+        return sum(self.blocked.values())
+
+    @property
+    def estimated_bytes_saved(self) -> int:
+        return sum(
+            ESTIMATED_BYTES.get(kind, 0) * count for kind, count in self.blocked.items()
+        )
+
+    def log(self, url: str):
+        TOTAL_STATS["pages"] += 1
+        TOTAL_STATS["estimated_bytes_saved"] += self.estimated_bytes_saved
+        for kind, count in self.blocked.items():
+            TOTAL_STATS["blocked"][kind] = TOTAL_STATS["blocked"].get(kind, 0) + count
+
+        if not self.blocked:
+            return
+        breakdown = ", ".join(f"{k}={v}" for k, v in sorted(self.blocked.items()))
+        log(
+            f"🚫 Blocked {self.total_blocked} requests ({breakdown}), "
+            f"~{self.estimated_bytes_saved // 1024} KB saved (estimated) — {url}",
+            "DEBUG",
+        )
+
+
+async def apply_resource_policy(page, keep_types=()) -> PageResourceStats:
+    """
+    Aborts heavy resources and trackers on `page`, except the resource types
+    in `keep_types`. Only URLs matching the policy are routed, so every other
+    request never reaches Python.
+    """
+    stats = PageResourceStats()
+    blocked_types = tuple(
+        t for t in _policy["blocked_resource_types"] if t not in keep_types
+    )
+    url_pattern, domain_pattern = _patterns(blocked_types)
+
+    if domain_pattern is not None:
+
+        async def abort_tracker(route):
+            stats.add("tracker")
+            await route.abort()
+
+        await page.route(domain_pattern, abort_tracker)
+
+    if url_pattern is not None:
+
+        async def abort_resource(route):
+            # Extension is only a hint; trust the browser's type when it's one we block
+            resource_type = route.request.resource_type
+            if resource_type not in blocked_types:
+                resource_type = _resource_type_for(route.request.url)
+            if resource_type not in blocked_types:
+                await route.fallback()
+                return
+            stats.add(resource_type)
+            await route.abort()
+
+        await page.route(url_pattern, abort_resource)
+
+    return stats
+
+
+def log_resource_summary():
+    if not TOTAL_STATS["pages"]:
+        return
+    blocked = TOTAL_STATS["blocked"]
+    breakdown = ", ".join(f"{k}={v}" for k, v in sorted(blocked.items())) or "none"
+    log(
+        f"🚫 Resource policy: blocked {sum(blocked.values())} requests over "
+        f"{TOTAL_STATS['pages']} pages ({breakdown}), "
+        f"~{TOTAL_STATS['estimated_bytes_saved'] // (1024 * 1024)} MB saved "
+        f"(estimated from average sizes per type)"
+    )
@@ -0,0 +1,286 @@
+import asyncio
+import random
+import re
+import time
+from urllib.parse import urlparse
+
+from job_hunter.utils.log import log
+
+# Error classes worth another attempt (anything else is returned right away)
+RETRYABLE_ERRORS = {"timeout", "dns", "connection", "aborted", "server", "throttled"}
+
+_ERROR_PATTERNS = [
+    ("throttled", re.compile(r"\bHTTP 429\b")),
+    ("server", re.compile(r"\bHTTP 5\d\d\b")),
+    ("client", re.compile(r"\bHTTP 4\d\d\b")),
+    ("timeout", re.compile(r"timeout|timed out", re.IGNORECASE)),
+    (
+        "dns",
+        re.compile(
+            r"ERR_NAME_NOT_RESOLVED|name or service not known|nodename nor servname"
+            r"|getaddrinfo|temporary failure in name resolution|no address associated",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "aborted",
+        re.compile(
+            r"ERR_ABORTED|NS_BINDING_ABORTED|navigation.*interrupted|frame was detached",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "connection",
+        re.compile(
+            r"ERR_CONNECTION|ERR_EMPTY_RESPONSE|connection (refused|reset)"
+            r"|all connection attempts failed|server disconnected|ConnectError"
+            r"|RemoteProtocolError",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+# How often a request held back by an open circuit checks on the probe
+CIRCUIT_POLL_SECONDS = 1.0
+
+DEFAULT_POLICY = {
+    "max_attempts": 3,
+    "backoff_base": 1.0,
+    "backoff_max": 20.0,
+    "failure_threshold": 5,
+    "cooldown_seconds": 60.0,
+}
+
+_policy = dict(DEFAULT_POLICY)
+
+# 🔑 Run-wide totals for the end-of-run summary
+RETRY_STATS = {
+    "retries": 0,
+    "recovered": 0,
+    "gave_up": 0,
+    "errors": {},
+    "circuits_opened": 0,
+    "held_back": 0,
+    "short_circuited": 0,
+}
+
+
+def set_retry_policy(
+    max_attempts=None,
+    backoff_base=None,
+    backoff_max=None,
+    failure_threshold=None,
+    cooldown_seconds=None,
+):
+    for key, value in {
+        "max_attempts": max_attempts,
+        "backoff_base": backoff_base,
+        "backoff_max": backoff_max,
+        "failure_threshold": failure_threshold,
+        "cooldown_seconds": cooldown_seconds,
+    }.items():
+        if value is not None:
+            _policy[key] = value
+    _breakers.clear()
+
+
+def classify_error(error: str | None) -> str:
+    """timeout / dns / connection / aborted / server / throttled / client / other"""
+    if not error:
+        return "other"
+    for kind, pattern in _ERROR_PATTERNS:
+        if pattern.search(error):
+            return kind
+    return "other"
+
+
+class CircuitBreaker:
+    """
+    Stops sending work to a host after `failure_threshold` consecutive
+    failed requests (a request that used up its retries counts once).
+    After `cooldown_seconds` one probe request is let through: success
+    closes the circuit, failure opens it again. Held-back requests wait
+    for the probe instead of failing.
+    """
+
+    def __init__(self, host: str, failure_threshold: int, cooldown_seconds: float):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.openings = 0
+        self._retry_at = 0.0
+
+    def is_open(self) -> bool:
+        """True while requests are being held back (no side effects)."""
+        return self.state != "closed" and time.monotonic() < self._retry_at
+
+    def retry_in(self) -> float:
+        """Seconds until the cool-down (or the running probe's deadline) is over."""
+        if self.state == "closed":
+            return 0.0
+        return max(0.0, self._retry_at - time.monotonic())
+
+    async def wait_until_allowed(self) -> bool:
+        """
+        Holds a request back while the circuit is open, until it may go out
+        (circuit closed, or this request is the probe). False when the
+        circuit opened again meanwhile: the host still fails after its
+        cool-down.
+        """
+        openings = self.openings
+        while not self.allow():
+            if self.openings != openings:
+                return False
+            await asyncio.sleep(max(0.05, min(self.retry_in(), CIRCUIT_POLL_SECONDS)))
+        return True
+
+    def allow(self) -> bool:
+        if self.state == "closed":
+            return True
+
+        # Open (or a probe that never reported back): let one request through
+        now = time.monotonic()
+        if now < self._retry_at:
+            return False
+        self.state = "half_open"
+        self._retry_at = now + self.cooldown_seconds
+        return True
+
+    def record_success(self):
+        if self.state != "closed":
+            log(f"🟢 Circuit closed for {self.host}")
+        self.state = "closed"
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == "half_open" or (
+            self.state == "closed" and self.failures >= self.failure_threshold
+        ):
+            if self.state == "closed":
+                RETRY_STATS["circuits_opened"] += 1
+            self.state = "open"
+            self.openings += 1
+            self._retry_at = time.monotonic() + self.cooldown_seconds
+            log(
+                f"🔴 Circuit open for {self.host} after {self.failures} failures, "
+                f"pausing for {self.cooldown_seconds:.0f}s"
+            )
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def _breaker(url: str) -> CircuitBreaker:
+    host = urlparse(url).netloc.lower()
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = _breakers[host] = CircuitBreaker(
+            host, _policy["failure_threshold"], _policy["cooldown_seconds"]
+        )
+    return breaker
+
+
+def circuit_open_error(host: str) -> str:
+    return f"Circuit open for {host}"
+
+
+def is_circuit_open_error(error: str | None) -> bool:
+    return bool(error) and error.startswith("Circuit open for ")
+
+
+async def wait_for_circuit(url: str):
+    """
+    Sleeps through the cool-down of `url`'s host, if its circuit is open.
+    Takes no probe slot: call it before queuing for other limits, so held
+    back work doesn't hold them.
+    """
+    delay = _breaker(url).retry_in()
+    if delay:
+        RETRY_STATS["held_back"] += 1
+        log(f"⏸️ Waiting {delay:.0f}s for the circuit of {url}", "DEBUG")
+        await asyncio.sleep(delay)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter: half fixed, half random."""
+    ceiling = min(_policy["backoff_max"], _policy["backoff_base"] * 2 ** (attempt - 1))
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+
+async def fetch_with_retries(fetch, url: str, *args, **kwargs):
+    """
+    Calls `fetch(url, ...)`, a fetcher returning `(result, error)`, and
+    retries transient errors with jittered exponential backoff. While the
+    host's breaker is open the request waits for its probe, and fails with
+    a "Circuit open" error only if the probe fails too.
+
+    NEVER throws (as long as `fetch` doesn't).
+    """
+    breaker = _breaker(url)
+    max_attempts = max(1, _policy["max_attempts"])
+
+    for attempt in range(1, max_attempts + 1):
+        if breaker.is_open():
+            RETRY_STATS["held_back"] += 1
+        if not await breaker.wait_until_allowed():
+            RETRY_STATS["short_circuited"] += 1
+            if attempt > 1:
+                # The circuit opened while we were backing off: report the real error
+                RETRY_STATS["gave_up"] += 1
+                return result
+            return None, circuit_open_error(breaker.host)
+
+        result = await fetch(url, *args, **kwargs)
+        error = result[1]
+        if not error:
+            breaker.record_success()
+            if attempt > 1:
+                RETRY_STATS["recovered"] += 1
+            return result
+
+        kind = classify_error(error)
+        RETRY_STATS["errors"][kind] = RETRY_STATS["errors"].get(kind, 0) + 1
+
+        if kind not in RETRYABLE_ERRORS:
+            # The host answered (e.g. 404): it is up, the page just isn't usable
+            if kind == "client":
+                breaker.record_success()
+            return result
+
+        # One failure per request, once its retries are used up; a failed
+        # probe reopens the circuit right away
+        if attempt == max_attempts or breaker.state == "half_open":
+            breaker.record_failure()
+        if attempt == max_attempts:
+            RETRY_STATS["gave_up"] += 1
+            return result
+
+        delay = backoff_delay(attempt)
+        RETRY_STATS["retries"] += 1
+        log(
+            f"🔁 Retrying {url} in {delay:.1f}s ({kind}: {error}), "
+            f"attempt {attempt + 1}/{max_attempts}",
+            "DEBUG",
+        )
+        await asyncio.sleep(delay)
+
+    return result
+
+
+def log_retry_summary():
+    errors = ", ".join(
+        f"{kind}={count}" for kind, count in sorted(RETRY_STATS["errors"].items())
+    )
+    log(
+        f"🔁 Retries: {RETRY_STATS['retries']} retried, "
+        f"{RETRY_STATS['recovered']} recovered, {RETRY_STATS['gave_up']} gave up"
+        f"{f' (errors: {errors})' if errors else ''}"
+    )
+    log(
+        f"🔴 Circuit breaker: {RETRY_STATS['circuits_opened']} opened, "
+        f"{RETRY_STATS['held_back']} waits for a cool-down, "
+        f"{RETRY_STATS['short_circuited']} failed after the cool-down"
+    )
@@ -0,0 +1,84 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable
+
+from job_hunter.utils.log import log
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one.
+
+    While a call for a key is running, later callers await its result
+    instead of starting their own. Completed results are kept for
+    `ttl_seconds` in a small LRU (`max_entries`), so callers that come a
+    little later in the run get them too. Results `keep` rejects (failures)
+    are shared with the callers already waiting but not kept; exceptions
+    propagate to all of them.
+    """
+
+    def __init__(self, name: str, max_entries: int = 512, ttl_seconds: float = 600):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self.calls = 0
+        self.coalesced = 0
+        self.reused = 0
+
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self._recent: OrderedDict = OrderedDict()  # key -> (expires_at, result)
+
+    async def run(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable],
+        keep: Callable[[object], bool] = lambda result: result is not None,
+    ):
+        recent = self._recent.get(key)
+        if recent:
+            expires_at, result = recent
+            if expires_at > time.monotonic():
+                self._recent.move_to_end(key)
+                self.reused += 1
+                return result
+            del self._recent[key]
+
+        future = self._inflight.get(key)
+        if future:
+            self.coalesced += 1
+            # shield: a cancelled waiter must not cancel the shared call
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # retrieved: nobody may be waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+        if keep(result):
+            self._remember(key, result)
+        return result
+
+    def _remember(self, key: Hashable, result):
+        self._recent[key] = (time.monotonic() + self.ttl_seconds, result)
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.max_entries:
+            self._recent.popitem(last=False)
+
+    def log_summary(self):
+        log(
+            f"🤝 {self.name}: {self.calls} done, {self.coalesced} shared with "
+            f"an in-flight one, {self.reused} reused from recent results"
+        )
@@ -1,5 +1,10 @@
 from datetime import datetime
+import atexit
+import json
 import os
+import queue
+import threading
+import time
 
 LOG_LEVELS = {
     "DEBUG": 10,
@@ -11,9 +16,14 @@ LOG_LEVELS = {
 CURRENT_LOG_LEVEL = LOG_LEVELS["INFO"]  # default
 # CURRENT_LOG_LEVEL = LOG_LEVELS["DEBUG"]  # debug
 
-# 🔑 Ensure logs directory exists
+# Messages below this level are not written to the log file either
+FILE_LOG_LEVEL = LOG_LEVELS["DEBUG"]
+
+# "text" ([LEVEL] message) or "json" (one JSON object per line)
+FILE_LOG_FORMAT = "text"
+
+# 🔑 Logs directory (created by the writer on first write)
 LOG_DIR = "logs"
-os.makedirs(LOG_DIR, exist_ok=True)
 
 # 🔑 Daily log file
 LOG_FILE_PATH = os.path.join(
@@ -21,22 +31,150 @@ LOG_FILE_PATH = os.path.join(
     f"log_{datetime.now().strftime('%Y_%m_%d')}.log",
 )
 
+# Background writer: log() only enqueues lines, a thread appends them to the
+# log file in batches
+FLUSH_INTERVAL_SECONDS = 0.5
+_STOP = object()
+
+_queue = queue.SimpleQueue()
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
 def set_log_level(level: str):
     global CURRENT_LOG_LEVEL
     CURRENT_LOG_LEVEL = LOG_LEVELS.get(level.upper(), LOG_LEVELS["INFO"])
 
 
-def log(msg: str, level: str = "INFO"):
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    # formatted = f"[{timestamp}] [{level}] {msg}"
+def set_file_log_level(level: str):
+    global FILE_LOG_LEVEL
+    FILE_LOG_LEVEL = LOG_LEVELS.get(level.upper(), LOG_LEVELS["DEBUG"])
+
+
+def set_log_format(file_format: str):
+    global FILE_LOG_FORMAT
+    FILE_LOG_FORMAT = "json" if file_format == "json" else "text"
+
+
+def _level_name(value: int) -> str:
+    return next(name for name, v in LOG_LEVELS.items() if v == value)
+
+
+def get_log_settings() -> dict:
+    """Current settings, to re-apply in worker processes via configure_log."""
+    return {
+        "level": _level_name(CURRENT_LOG_LEVEL),
+        "file_level": _level_name(FILE_LOG_LEVEL),
+        "file_format": FILE_LOG_FORMAT,
+    }
+
+
+def configure_log(level: str, file_level: str, file_format: str):
+    set_log_level(level)
+    set_file_log_level(file_level)
+    set_log_format(file_format)
+
+
+def is_enabled(level: str) -> bool:
+    """Whether a message at `level` would go anywhere (console or file)."""
+    return LOG_LEVELS[level] >= min(CURRENT_LOG_LEVEL, FILE_LOG_LEVEL)
+
+
+def log(msg: str, level: str = "INFO", *args):
+    """
+    Logs `msg` to the console (at CURRENT_LOG_LEVEL and above) and to the
+    daily log file (at FILE_LOG_LEVEL and above).
+
+    Extra `args` are %-formatted into `msg` only when the message is actually
+    logged, so call sites can skip building expensive DEBUG strings:
+      log("🔑 Keywords matched (%d): %s", "DEBUG", len(keywords), keywords)
+    """
+    severity = LOG_LEVELS[level]
+    to_console = severity >= CURRENT_LOG_LEVEL
+    to_file = severity >= FILE_LOG_LEVEL
+    if not (to_console or to_file):
+        return
+
+    if args:
+        msg = msg % args
     formatted = f"[{level}] {msg}"
 
     # File
+    if to_file:
+        if FILE_LOG_FORMAT == "json":
+            record = {
+                "time": datetime.now().isoformat(timespec="milliseconds"),
+                "level": level,
+                "msg": msg,
+            }
+            line = json.dumps(record, ensure_ascii=False)
+        else:
+            line = formatted
+        _enqueue(line)
+
+    # Console
+    if to_console:
+        print(formatted)
+
+
+def _enqueue(line: str):
+    if _writer is None:
+        _start_writer()
+    _queue.put(line)
+
+
+def _start_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            return
+        _writer = threading.Thread(
+            target=_write_lines, args=(_queue,), name="log-writer", daemon=True
+        )
+        _writer.start()
+
+
+def _write_lines(lines: queue.SimpleQueue):
+    os.makedirs(LOG_DIR, exist_ok=True)
     with open(LOG_FILE_PATH, "a", encoding="utf-8") as f:
-        f.write(formatted + "\n")
+        while True:
+            # Collect what arrives within the flush interval into one write
+            batch = [lines.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL_SECONDS
+            while batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(lines.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            stop = _STOP in batch
+            f.write("".join(line + "\n" for line in batch if line is not _STOP))
+            f.flush()
+            if stop:
+                return
+
 
-    if LOG_LEVELS[level] < CURRENT_LOG_LEVEL:
+def flush_log():
+    """Writes out everything logged so far and stops the writer thread."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is None:
         return
+    _queue.put(_STOP)
+    writer.join()
 
-    # Console
-    print(formatted)
+
+def _reset_after_fork():
+    # The writer thread does not survive fork(); the child starts its own
+    global _queue, _writer, _writer_lock
+    _queue = queue.SimpleQueue()
+    _writer = None
+    _writer_lock = threading.Lock()
+
+
+atexit.register(flush_log)
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,5 +1,6 @@
 import re
 from typing import Tuple, List
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 def clean_string_value(value):
     if not isinstance(value, str):
@@ -21,3 +22,47 @@ def match_words(text, words):
         return []
     text = text.lower()
     return [word for word in words if contains_whole_word(text, word)]
+
+# Query params that only track where a click came from
+TRACKING_PARAMS = {
+    "gclid",
+    "fbclid",
+    "msclkid",
+    "mc_cid",
+    "mc_eid",
+    "_hsenc",
+    "_hsmi",
+    "gh_src",
+    "lever-origin",
+    "lever-source",
+    "lever-source[]",
+}
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for dedupe / cache keys: lowercased scheme and
+    host, no default port, no tracking params, sorted query and no plain
+    #anchors (hash routes like #/jobs/1 are kept, SPAs route on them).
+    """
+    if not url:
+        return url
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme == "https" and netloc.endswith(":443")) or (
+        scheme == "http" and netloc.endswith(":80")
+    ):
+        netloc = netloc.rsplit(":", 1)[0]
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+
+    fragment = parts.fragment if parts.fragment.startswith(("/", "!")) else ""
+
+    return urlunsplit(
+        (scheme, netloc, parts.path or "/", urlencode(query), fragment)
+    )
@@ -3,6 +3,7 @@ setup(
     name="job-hunter",
     version="0.1.0",
     packages=find_packages(),
-    install_requires=["playwright","beautifulsoup4","pydantic","reportlab"],
+    package_data={"job_hunter": ["data/*.json"]},
+    install_requires=["playwright","beautifulsoup4","pydantic","reportlab","httpx","lxml"],
     entry_points={"console_scripts": ["job-hunter=job_hunter.cli:main"]}
 )
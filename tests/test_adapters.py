@@ -0,0 +1,216 @@
+"""
+ATS adapters against recorded API responses (tests/fixtures/ats) served by
+a local HTTP server, through each adapter's `api_base`.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from job_hunter.adapters.ashby import fetch_ashby_jobs
+from job_hunter.adapters.greenhouse import fetch_greenhouse_jobs
+from job_hunter.adapters.lever import fetch_lever_jobs
+from job_hunter.adapters.workday import fetch_workday_jobs
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "ats")
+
+# Request path -> recorded response
+ROUTES = {
+    "/lever/acme": "lever_postings.json",
+    "/greenhouse/acme/jobs": "greenhouse_jobs.json",
+    "/ashby/acme": "ashby_job_board.json",
+    "/workday/acme/External/jobs": "workday_jobs.json",
+    "/workday/acme/External/job/Bangalore/Senior-Backend-Engineer_R1001": "workday_job_R1001.json",
+    "/workday/acme/External/job/Pune/Staff-Data-Engineer_R1002": "workday_job_R1002.json",
+    "/workday/broken/External/jobs": "workday_unexpected.json",
+}
+
+
+@pytest.fixture(scope="module")
+def api_server():
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            requests.append((parts.path, dict(parse_qsl(parts.query))))
+            self.send_fixture(parts.path)
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            requests.append((self.path, json.loads(body)))
+            self.send_fixture(self.path)
+
+        def send_fixture(self, path):
+            fixture = ROUTES.get(path)
+            if fixture is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            with open(os.path.join(FIXTURES_DIR, fixture), "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"http://{host}:{port}", requests
+    server.shutdown()
+    server.server_close()
+
+
+def test_lever(api_server):
+    base, requests = api_server
+    jobs, error = asyncio.run(
+        fetch_lever_jobs(
+            "https://jobs.lever.co/acme?location=Bangalore%2C%20India&foo=bar",
+            api_base=f"{base}/lever",
+        )
+    )
+
+    assert error is None
+    assert requests[-1] == (
+        "/lever/acme",
+        {"mode": "json", "location": "Bangalore, India"},
+    )
+    assert [job["title"] for job in jobs] == [
+        "Senior Software Engineer, Backend",
+        "Senior Full Stack Engineer",
+    ]
+    first = jobs[0]
+    assert first["link"] == (
+        "https://jobs.lever.co/acme/5f1c2a4e-8b1d-4a5e-9a0b-2f6d9c1e7a11"
+    )
+    assert first["locations"] == ["Bangalore, India", "Remote - India"]
+    assert "Kafka pipelines on AWS" in first["description"]
+    assert "5+ years of backend experience" in first["description"]
+    assert jobs[1]["locations"] == ["Bangalore, India"]
+
+
+def test_greenhouse(api_server):
+    base, requests = api_server
+    jobs, error = asyncio.run(
+        fetch_greenhouse_jobs(
+            "https://boards.greenhouse.io/acme?departments[]=4001",
+            api_base=f"{base}/greenhouse",
+        )
+    )
+
+    assert error is None
+    assert requests[-1] == ("/greenhouse/acme/jobs", {"content": "true"})
+    # The Sales posting is filtered out by the board's department filter
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job["title"] == "Senior Software Engineer"
+    assert job["link"] == "https://boards.greenhouse.io/acme/jobs/4012345006"
+    assert job["locations"] == ["Bangalore, India"]
+    # HTML-escaped content is flattened to text
+    assert "Python, React and AWS. 6+ years of experience." in job["description"]
+    assert "<p>" not in job["description"]
+
+
+def test_ashby(api_server):
+    base, requests = api_server
+    jobs, error = asyncio.run(
+        fetch_ashby_jobs(
+            "https://jobs.ashbyhq.com/acme?employmentType=FullTime",
+            api_base=f"{base}/ashby",
+        )
+    )
+
+    assert error is None
+    assert requests[-1] == ("/ashby/acme", {"includeCompensation": "false"})
+    # Unlisted and non-FullTime postings are skipped
+    assert len(jobs) == 1
+    job = jobs[0]
+    assert job["title"] == "Senior Backend Engineer"
+    assert job["locations"] == ["Bengaluru", "Pune", "Remote"]
+    assert "Go, gRPC and Redis." in job["description"]
+
+
+def test_workday(api_server):
+    base, requests = api_server
+    jobs, error = asyncio.run(
+        fetch_workday_jobs(
+            "https://acme.wd1.myworkdayjobs.com/en-US/External?locations=f1b2",
+            api_base=f"{base}/workday",
+        )
+    )
+
+    assert error is None
+    search = next(body for path, body in requests if path == "/workday/acme/External/jobs")
+    assert search == {
+        "appliedFacets": {"locations": ["f1b2"]},
+        "limit": 20,
+        "offset": 0,
+        "searchText": "",
+    }
+    # R1003's detail call fails (404): it is dropped, the others are kept
+    assert [job["title"] for job in jobs] == [
+        "Senior Backend Engineer",
+        "Staff Data Engineer",
+    ]
+    first, second = jobs
+    assert first["link"] == (
+        "https://acme.wd1.myworkdayjobs.com/External/job/Bangalore/"
+        "Senior-Backend-Engineer_R1001"
+    )
+    assert first["locations"] == ["Bangalore, India"]
+    assert "Java and Kafka. 6+ years of experience" in first["description"]
+    # No externalUrl: the link is built from the career page
+    assert second["link"] == (
+        "https://acme.wd1.myworkdayjobs.com/en-US/External/job/Pune/Staff-Data-Engineer_R1002"
+    )
+    assert second["locations"] == ["Pune, India", "Remote - India"]
+
+
+def test_workday_title_filter(api_server):
+    base, requests = api_server
+    jobs, error = asyncio.run(
+        fetch_workday_jobs(
+            "https://acme.wd1.myworkdayjobs.com/External",
+            title_filter=lambda title: "Data" in title,
+            api_base=f"{base}/workday",
+        )
+    )
+
+    assert error is None
+    assert [job["title"] for job in jobs] == ["Staff Data Engineer"]
+    # Only the matching posting's detail is fetched
+    assert requests[-1][0] == "/workday/acme/External/job/Pune/Staff-Data-Engineer_R1002"
+
+
+def test_workday_unexpected_response(api_server):
+    base, _ = api_server
+    jobs, error = asyncio.run(
+        fetch_workday_jobs(
+            "https://broken.wd1.myworkdayjobs.com/External", api_base=f"{base}/workday"
+        )
+    )
+
+    assert jobs == []
+    assert error == "Unexpected Workday API response"
+
+
+def test_api_error(api_server):
+    base, _ = api_server
+    jobs, error = asyncio.run(
+        fetch_lever_jobs("https://jobs.lever.co/unknown", api_base=f"{base}/lever")
+    )
+
+    assert jobs == []
+    assert error == "HTTP 404"
@@ -0,0 +1,122 @@
+"""
+BrowserPool page recycling, with stand-in browser objects: pages are reused
+while healthy and replaced once a fetcher reports them broken.
+"""
+
+import asyncio
+
+import pytest
+
+from job_hunter import browser_pool
+from job_hunter.browser_pool import BrowserPool, _PageSlot, acquire_page, mark_page_broken
+
+
+class FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    async def unroute_all(self, behavior=None):
+        pass
+
+    async def set_extra_http_headers(self, headers):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.page = FakePage()
+        self.closed = False
+
+    async def new_page(self):
+        return self.page
+
+    async def close(self):
+        self.closed = True
+        self.page.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def is_connected(self):
+        return True
+
+    async def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """A one-page pool over a fake browser, installed as the run-wide pool."""
+    pool = BrowserPool(size=1, max_navigations=10)
+    pool._browser = FakeBrowser()
+
+    async def make_slots():
+        pool._slots = asyncio.Queue()
+        pool._slots.put_nowait(_PageSlot())
+
+    asyncio.run(make_slots())
+    monkeypatch.setattr(browser_pool, "_pool", pool)
+    return pool
+
+
+async def use_page(fail: bool = False):
+    async with acquire_page() as page:
+        if fail:
+            # What the crawler does when page.goto raises a Playwright error
+            mark_page_broken(page)
+        return page
+
+
+def test_healthy_page_is_reused(pool):
+    async def run():
+        return [await use_page() for _ in range(3)]
+
+    pages = asyncio.run(run())
+
+    assert pages[0] is pages[1] is pages[2]
+    assert len(pool._browser.contexts) == 1
+
+
+def test_broken_page_is_recycled(pool):
+    async def run():
+        broken = await use_page(fail=True)
+        return broken, await use_page()
+
+    broken, replacement = asyncio.run(run())
+
+    assert broken.is_closed()
+    assert replacement is not broken
+    assert not replacement.is_closed()
+    assert [context.closed for context in pool._browser.contexts] == [True, False]
+
+
+def test_exception_recycles_page(pool):
+    async def run():
+        with pytest.raises(RuntimeError):
+            async with acquire_page():
+                raise RuntimeError("page crashed")
+        return await use_page()
+
+    replacement = asyncio.run(run())
+
+    assert len(pool._browser.contexts) == 2
+    assert not replacement.is_closed()
+
+
+def test_page_recycled_after_max_navigations(pool):
+    pool.max_navigations = 2
+
+    async def run():
+        return [await use_page() for _ in range(3)]
+
+    pages = asyncio.run(run())
+
+    assert pages[0] is pages[1]
+    assert pages[2] is not pages[1]
@@ -0,0 +1,104 @@
+"""
+The per-host circuit breaker as seen by the job detail fetcher: HTTP fast
+path failures count towards it, and a host whose circuit opens again after
+its cool-down is not rendered.
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from job_hunter import crawler
+from job_hunter.retry_policy import (
+    DEFAULT_POLICY,
+    _breaker,
+    is_circuit_open_error,
+    set_retry_policy,
+)
+
+RENDERED_PAGE = (
+    "<html><body><h1>Senior Backend Engineer</h1><p>"
+    + "We are hiring engineers to build our payments platform. " * 10
+    + "</p></body></html>"
+).encode("utf-8")
+
+
+@pytest.fixture
+def host():
+    """A host that serves /ok and answers 503 everywhere else."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path == "/ok":
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(RENDERED_PAGE)))
+                self.end_headers()
+                self.wfile.write(RENDERED_PAGE)
+                return
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Replaces the browser render, recording the URLs it was asked for."""
+    rendered = []
+
+    async def fake_render(url):
+        rendered.append(url)
+        return None, "HTTP 503"
+
+    monkeypatch.setattr(crawler, "fetch_html_single_page", fake_render)
+    monkeypatch.setattr(crawler, "DETAIL_FETCH_STRATEGY", {})
+    set_retry_policy(max_attempts=1, failure_threshold=1, cooldown_seconds=0.2)
+    yield rendered
+    set_retry_policy(**DEFAULT_POLICY)
+
+
+def test_http_failure_opens_circuit(host, renders):
+    html, _, error = asyncio.run(crawler.fetch_job_detail(f"{host}/down"))
+
+    assert html is None
+    assert error == "HTTP 503"
+    assert _breaker(host).state == "open"
+    # The failed HTTP attempt still escalates to a render
+    assert renders == [f"{host}/down"]
+
+
+def test_open_circuit_skips_render(host, renders):
+    async def run():
+        # The domain serves real HTML, then starts failing: circuit opens
+        await crawler.fetch_job_detail(f"{host}/ok")
+        await crawler.fetch_job_detail(f"{host}/down/1")
+        renders.clear()
+
+        # Both wait for the cool-down; the probe fails and reopens the circuit
+        return await asyncio.gather(
+            crawler.fetch_job_detail(f"{host}/down/2"),
+            crawler.fetch_job_detail(f"{host}/down/3"),
+        )
+
+    results = asyncio.run(run())
+
+    errors = [error for _, _, error in results]
+    assert sum(is_circuit_open_error(error) for error in errors) == 1
+    assert "HTTP 503" in errors
+    # Only the probe's job was rendered
+    assert len(renders) == 1
+    probe_url = f"{host}/down/{2 + errors.index('HTTP 503')}"
+    assert renders == [probe_url]
@@ -0,0 +1,165 @@
+"""
+The job detail HTTP fast path against fixture pages served locally: real
+HTML is used as is, a JS shell escalates to a browser render, the choice is
+remembered per domain, and stale cached pages are revalidated with a
+conditional GET.
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from job_hunter import crawler
+from job_hunter.html_cache import close_html_cache, open_html_cache
+from job_hunter.http_fetcher import looks_like_js_shell
+
+RENDERED_PAGE = (
+    "<html><head><title>Senior Backend Engineer</title></head><body>"
+    "<h1>Senior Backend Engineer</h1><p>"
+    + "You will design and run the services behind our payments platform. " * 8
+    + "</p><p>Location: Bangalore, India</p></body></html>"
+)
+
+JS_SHELL_PAGE = (
+    "<html><head><title>Careers</title>"
+    '<script src="/static/bundle.js"></script></head>'
+    '<body><noscript>You need to enable JavaScript to run this app.</noscript>'
+    '<div id="root"></div></body></html>'
+)
+
+ETAG = '"v1"'
+
+
+class FixtureHost:
+    """Serves one page on every path, with an ETag, answering 304 when it matches."""
+
+    def __init__(self, page: str):
+        body = page.encode("utf-8")
+        self.requests = []
+
+        host = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                host.requests.append((self.path, self.headers.get("If-None-Match")))
+                if self.headers.get("If-None-Match") == ETAG:
+                    self.send_response(304)
+                    self.send_header("ETag", ETAG)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", ETAG)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        address, port = self.server.server_address
+        self.base_url = f"http://{address}:{port}"
+        self.domain = urlsplit(self.base_url).netloc
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def hosts():
+    rendered, shell = FixtureHost(RENDERED_PAGE), FixtureHost(JS_SHELL_PAGE)
+    yield rendered, shell
+    rendered.stop()
+    shell.stop()
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    """Replaces the browser render, recording the URLs it was asked for."""
+    rendered = []
+
+    async def fake_render(url):
+        rendered.append(url)
+        return "<html><body>rendered in the browser</body></html>", None
+
+    monkeypatch.setattr(crawler, "fetch_html_single_page", fake_render)
+    monkeypatch.setattr(crawler, "DETAIL_FETCH_STRATEGY", {})
+    monkeypatch.setattr(crawler, "HTTP_FAST_PATH_ENABLED", True)
+    return rendered
+
+
+def test_looks_like_js_shell():
+    assert not looks_like_js_shell(RENDERED_PAGE)
+    assert looks_like_js_shell(JS_SHELL_PAGE)
+    assert looks_like_js_shell("")
+
+
+def test_rendered_page_skips_the_browser(hosts, renders):
+    rendered, _ = hosts
+    html, extracted, error = asyncio.run(crawler.fetch_job_detail(f"{rendered.base_url}/jobs/1"))
+
+    assert error is None and extracted is None
+    assert html == RENDERED_PAGE
+    assert renders == []
+    assert crawler.DETAIL_FETCH_STRATEGY[rendered.domain] == "http"
+
+
+def test_js_shell_escalates_to_the_browser(hosts, renders):
+    _, shell = hosts
+    html, _, error = asyncio.run(crawler.fetch_job_detail(f"{shell.base_url}/jobs/1"))
+
+    assert error is None
+    assert html == "<html><body>rendered in the browser</body></html>"
+    assert renders == [f"{shell.base_url}/jobs/1"]
+    assert crawler.DETAIL_FETCH_STRATEGY[shell.domain] == "browser"
+
+
+def test_strategy_is_remembered_per_domain(hosts, renders):
+    rendered, shell = hosts
+
+    async def run():
+        for i in (1, 2, 3):
+            await crawler.fetch_job_detail(f"{rendered.base_url}/jobs/{i}")
+            await crawler.fetch_job_detail(f"{shell.base_url}/jobs/{i}")
+
+    asyncio.run(run())
+
+    # The shell domain is tried over HTTP once, then rendered straight away
+    assert [path for path, _ in shell.requests] == ["/jobs/1"]
+    assert renders == [f"{shell.base_url}/jobs/{i}" for i in (1, 2, 3)]
+    assert len(rendered.requests) == 3
+    assert crawler.DETAIL_FETCH_STRATEGY == {
+        rendered.domain: "http",
+        shell.domain: "browser",
+    }
+
+
+def test_stale_page_is_revalidated(hosts, renders, tmp_path):
+    rendered, _ = hosts
+    url = f"{rendered.base_url}/jobs/1"
+    # Every cached detail page is stale right away
+    cache = open_html_cache(str(tmp_path), mode="use", ttl_seconds={"detail": 0})
+    try:
+
+        async def run():
+            first = await crawler.fetch_job_detail(url)
+            second = await crawler.fetch_job_detail(url)
+            return first, second
+
+        first, second = asyncio.run(run())
+        revalidated = cache.revalidated
+    finally:
+        close_html_cache()
+
+    assert first == (RENDERED_PAGE, None, None)
+    # 304 Not Modified: the cached copy is served
+    assert second == (RENDERED_PAGE, None, None)
+    assert rendered.requests == [("/jobs/1", None), ("/jobs/1", ETAG)]
+    assert revalidated == 1
+    assert renders == []
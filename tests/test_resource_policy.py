@@ -0,0 +1,79 @@
+"""
+The resource policy's routes on a stand-in page: blocked types and trackers
+are aborted, and kept types (stylesheets on listing renders) are never routed.
+"""
+
+import asyncio
+
+from job_hunter.resource_policy import LISTING_KEPT_TYPES, apply_resource_policy
+
+REQUESTS = [
+    ("https://careers.example.com/static/site.css", "stylesheet"),
+    ("https://careers.example.com/static/logo.png", "image"),
+    ("https://careers.example.com/static/app.js", "script"),
+    ("https://www.google-analytics.com/analytics.js", "script"),
+]
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url: str, resource_type: str):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = "aborted"
+
+    async def fallback(self):
+        self.outcome = "allowed"
+
+
+class FakePage:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+async def load(keep_types=()):
+    """Outcome per request file name, plus the page's stats."""
+    page = FakePage()
+    stats = await apply_resource_policy(page, keep_types=keep_types)
+
+    outcomes = {}
+    for url, resource_type in REQUESTS:
+        outcome = "not routed"
+        for pattern, handler in page.routes:
+            if pattern.match(url):
+                route = FakeRoute(url, resource_type)
+                await handler(route)
+                outcome = route.outcome
+                break
+        outcomes[url.rsplit("/", 1)[1]] = outcome
+    return outcomes, stats
+
+
+def test_detail_render_blocks_stylesheets():
+    outcomes, stats = asyncio.run(load())
+
+    assert outcomes == {
+        "site.css": "aborted",
+        "logo.png": "aborted",
+        "app.js": "not routed",
+        "analytics.js": "aborted",
+    }
+    assert stats.blocked == {"stylesheet": 1, "image": 1, "tracker": 1}
+
+
+def test_listing_render_keeps_stylesheets():
+    outcomes, stats = asyncio.run(load(LISTING_KEPT_TYPES))
+
+    assert outcomes["site.css"] == "not routed"
+    assert outcomes["logo.png"] == "aborted"
+    assert stats.blocked == {"image": 1, "tracker": 1}
@@ -0,0 +1,113 @@
+"""
+extract_job_links' memoized bottom-up title pass against the scoring it
+replaced (every ancestor scanned with `select`), on the listing corpus and
+on random nested cards.
+"""
+
+import random
+from urllib.parse import urljoin
+
+import pytest
+
+from benchmarks.common import load_corpus
+from job_hunter.extractor import extract_job_links
+from job_hunter.html_parser import PARSER_BACKENDS, make_soup, set_parser_backend
+
+BASE_URL = "https://careers.example.com/jobs/"
+
+
+def reference_job_links(listing_html: str, base_url: str) -> list[dict]:
+    """extract_job_links as it was before the memoized pass."""
+    soup = make_soup(listing_html, "listing")
+    jobs = []
+
+    for a in soup.select("a[href]"):
+        href = a.get("href")
+        if not href:
+            continue
+
+        anchor_text_raw = a.get_text(separator=" ", strip=True)
+        if anchor_text_raw.lower() in {"apply", "apply now", "view job"}:
+            title = None
+        else:
+            title = anchor_text_raw if len(anchor_text_raw) >= 6 else None
+
+        if not title:
+            parent = a.parent
+            for _ in range(4):
+                if not parent:
+                    break
+
+                best_title = None
+                best_score = -1
+                for el in parent.select("h1, h2, h3, h4, h5, h6, p, span"):
+                    text = el.get_text(separator=" ", strip=True)
+                    if not text or len(text) < 6 or "apply" in text.lower():
+                        continue
+
+                    score = 0
+                    if el.name.startswith("h"):
+                        score += 100
+                    score += min(len(text), 60)
+                    if len(text.split()) <= 2:
+                        score -= 20
+                    if text.isupper():
+                        score -= 10
+
+                    if score > best_score:
+                        best_score = score
+                        best_title = text
+
+                if best_title:
+                    title = best_title
+                    break
+
+                parent = parent.parent
+
+        if title:
+            jobs.append({"title": title, "link": urljoin(base_url, href)})
+
+    return jobs
+
+
+TAGS = ["div", "span", "p", "h2", "h3", "li", "section", "a", "b"]
+WORDS = ["Senior", "Engineer", "Apply", "DATA", "Backend", "Remote", "Staff", "Go", "Apply now"]
+
+
+def random_fragment(rng: random.Random, depth: int) -> str:
+    if depth == 0 or rng.random() < 0.25:
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 4)))
+
+    tag = rng.choice(TAGS)
+    attrs = f' href="/jobs/{rng.randint(0, 999)}"' if tag == "a" else ""
+    inner = "".join(random_fragment(rng, depth - 1) for _ in range(rng.randint(1, 4)))
+    return f"<{tag}{attrs}>{inner}</{tag}>"
+
+
+def random_listings(count: int) -> list[str]:
+    rng = random.Random(10)
+    return [
+        "<html><body>%s</body></html>" % "".join(random_fragment(rng, 6) for _ in range(5))
+        for _ in range(count)
+    ]
+
+
+@pytest.fixture(params=PARSER_BACKENDS)
+def backend(request):
+    set_parser_backend(request.param)
+    yield request.param
+    set_parser_backend("html.parser")
+
+
+@pytest.mark.parametrize("name", sorted(load_corpus("listing")))
+def test_corpus_titles_match_reference(backend, name):
+    html = load_corpus("listing")[name]
+    jobs = extract_job_links(html, BASE_URL)
+
+    assert jobs
+    assert jobs == reference_job_links(html, BASE_URL)
+
+
+def test_random_cards_match_reference(backend):
+    for html in random_listings(60):
+        assert extract_job_links(html, BASE_URL) == reference_job_links(html, BASE_URL)